@@ -0,0 +1,34 @@
+"""
+Microbenchmark: compiled `RedactionPlan` vs the reference `PIIRedactor` path.
+
+Run with `python benchmarks/redaction.py [n_events]`. This is the `redaction`
+group of the benchmark suite (`mie bench --only redaction`).
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from mie_credit_platform.bench.cases import BENCHMARKS
+from mie_credit_platform.bench.harness import SuiteOptions, run_benchmarks, select
+
+
+def main(n: int = 20000) -> dict[str, float]:
+    report = run_benchmarks(select(BENCHMARKS, ["redaction"]), SuiteOptions(sizes=(n,)))
+    by_name = {r["name"]: r for r in report["results"]}
+    for r in by_name.values():
+        if "error" in r:
+            raise RuntimeError(f"{r['key']}: {r['error']}")
+    ref = by_name["redaction.redact_event_reference"]
+    plan = by_name["redaction.redact_event"]
+    return {
+        "n_events": n,
+        "reference_us_per_event": ref["us_per_op"],
+        "compiled_us_per_event": plan["us_per_op"],
+        "speedup": ref["median_s"] / plan["median_s"],
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000), indent=2))
@@ -72,7 +72,13 @@ def score(req: ScoreRequest) -> ScoreResponse:
         sensitive_attributes=req.sensitive_attributes if settings.store_sensitive_for_monitoring else None,
         extra={},
     )
-    append_jsonl(settings.audit_log_path, event)
+    append_jsonl(
+        settings.audit_log_path,
+        event,
+        rotate_max_bytes=settings.audit_log_rotate_max_bytes,
+        rotate_max_age_s=settings.audit_log_rotate_max_age_s,
+        compression=settings.audit_log_compression,
+    )
     if settings.enable_sqlite_audit_store:
         insert_sqlite_decision(settings.audit_sqlite_path, event)
 
@@ -127,7 +133,13 @@ def ingest_outcome(event_in: OutcomeEventIn) -> dict:
         created_at=utcnow(),
         extra=event_in.extra,
     )
-    append_jsonl(settings.audit_log_path, event)
+    append_jsonl(
+        settings.audit_log_path,
+        event,
+        rotate_max_bytes=settings.audit_log_rotate_max_bytes,
+        rotate_max_age_s=settings.audit_log_rotate_max_age_s,
+        compression=settings.audit_log_compression,
+    )
     if settings.enable_sqlite_audit_store:
         insert_sqlite_outcome(settings.audit_sqlite_path, event)
     return {"status": "ok"}
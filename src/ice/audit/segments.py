@@ -0,0 +1,412 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:  # POSIX advisory locks keep rotation safe across worker processes.
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Event time (unix seconds) extracted from one JSONL line.
+IndexKey = Callable[[str], float]
+
+COMPRESSIONS = (None, "gzip", "zstd")
+
+
+@dataclass(frozen=True)
+class SegmentIndex:
+    """
+    Sidecar index for one sealed segment (`<stem>.<seq>.idx.json`).
+
+    `first_line` and `last_line` are the segment's first and last line numbers
+    counted across the whole log (0-based), so they identify events uniquely.
+    """
+
+    seq: int
+    file: str
+    n_events: int
+    first_ts: Optional[float]
+    last_ts: Optional[float]
+    min_ts: Optional[float]
+    max_ts: Optional[float]
+    first_line: Optional[int]
+    last_line: Optional[int]
+    compression: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SegmentIndex:
+        # Sidecars written before a field existed read it as None.
+        return cls(**{f.name: data.get(f.name) for f in fields(cls)})
+
+    def overlaps(self, since_ts: Optional[float], until_ts: Optional[float]) -> bool:
+        if self.min_ts is None or self.max_ts is None:
+            return self.n_events > 0
+        if since_ts is not None and self.max_ts < since_ts:
+            return False
+        if until_ts is not None and self.min_ts > until_ts:
+            return False
+        return True
+
+
+def ts_index_key(line: str) -> float:
+    return float(json.loads(line)["ts"])
+
+
+def created_at_index_key(line: str) -> float:
+    return datetime.fromisoformat(str(json.loads(line)["created_at"])).timestamp()
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise RuntimeError("zstd compression requires the optional 'zstandard' package") from e
+    return zstandard
+
+
+def _open_compressed_write(path: str, compression: Optional[str]) -> IO[bytes]:
+    if compression == "gzip":
+        return gzip.open(path, "wb")
+    if compression == "zstd":
+        return _zstd().ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+    return open(path, "wb")
+
+
+def _open_sealing(path: str) -> IO[str]:
+    # A raw segment may be compressed (and removed) by the sealer between listing and opening.
+    for candidate in (path, path + ".gz", path + ".zst"):
+        try:
+            return _open_segment_read(candidate)
+        except FileNotFoundError:
+            continue
+    raise FileNotFoundError(path)
+
+
+def _open_segment_read(path: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.endswith(".zst"):
+        raw = _zstd().ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+class SegmentedJsonlWriter:
+    """
+    Append-only JSONL log that rotates into numbered, compressed, indexed segments.
+
+    The active segment is always `path`, so existing tooling that tails it keeps
+    working. When it reaches `max_bytes`, or has been open for `max_age_s`
+    seconds, it is renamed to `<stem>.<seq:06d><suffix>` under the writer lock
+    and then compressed to `[.gz|.zst]` and indexed on a background thread, next
+    to a `<stem>.<seq:06d>.idx.json` sidecar recording its ts range and line
+    numbers. Appends never wait for a segment to be compressed. Readers use the
+    sidecars to skip irrelevant segments (see `iter_lines`).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        max_age_s: Optional[float] = 86400.0,
+        compression: Optional[str] = "gzip",
+        index_key: IndexKey = ts_index_key,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression {compression!r}; expected one of {COMPRESSIONS}")
+        if compression == "zstd":
+            _zstd()
+        self.path = path
+        self.max_bytes = max_bytes or None
+        self.max_age_s = max_age_s or None
+        self.compression = compression
+        self.index_key = index_key
+        self._lock = threading.Lock()
+        self._seal_lock = threading.Lock()
+        self._sealer_lock = threading.Lock()
+        self._sealer: Optional[threading.Thread] = None
+        self._seal_again = False
+        self._active_opened_at: Optional[Tuple[int, float]] = None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Finish rotations interrupted after the rename (uncompressed, unindexed segments).
+        if any(True for _ in self._unindexed()):
+            self._schedule_seal()
+
+    def append(self, lines: Iterable[str]) -> None:
+        """
+        Append pre-serialized JSON lines (without trailing newlines), rotating first if due.
+        """
+        data = "".join(line + "\n" for line in lines)
+        if not data:
+            return
+        rotated = False
+        with self._locked():
+            if self._rotation_due():
+                rotated = self._rotate() is not None
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(data)
+        if rotated:
+            self._schedule_seal()
+
+    def rotate(self) -> Optional[SegmentIndex]:
+        """
+        Seal the active segment now and wait for its index (None when it is empty).
+        """
+        with self._locked():
+            seq = self._rotate()
+        if seq is None:
+            return None
+        self.seal_pending()
+        return next((idx for idx in list_segments(self.path) if idx.seq == seq), None)
+
+    def seal_pending(self) -> None:
+        """
+        Compress and index every renamed but unsealed segment, oldest first.
+        """
+        with self._locked(self._seal_lock, ".seal.lock"):
+            for seq, file in self._unindexed():
+                raw = _segment_name(self.path, seq)
+                if file != raw and os.path.exists(raw):
+                    os.remove(raw)
+                self._seal(seq, file)
+
+    def wait_sealed(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the background sealer, if one is running, to finish.
+        """
+        sealer = self._sealer
+        if sealer is not None:
+            sealer.join(timeout)
+
+    # Internals -----------------------------------------------------------------
+
+    def _schedule_seal(self) -> None:
+        with self._sealer_lock:
+            self._seal_again = True
+            if self._sealer is None:
+                self._sealer = threading.Thread(target=self._run_sealer, name="audit-segment-sealer", daemon=True)
+                self._sealer.start()
+
+    def _run_sealer(self) -> None:
+        while True:
+            with self._sealer_lock:
+                if not self._seal_again:
+                    self._sealer = None
+                    return
+                self._seal_again = False
+            try:
+                self.seal_pending()
+            except Exception:  # pragma: no cover - retried on the next rotation or start
+                logger.exception("audit segment sealing failed for %s", self.path)
+
+    def _unindexed(self) -> Iterator[Tuple[int, str]]:
+        indexed = {idx.seq for idx in list_segments(self.path)}
+        # One file per segment: when a crash left both, the compressed copy is complete
+        # (it is renamed into place before the raw file is removed), and sorts last.
+        for seq, file in dict(_sealed_files(self.path)).items():
+            if seq not in indexed:
+                yield seq, file
+
+    @contextmanager
+    def _locked(self, lock: Optional[threading.Lock] = None, suffix: str = ".lock") -> Iterator[None]:
+        with lock or self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.path + suffix, "a") as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _rotation_due(self) -> bool:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        if st.st_size == 0:
+            return False
+        if self.max_bytes is not None and st.st_size >= self.max_bytes:
+            return True
+        if self.max_age_s is not None and time.time() - self._opened_at(st.st_ino) >= self.max_age_s:
+            return True
+        return False
+
+    def _opened_at(self, inode: int) -> float:
+        """
+        Wall-clock time the active segment was first seen, shared across processes via a marker file.
+        """
+        cached = self._active_opened_at
+        if cached is not None and cached[0] == inode:
+            return cached[1]
+        marker = self.path + ".active"
+        opened_at: Optional[float] = None
+        try:
+            with open(marker, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("inode") == inode:
+                opened_at = float(data["opened_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        if opened_at is None:
+            opened_at = time.time()
+            with open(marker, "w", encoding="utf-8") as f:
+                json.dump({"inode": inode, "opened_at": opened_at}, f)
+        self._active_opened_at = (inode, opened_at)
+        return opened_at
+
+    def _rotate(self) -> Optional[int]:
+        # Only renames, so the writer lock is held briefly; `_seal` does the slow part.
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return None
+        seq = max([s for s, _ in _sealed_files(self.path)] + [0]) + 1
+        os.replace(self.path, _segment_name(self.path, seq))
+        self._active_opened_at = None
+        return seq
+
+    def _seal(self, seq: int, raw: str) -> SegmentIndex:
+        compressed = raw
+        if self.compression is not None and raw == _segment_name(self.path, seq):
+            compressed = raw + (".gz" if self.compression == "gzip" else ".zst")
+        previous = [idx for idx in list_segments(self.path) if idx.seq < seq]
+        first_line = previous[-1].last_line + 1 if previous and previous[-1].last_line is not None else 0
+        n = 0
+        first: Optional[float] = None
+        last: Optional[float] = None
+        min_ts: Optional[float] = None
+        max_ts: Optional[float] = None
+        out = _open_compressed_write(compressed + ".tmp", self.compression) if compressed != raw else None
+        try:
+            with _open_segment_read(raw) as f:
+                for line in f:
+                    if out is not None:
+                        out.write(line.encode("utf-8"))
+                    stripped = line.strip()
+                    if not stripped:
+                        continue
+                    n += 1
+                    try:
+                        key = self.index_key(stripped)
+                    except Exception:
+                        continue
+                    first = key if first is None else first
+                    last = key
+                    min_ts = key if min_ts is None else min(min_ts, key)
+                    max_ts = key if max_ts is None else max(max_ts, key)
+        finally:
+            if out is not None:
+                out.close()
+        if out is not None:
+            os.replace(compressed + ".tmp", compressed)
+            os.remove(raw)
+
+        idx = SegmentIndex(
+            seq=seq,
+            file=os.path.basename(compressed),
+            n_events=n,
+            first_ts=first,
+            last_ts=last,
+            min_ts=min_ts,
+            max_ts=max_ts,
+            first_line=first_line if n else None,
+            last_line=first_line + n - 1 if n else None,
+            compression=self.compression if compressed != raw else None,
+        )
+        tmp = _index_name(self.path, seq) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(idx), f, sort_keys=True)
+        os.replace(tmp, _index_name(self.path, seq))
+        return idx
+
+
+def _split(path: str) -> Tuple[str, str, str]:
+    directory = os.path.dirname(path) or "."
+    stem, suffix = os.path.splitext(os.path.basename(path))
+    return directory, stem, suffix or ".jsonl"
+
+
+def _segment_name(path: str, seq: int) -> str:
+    directory, stem, suffix = _split(path)
+    return os.path.join(directory, f"{stem}.{seq:06d}{suffix}")
+
+
+def _index_name(path: str, seq: int) -> str:
+    directory, stem, _ = _split(path)
+    return os.path.join(directory, f"{stem}.{seq:06d}.idx.json")
+
+
+def _sealed_files(path: str) -> List[Tuple[int, str]]:
+    directory, stem, suffix = _split(path)
+    pattern = re.compile(rf"^{re.escape(stem)}\.(\d{{6}}){re.escape(suffix)}(\.gz|\.zst)?$")
+    out: List[Tuple[int, str]] = []
+    if not os.path.isdir(directory):
+        return out
+    for name in os.listdir(directory):
+        m = pattern.match(name)
+        if m:
+            out.append((int(m.group(1)), os.path.join(directory, name)))
+    return sorted(out)
+
+
+def list_segments(path: str) -> List[SegmentIndex]:
+    """
+    Sidecar indexes of all sealed segments of `path`, oldest first.
+    """
+    directory, stem, _ = _split(path)
+    pattern = re.compile(rf"^{re.escape(stem)}\.(\d{{6}})\.idx\.json$")
+    out: List[SegmentIndex] = []
+    if not os.path.isdir(directory):
+        return out
+    for name in os.listdir(directory):
+        if pattern.match(name):
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                out.append(SegmentIndex.from_dict(json.load(f)))
+    return sorted(out, key=lambda idx: idx.seq)
+
+
+def iter_lines(
+    path: str,
+    *,
+    since_ts: Optional[float] = None,
+    until_ts: Optional[float] = None,
+    include_active: bool = True,
+) -> Iterator[str]:
+    """
+    Yield raw JSONL lines from every segment whose index overlaps [since_ts, until_ts].
+
+    Segments are pruned by their sidecar index only; callers still filter lines
+    when they need exact bounds. Segments still being sealed, and the active
+    segment, are always read.
+    """
+    directory = os.path.dirname(path) or "."
+    indexed = {idx.seq: idx for idx in list_segments(path)}
+    files = {seq: file for seq, file in _sealed_files(path) if seq not in indexed}
+    for seq in sorted(set(indexed) | set(files)):
+        idx = indexed.get(seq)
+        if idx is not None and not idx.overlaps(since_ts, until_ts):
+            continue
+        with _open_sealing(os.path.join(directory, idx.file) if idx is not None else files[seq]) as f:
+            for line in f:
+                if line.strip():
+                    yield line.rstrip("\n")
+    if include_active and os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield line.rstrip("\n")
+
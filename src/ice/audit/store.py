@@ -6,9 +6,12 @@ import os
 import sqlite3
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from ice.audit.events import DecisionEvent, OutcomeEvent
+from ice.audit.segments import SegmentedJsonlWriter, created_at_index_key
+
+_SEGMENT_WRITERS: Dict[Tuple[str, Optional[int], Optional[float], Optional[str]], SegmentedJsonlWriter] = {}
 
 
 def _ensure_dir(path: str) -> None:
@@ -20,13 +23,43 @@ def hash_features(features: Dict[str, float]) -> str:
     return hashlib.sha256(raw).hexdigest()
 
 
-def append_jsonl(path: str, event: Union[DecisionEvent, OutcomeEvent]) -> None:
+def append_jsonl(
+    path: str,
+    event: Union[DecisionEvent, OutcomeEvent],
+    *,
+    rotate_max_bytes: Optional[int] = None,
+    rotate_max_age_s: Optional[float] = None,
+    compression: Optional[str] = None,
+) -> None:
+    """
+    Append one event to a JSONL audit log.
+
+    When a rotation limit is given the log is written through a `SegmentedJsonlWriter`,
+    which seals it into compressed, indexed segments as it grows.
+    """
     _ensure_dir(path)
     payload = asdict(event)
     # datetime -> ISO
     payload["created_at"] = event.created_at.replace(tzinfo=timezone.utc).isoformat()
+    line = json.dumps(payload, sort_keys=True)
+    if rotate_max_bytes or rotate_max_age_s:
+        key = (path, rotate_max_bytes, rotate_max_age_s, compression)
+        writer = _SEGMENT_WRITERS.get(key)
+        if writer is None:
+            writer = _SEGMENT_WRITERS.setdefault(
+                key,
+                SegmentedJsonlWriter(
+                    path,
+                    max_bytes=rotate_max_bytes,
+                    max_age_s=rotate_max_age_s,
+                    compression=compression,
+                    index_key=created_at_index_key,
+                ),
+            )
+        writer.append([line])
+        return
     with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(payload, sort_keys=True) + "\n")
+        f.write(line + "\n")
 
 
 def init_sqlite(path: str) -> None:
@@ -18,6 +18,10 @@ class Settings(BaseSettings):
     current_model_path: str = "artifacts/models/baseline.joblib"
     audit_log_path: str = "artifacts/audit/decisions.jsonl"
     audit_sqlite_path: str = "artifacts/audit/audit.sqlite3"
+    # Rotation of the JSONL audit log into compressed, indexed segments (0 disables a trigger; both are off by default)
+    audit_log_rotate_max_bytes: int = 0
+    audit_log_rotate_max_age_s: float = 0.0
+    audit_log_compression: str | None = "gzip"
 
     # Serving behavior
     decision_threshold: float = 0.5
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import math
+import warnings
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# Per-group count cells: labeled rows by (decision, outcome), then unlabeled rows by decision.
+CELLS = ("tp", "fp", "fn", "tn", "unlabeled_pos", "unlabeled_neg")
+TP, FP, FN, TN, UNLABELED_POS, UNLABELED_NEG = range(len(CELLS))
+
+COUNT_METHODS = ("multinomial", "poisson")
+
+# Replicates per task in row mode. Each task gets its own spawned seed, so the
+# result only depends on `seed`, not on how many workers ran the tasks.
+ROW_CHUNK = 50
+# Upper bound on row indices drawn at once for one group in row mode.
+_MAX_DRAWS = 1 << 21
+
+Interval = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class FairnessIntervals:
+    """
+    Percentile bootstrap intervals for one attribute.
+
+    Groups keep their population size in every replicate (stratified
+    resampling), except with the Poisson method where sizes vary too.
+    Per-group dicts only include groups where the metric was defined in at
+    least one replicate; gaps (max - min over groups) are None when undefined.
+    Disparate impact is each group's selection rate over the `reference`
+    group's (the one with the highest observed selection rate).
+    """
+
+    method: str
+    n_replicates: int
+    confidence: float
+    reference: str | None
+    selection_rates: dict[str, Interval]
+    disparate_impact: dict[str, Interval]
+    tpr: dict[str, Interval]
+    fpr: dict[str, Interval]
+    calibration_in_the_large: dict[str, Interval]
+    demographic_parity_difference: Interval | None
+    tpr_gap: Interval | None
+    fpr_gap: Interval | None
+
+    def to_dict(self) -> dict[str, Any]:
+        def pairs(d: dict[str, Interval]) -> dict[str, list[float]]:
+            return {g: list(v) for g, v in d.items()}
+
+        def pair(v: Interval | None) -> list[float] | None:
+            return None if v is None else list(v)
+
+        return {
+            "method": self.method,
+            "n_replicates": self.n_replicates,
+            "confidence": self.confidence,
+            "reference": self.reference,
+            "selection_rates": pairs(self.selection_rates),
+            "disparate_impact": pairs(self.disparate_impact),
+            "tpr": pairs(self.tpr),
+            "fpr": pairs(self.fpr),
+            "calibration_in_the_large": pairs(self.calibration_in_the_large),
+            "demographic_parity_difference": pair(self.demographic_parity_difference),
+            "tpr_gap": pair(self.tpr_gap),
+            "fpr_gap": pair(self.fpr_gap),
+        }
+
+
+def _check(n_replicates: int, confidence: float) -> None:
+    if n_replicates < 1:
+        raise ValueError("n_replicates must be at least 1")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be between 0 and 1")
+
+
+def _ratio(numer: np.ndarray, denom: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denom > 0, numer / denom, np.nan)
+
+
+def _percentiles(values: np.ndarray, confidence: float) -> tuple[np.ndarray, np.ndarray]:
+    tail = 50.0 * (1.0 - confidence)
+    with warnings.catch_warnings():
+        # All-NaN columns (metric never defined) come back as NaN and are dropped by the callers.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        lo, hi = np.nanpercentile(values, [tail, 100.0 - tail], axis=0)
+    return lo, hi
+
+
+def _spread(rates: np.ndarray) -> np.ndarray:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmax(rates, axis=1) - np.nanmin(rates, axis=1)
+
+
+def cells_from_rows(selected: Sequence[bool] | np.ndarray, outcomes: Sequence[int] | np.ndarray | None) -> np.ndarray:
+    """
+    Cell index (into `CELLS`) per row.
+
+    Rows are unlabeled when `outcomes` is None, and so are rows whose outcome is
+    None (or anything other than 0/1).
+    """
+    sel = np.asarray(selected, dtype=bool)
+    unlabeled = np.where(sel, UNLABELED_POS, UNLABELED_NEG)
+    if outcomes is None:
+        return unlabeled
+    out = np.asarray(outcomes, dtype=np.float64)
+    if out.shape != sel.shape:
+        raise ValueError("outcomes length must match decisions length")
+    pos = out == 1
+    labeled = np.where(sel, np.where(pos, TP, FP), np.where(pos, FN, TN))
+    return np.where(pos | (out == 0), labeled, unlabeled)
+
+
+def resample_counts(
+    cells: np.ndarray,
+    n_replicates: int,
+    seed: int | None = None,
+    method: str = "multinomial",
+) -> np.ndarray:
+    """
+    Draw bootstrap replicates of a `(groups, len(CELLS))` count table in one call.
+
+    "multinomial" redraws each group's rows with its size fixed (the same
+    distribution as resampling its rows with replacement); "poisson" draws each
+    cell independently, so group sizes vary as well. Returns
+    `(n_replicates, groups, len(CELLS))` counts.
+    """
+    cells = np.asarray(cells, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    if method == "poisson":
+        return rng.poisson(cells, size=(n_replicates, *cells.shape))
+    if method != "multinomial":
+        raise ValueError(f"Unknown bootstrap method {method!r}; expected one of {COUNT_METHODS}")
+    n = cells.sum(axis=1)
+    pvals = cells / np.maximum(n, 1)[:, None]
+    return rng.multinomial(n, pvals, size=(n_replicates, len(n)))
+
+
+def intervals_from_replicates(
+    groups: list[str],
+    cells: np.ndarray,
+    replicates: np.ndarray,
+    *,
+    confidence: float,
+    method: str,
+    score_sums: np.ndarray | None = None,
+) -> FairnessIntervals:
+    """
+    Percentile intervals from replicate count tables (and, optionally, per-group
+    sums of scores over labeled rows, which back calibration-in-the-large).
+    """
+    if not groups:
+        return FairnessIntervals(method, len(replicates), confidence, None, {}, {}, {}, {}, {}, None, None, None)
+
+    def by_group(values: np.ndarray) -> dict[str, Interval]:
+        lo, hi = _percentiles(values, confidence)
+        return {g: (a, b) for g, a, b in zip(groups, lo.tolist(), hi.tolist(), strict=True) if not math.isnan(a)}
+
+    def overall(values: np.ndarray) -> Interval | None:
+        lo, hi = _percentiles(values, confidence)
+        return None if math.isnan(lo) else (float(lo), float(hi))
+
+    point_sel = _ratio(cells[:, TP] + cells[:, FP] + cells[:, UNLABELED_POS], cells.sum(axis=1))
+    ref = None if np.isnan(point_sel).all() else int(np.nanargmax(point_sel))
+
+    r = replicates
+    sel = _ratio(r[..., TP] + r[..., FP] + r[..., UNLABELED_POS], r.sum(axis=2))
+    tpr = _ratio(r[..., TP], r[..., TP] + r[..., FN])
+    fpr = _ratio(r[..., FP], r[..., FP] + r[..., TN])
+    calibration: dict[str, Interval] = {}
+    if score_sums is not None:
+        labeled = r[..., :UNLABELED_POS].sum(axis=2)
+        calibration = by_group(_ratio(score_sums, labeled) - _ratio(r[..., TP] + r[..., FN], labeled))
+    return FairnessIntervals(
+        method=method,
+        n_replicates=len(r),
+        confidence=confidence,
+        reference=None if ref is None else groups[ref],
+        selection_rates=by_group(sel),
+        disparate_impact={} if ref is None else by_group(_ratio(sel, sel[:, [ref]])),
+        tpr=by_group(tpr),
+        fpr=by_group(fpr),
+        calibration_in_the_large=calibration,
+        demographic_parity_difference=overall(_spread(sel)),
+        tpr_gap=overall(_spread(tpr)),
+        fpr_gap=overall(_spread(fpr)),
+    )
+
+
+def bootstrap_counts(
+    groups: list[str],
+    cells: np.ndarray,
+    *,
+    n_replicates: int = 1000,
+    confidence: float = 0.95,
+    seed: int | None = None,
+    method: str = "multinomial",
+) -> FairnessIntervals:
+    """
+    Bootstrap intervals from a per-group count table alone.
+
+    Cost is O(replicates x groups), independent of the number of rows, since
+    every metric here is a function of the `CELLS` counts.
+    """
+    _check(n_replicates, confidence)
+    cells = np.asarray(cells, dtype=np.int64).reshape(len(groups), len(CELLS))
+    negative = (cells < 0).any(axis=1)
+    if negative.any():
+        bad = [g for g, neg in zip(groups, negative.tolist(), strict=True) if neg]
+        raise ValueError(f"Inconsistent counts (negative cells) for groups {bad}")
+    replicates = resample_counts(cells, n_replicates, seed=seed, method=method)
+    return intervals_from_replicates(groups, cells, replicates, confidence=confidence, method=method)
+
+
+Stratum = tuple[np.ndarray, np.ndarray | None]
+
+
+def _replicate_rows(strata: list[Stratum], size: int, seed: np.random.SeedSequence) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    n_cells = len(CELLS)
+    cells = np.zeros((size, len(strata), n_cells), dtype=np.int64)
+    score_sums = np.zeros((size, len(strata)), dtype=np.float64)
+    for j, (cell_codes, labeled_scores) in enumerate(strata):
+        n = len(cell_codes)
+        step = max(1, _MAX_DRAWS // n)
+        for start in range(0, size, step):
+            m = min(step, size - start)
+            idx = rng.integers(0, n, size=(m, n))
+            offsets = np.arange(m)[:, None] * n_cells
+            cells[start : start + m, j] = np.bincount(
+                (offsets + cell_codes[idx]).ravel(), minlength=m * n_cells
+            ).reshape(m, n_cells)
+            if labeled_scores is not None:
+                score_sums[start : start + m, j] = labeled_scores[idx].sum(axis=1)
+    return cells, score_sums
+
+
+_WORKER_STRATA: list[Stratum] = []
+
+
+def _init_row_worker(strata: list[Stratum]) -> None:
+    global _WORKER_STRATA
+    _WORKER_STRATA = strata
+
+
+def _replicate_rows_in_worker(size: int, seed: np.random.SeedSequence) -> tuple[np.ndarray, np.ndarray]:
+    return _replicate_rows(_WORKER_STRATA, size, seed)
+
+
+def bootstrap_rows(
+    sensitive_values: Sequence[str],
+    selected: Sequence[bool] | np.ndarray,
+    outcomes: Sequence[int] | np.ndarray | None = None,
+    *,
+    scores: Sequence[float] | np.ndarray | None = None,
+    n_replicates: int = 1000,
+    confidence: float = 0.95,
+    seed: int | None = None,
+    workers: int = 0,
+) -> FairnessIntervals:
+    """
+    Stratified bootstrap that resamples raw rows with replacement within each group.
+
+    Costs O(replicates x rows), unlike `bootstrap_counts`, but also covers
+    calibration-in-the-large when continuous `scores` are given. With
+    `workers > 0` replicate chunks run on a process pool; results are the same
+    for any worker count.
+    """
+    _check(n_replicates, confidence)
+    values = np.asarray(sensitive_values, dtype=str)
+    cell_codes = cells_from_rows(selected, outcomes)
+    if cell_codes.shape != values.shape:
+        raise ValueError("decisions and sensitive_values must have same length")
+    labeled_scores = None
+    if scores is not None:
+        labeled_scores = np.where(cell_codes < UNLABELED_POS, np.asarray(scores, dtype=np.float64), 0.0)
+        if labeled_scores.shape != values.shape:
+            raise ValueError("scores length must match decisions length")
+
+    labels, codes = np.unique(values, return_inverse=True)
+    groups = [str(g) for g in labels]
+    if not groups:
+        empty = np.zeros((0, len(CELLS)), dtype=np.int64)
+        return intervals_from_replicates(
+            [], empty, np.zeros((n_replicates, 0, len(CELLS))), confidence=confidence, method="rows"
+        )
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(groups)))[:-1]
+    strata: list[Stratum] = [
+        (cell_codes[idx], None if labeled_scores is None else labeled_scores[idx]) for idx in np.split(order, bounds)
+    ]
+    cells = np.bincount(codes * len(CELLS) + cell_codes, minlength=len(groups) * len(CELLS)).reshape(-1, len(CELLS))
+
+    n_chunks = math.ceil(n_replicates / ROW_CHUNK)
+    sizes = [min(ROW_CHUNK, n_replicates - i * ROW_CHUNK) for i in range(n_chunks)]
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    if workers > 0 and n_chunks > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, n_chunks), initializer=_init_row_worker, initargs=(strata,)
+        ) as pool:
+            parts = list(pool.map(_replicate_rows_in_worker, sizes, seeds))
+    else:
+        parts = [_replicate_rows(strata, size, s) for size, s in zip(sizes, seeds, strict=True)]
+    return intervals_from_replicates(
+        groups,
+        cells,
+        np.concatenate([c for c, _ in parts]),
+        confidence=confidence,
+        method="rows",
+        score_sums=None if scores is None else np.concatenate([s for _, s in parts]),
+    )
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-from ice.fairness.metrics import disparate_impact_ratio, group_rates, selection_rate
+import numpy as np
+
+from ice.audit.events import DecisionEvent
+from ice.fairness.bootstrap import (
+    CELLS,
+    FN,
+    FP,
+    TN,
+    TP,
+    UNLABELED_POS,
+    bootstrap_counts,
+    bootstrap_rows,
+    cells_from_rows,
+)
+
+# Joins attribute names and group labels of an intersection, e.g. "age_band|sex" / "25-34|F".
+INTERSECTION_SEP = "|"
+APPROVED_DECISIONS = ("approve",)
 
 
 @dataclass(frozen=True)
@@ -13,59 +30,283 @@ class FairnessReport:
     selection_rates: Dict[str, float]
     disparate_impact_pairs: Dict[str, float]
     error_rates: Optional[Dict[str, Dict[str, float]]]
+    group_sizes: Optional[Dict[str, int]] = None
+    suppressed_groups: Optional[List[str]] = None
 
 
-def compute_fairness_report(
-    decisions: List[bool],
-    sensitive_values: List[str],
+def _factorize(values: Sequence[Optional[str]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Sorted group labels and a code per row (-1 where the value is missing).
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object), sort=True)
+    return [str(g) for g in uniques], codes.astype(np.intp, copy=False)
+
+
+def _cell_table(codes: np.ndarray, cell_codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    `(groups, len(CELLS))` counts in one `np.bincount`; rows with a negative code are skipped.
+    """
+    k = len(CELLS)
+    keep = codes >= 0
+    flat = codes[keep] * k + cell_codes[keep]
+    return np.bincount(flat, minlength=n_groups * k).reshape(n_groups, k)
+
+
+def _report_from_cells(
     attribute: str,
-    outcomes: Optional[List[int]] = None,
-) -> Dict[str, Any]:
+    labels: List[str],
+    cells: np.ndarray,
+    *,
+    with_outcomes: bool,
+    min_cell_size: int = 0,
+) -> FairnessReport:
     """
-    Compute basic fairness metrics for one sensitive attribute.
+    Point estimates for one grouping from its cell table.
 
-    - decisions: approved=True/False
-    - sensitive_values: group label per decision
-    - outcomes: optional true labels (e.g., repayment success) to compute TPR/FPR
+    Groups with fewer than `min_cell_size` decisions are suppressed: they are
+    left out of every rate and cannot be the disparate impact reference. Error
+    rates are likewise only reported for groups with at least `min_cell_size`
+    labeled decisions.
     """
-    if len(decisions) != len(sensitive_values):
-        raise ValueError("decisions and sensitive_values must have same length")
+    n = cells.sum(axis=1)
+    selected = cells[:, TP] + cells[:, FP] + cells[:, UNLABELED_POS]
+    labeled = cells[:, :UNLABELED_POS].sum(axis=1)
+    shown = (n > 0) & (n >= min_cell_size)
 
-    groups = sorted(set(sensitive_values))
+    groups: List[str] = []
+    sizes: Dict[str, int] = {}
     sel: Dict[str, float] = {}
-    for g in groups:
-        ds = [d for d, s in zip(decisions, sensitive_values) if s == g]
-        sel[g] = selection_rate(ds)
+    suppressed: List[str] = []
+    for g, n_g, sel_g, ok in zip(labels, n.tolist(), selected.tolist(), shown.tolist(), strict=True):
+        if not ok:
+            if n_g:
+                suppressed.append(g)
+            continue
+        groups.append(g)
+        sizes[g] = n_g
+        sel[g] = sel_g / n_g
 
     # Pairwise DI relative to the max-selection group (a common reporting pattern)
     ref = max(sel.items(), key=lambda kv: kv[1])[0] if groups else None
     di: Dict[str, float] = {}
     if ref is not None:
-        ref_ds = [d for d, s in zip(decisions, sensitive_values) if s == ref]
         for g in groups:
-            g_ds = [d for d, s in zip(decisions, sensitive_values) if s == g]
-            di[f"{g}_vs_{ref}"] = disparate_impact_ratio(g_ds, ref_ds)
+            di[f"{g}_vs_{ref}"] = (sel[g] / sel[ref]) if sel[ref] > 0 else 0.0
 
     err_rates = None
-    if outcomes is not None:
-        if len(outcomes) != len(decisions):
-            raise ValueError("outcomes length must match decisions length")
-        y_pred = [1 if d else 0 for d in decisions]
-        err_rates = group_rates(outcomes, y_pred, sensitive_values)
+    if with_outcomes:
+        err_rates = {}
+        rows = zip(labels, cells.tolist(), labeled.tolist(), shown.tolist(), strict=True)
+        for g, c, labeled_g, ok in rows:
+            if ok and labeled_g and labeled_g >= min_cell_size:
+                pos, neg = c[TP] + c[FN], c[FP] + c[TN]
+                err_rates[g] = {"tpr": c[TP] / pos if pos else 0.0, "fpr": c[FP] / neg if neg else 0.0}
 
-    report = FairnessReport(
+    return FairnessReport(
         attribute=attribute,
         groups=groups,
         selection_rates=sel,
         disparate_impact_pairs=di,
         error_rates=err_rates,
+        group_sizes=sizes,
+        suppressed_groups=suppressed,
     )
+
+
+def _bootstrap(
+    decisions: List[bool],
+    sensitive_values: List[str],
+    outcomes: Optional[List[int]],
+    labels: List[str],
+    cells: np.ndarray,
+    *,
+    n_bootstrap: int,
+    method: str,
+    confidence: float,
+    seed: Optional[int],
+    workers: int,
+) -> Dict[str, Any]:
+    if method == "rows":
+        intervals = bootstrap_rows(
+            sensitive_values,
+            decisions,
+            outcomes,
+            n_replicates=n_bootstrap,
+            confidence=confidence,
+            seed=seed,
+            workers=workers,
+        )
+    else:
+        intervals = bootstrap_counts(
+            labels, cells, n_replicates=n_bootstrap, confidence=confidence, seed=seed, method=method
+        )
+    out = intervals.to_dict()
+    # Same keys as the point estimates in the report.
+    ref = out.pop("reference")
+    out["disparate_impact_pairs"] = {f"{g}_vs_{ref}": v for g, v in out.pop("disparate_impact").items()}
+    out.pop("calibration_in_the_large")
+    return out
+
+
+def compute_fairness_report(
+    decisions: List[bool],
+    sensitive_values: List[str],
+    attribute: str,
+    outcomes: Optional[List[int]] = None,
+    n_bootstrap: int = 0,
+    bootstrap_method: str = "multinomial",
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+    workers: int = 0,
+) -> Dict[str, Any]:
+    """
+    Compute basic fairness metrics for one sensitive attribute.
+
+    - decisions: approved=True/False
+    - sensitive_values: group label per decision
+    - outcomes: optional true labels (e.g., repayment success) to compute TPR/FPR
+    - n_bootstrap: replicates for percentile confidence intervals (0 = none).
+      bootstrap_method is "multinomial" or "poisson" (resampling per-group
+      counts) or "rows" (stratified resampling of rows, on `workers` processes)
+
+    For several attributes and their intersections use `compute_fairness_reports`.
+    """
+    if len(decisions) != len(sensitive_values):
+        raise ValueError("decisions and sensitive_values must have same length")
+    if outcomes is not None and len(outcomes) != len(decisions):
+        raise ValueError("outcomes length must match decisions length")
+
+    labels, codes = _factorize(sensitive_values)
+    cells = _cell_table(codes, cells_from_rows(decisions, outcomes), len(labels))
+    report = _report_from_cells(attribute, labels, cells, with_outcomes=outcomes is not None)
+    ci = None
+    if n_bootstrap > 0:
+        ci = _bootstrap(
+            decisions,
+            sensitive_values,
+            outcomes,
+            labels,
+            cells,
+            n_bootstrap=n_bootstrap,
+            method=bootstrap_method,
+            confidence=confidence,
+            seed=seed,
+            workers=workers,
+        )
     return {
         "attribute": report.attribute,
         "groups": report.groups,
         "selection_rates": report.selection_rates,
         "disparate_impact_pairs": report.disparate_impact_pairs,
         "error_rates": report.error_rates,
+        "confidence_intervals": ci,
     }
 
 
+def columns_from_events(
+    events: Iterable[DecisionEvent],
+    attributes: Sequence[str],
+    outcomes: Optional[Mapping[str, int]] = None,
+    approved_decisions: Sequence[str] = APPROVED_DECISIONS,
+) -> Tuple[List[bool], Dict[str, List[Optional[str]]], Optional[List[Optional[int]]]]:
+    """
+    Split decision events into columns for `compute_fairness_reports`, in one pass.
+
+    `outcomes` maps application_id to the observed outcome; decisions without
+    one are left unlabeled (None). A missing sensitive attribute is None.
+    """
+    approved = set(approved_decisions)
+    decisions: List[bool] = []
+    columns: Dict[str, List[Optional[str]]] = {a: [] for a in attributes}
+    labels: Optional[List[Optional[int]]] = None if outcomes is None else []
+    appenders = [(a, columns[a].append) for a in attributes]
+    for e in events:
+        decisions.append(e.decision in approved)
+        sensitive = e.sensitive_attributes or {}
+        for a, append in appenders:
+            append(sensitive.get(a))
+        if labels is not None:
+            labels.append(outcomes.get(e.application_id))
+    return decisions, columns, labels
+
+
+def compute_fairness_reports(
+    decisions: List[bool],
+    sensitive_attributes: Mapping[str, Sequence[Optional[str]]],
+    outcomes: Optional[Sequence[Optional[int]]] = None,
+    intersections: Sequence[Sequence[str]] = (),
+    min_cell_size: int = 0,
+) -> Dict[str, Any]:
+    """
+    Fairness reports for several sensitive attributes and their intersections.
+
+    - sensitive_attributes: attribute -> group label per decision (None = not
+      recorded; such rows are left out of that attribute's report)
+    - outcomes: optional labels; None marks a decision without a known outcome
+    - intersections: attribute combinations, e.g. [("age_band", "sex")]; each
+      is reported as "age_band|sex" with groups such as "25-34|F"
+    - min_cell_size: groups with fewer decisions are suppressed (listed by name
+      only), and error rates need as many labeled decisions
+
+    Each column is encoded once and every report is a single `np.bincount` over
+    the encoded rows, so the cost is O(n) per report whatever the number of groups.
+    Intersections only count the combinations that occur, not the full cross-product.
+    """
+    n_rows = len(decisions)
+    for a, values in sensitive_attributes.items():
+        if len(values) != n_rows:
+            raise ValueError(f"sensitive attribute {a!r} has {len(values)} values, expected {n_rows}")
+    if outcomes is not None and len(outcomes) != n_rows:
+        raise ValueError("outcomes length must match decisions length")
+    for combo in intersections:
+        missing = [a for a in combo if a not in sensitive_attributes]
+        if len(combo) < 2 or missing:
+            raise ValueError(f"Invalid intersection {tuple(combo)!r}: needs two or more known attributes")
+
+    cell_codes = cells_from_rows(decisions, outcomes)
+    encoded = {a: _factorize(values) for a, values in sensitive_attributes.items()}
+    reports: Dict[str, FairnessReport] = {}
+    for a, (labels, codes) in encoded.items():
+        cells = _cell_table(codes, cell_codes, len(labels))
+        reports[a] = _report_from_cells(
+            a, labels, cells, with_outcomes=outcomes is not None, min_cell_size=min_cell_size
+        )
+    for combo in intersections:
+        # Mixed-radix code over the attributes' codes (-1 if any of them is missing), refactorized
+        # after each attribute so only combinations present in the rows get a cell.
+        codes = np.zeros(n_rows, dtype=np.intp)
+        parts = np.zeros((1, 0), dtype=np.intp)  # each observed combination's per-attribute codes
+        for a in combo:
+            radix, a_codes = len(encoded[a][0]), encoded[a][1]
+            valid = (codes >= 0) & (a_codes >= 0)
+            observed, inverse = np.unique(codes[valid] * radix + a_codes[valid], return_inverse=True)
+            parts = np.column_stack([parts[observed // radix], observed % radix])
+            codes = np.full(n_rows, -1, dtype=np.intp)
+            codes[valid] = inverse.ravel()
+        labels = [
+            INTERSECTION_SEP.join(encoded[a][0][c] for a, c in zip(combo, row, strict=True)) for row in parts.tolist()
+        ]
+        name = INTERSECTION_SEP.join(combo)
+        cells = _cell_table(codes, cell_codes, len(labels))
+        reports[name] = _report_from_cells(
+            name, labels, cells, with_outcomes=outcomes is not None, min_cell_size=min_cell_size
+        )
+
+    return {
+        "n_decisions": n_rows,
+        "min_cell_size": min_cell_size,
+        "reports": {
+            name: {
+                "attribute": r.attribute,
+                "groups": r.groups,
+                "group_sizes": r.group_sizes,
+                "selection_rates": r.selection_rates,
+                "disparate_impact_pairs": r.disparate_impact_pairs,
+                "error_rates": r.error_rates,
+                "suppressed_groups": r.suppressed_groups,
+            }
+            for name, r in reports.items()
+        },
+    }
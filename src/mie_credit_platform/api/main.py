@@ -1,39 +1,154 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import os
+import threading
+import zlib
+from collections import Counter
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
-from fastapi import Depends, FastAPI, HTTPException, Request
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
-from mie_credit_platform.audit import AuditEvent, AuditLogger, build_redactor_from_settings, now_ts
-from mie_credit_platform.api.middleware import get_or_create_request_id
+from mie_credit_platform import serialization
+from mie_credit_platform.audit import (
+    AuditEvent,
+    AuditLogger,
+    StoredAuditEvent,
+    build_audit_logger_from_settings,
+    decode_cursor,
+    next_cursor,
+    now_ts,
+)
+from mie_credit_platform.api.middleware import (
+    MetricsMiddleware,
+    build_api_metrics,
+    get_or_create_request_id,
+    start_stage_timer,
+)
+from mie_credit_platform.api.responses import FastJSONResponse
 from mie_credit_platform.api.security import require_api_key
+from mie_credit_platform.fairness_ledger import (
+    SCORE_EVENT_TYPE,
+    FairnessLedger,
+    FairnessLedgerSaver,
+    outcome_event,
+)
+from mie_credit_platform.governance.manifest import get_manifest
+from mie_credit_platform.governance.model_cache import ModelCache
 from mie_credit_platform.governance.registry import list_models, load_approved_model
+from mie_credit_platform.governance.reloader import ModelReloader, warm_model_package
+from mie_credit_platform.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
 from mie_credit_platform.modeling.fairness import (
-    demographic_parity_difference,
-    equal_opportunity_difference,
-    selection_rates_by_group,
-    tpr_by_group,
+    FairnessMetrics,
+    bootstrap_intervals,
+    compute_fairness_metrics,
 )
 from mie_credit_platform.modeling.schemas import (
     AuditEventListResponse,
     AuditEventRecord,
     ExplainRequest,
     ExplainResponse,
+    FairnessIntervalsResponse,
     FairnessReportRequest,
     FairnessReportResponse,
+    FairnessWindowResponse,
     FeatureContribution,
+    OutcomeRequest,
+    OutcomeResponse,
+    ScoreBatchItem,
+    ScoreBatchRequest,
+    ScoreBatchResponse,
     ScoreRequest,
     ScoreResponse,
 )
-from mie_credit_platform.modeling.scoring import score_applicant
+from mie_credit_platform.modeling.model_io import ModelPackage
+from mie_credit_platform.modeling.scoring import score_applicant, score_applicants_batch
 from mie_credit_platform.settings import Settings, get_settings
+from mie_credit_platform.shadow import ShadowRequest, ShadowScorer
 from mie_credit_platform.telemetry import configure_logging
 
+if TYPE_CHECKING:
+    from ice.fairness.bootstrap import FairnessIntervals
+
 
 logger = logging.getLogger("mie.api")
 
 
+def _ndjson_chunks(events: Iterable[StoredAuditEvent], *, gzip: bool, rows_per_chunk: int = 500) -> Iterator[bytes]:
+    """
+    Encode events as NDJSON, optionally gzip-compressed, in bounded-size chunks.
+    """
+    gz = zlib.compressobj(wbits=31) if gzip else None
+    lines: list[bytes] = []
+
+    def emit(final: bool) -> bytes:
+        data = b"".join(lines)
+        lines.clear()
+        if gz is None:
+            return data
+        return gz.compress(data) + (gz.flush() if final else b"")
+
+    for e in events:
+        lines.append(serialization.dumps(e) + b"\n")
+        if len(lines) >= rows_per_chunk:
+            chunk = emit(final=False)
+            if chunk:
+                yield chunk
+    chunk = emit(final=True)
+    if chunk:
+        yield chunk
+
+
+def _intervals_response(ci: FairnessIntervals | None) -> FairnessIntervalsResponse | None:
+    if ci is None:
+        return None
+    return FairnessIntervalsResponse(
+        method=ci.method,
+        n_replicates=ci.n_replicates,
+        confidence=ci.confidence,
+        reference=ci.reference,
+        selection_rate_by_group=ci.selection_rates,
+        disparate_impact_by_group=ci.disparate_impact,
+        tpr_by_group=ci.tpr,
+        fpr_by_group=ci.fpr,
+        demographic_parity_difference=ci.demographic_parity_difference,
+        equal_opportunity_difference=ci.tpr_gap,
+        fpr_difference=ci.fpr_gap,
+    )
+
+
+def _window_response(
+    fm: FairnessMetrics,
+    *,
+    attribute: str,
+    model_version: str | None,
+    since_ts: float | None,
+    until_ts: float | None,
+    intervals: FairnessIntervals | None = None,
+) -> FairnessWindowResponse:
+    return FairnessWindowResponse(
+        groups=fm.groups,
+        demographic_parity_difference=fm.demographic_parity_difference,
+        equal_opportunity_difference=fm.equal_opportunity_difference,
+        selection_rate_by_group=fm.selection_rate,
+        tpr_by_group=fm.tpr,
+        fpr_by_group=fm.fpr,
+        precision_by_group=fm.precision,
+        calibration_in_the_large_by_group=fm.calibration_in_the_large,
+        attribute=attribute,
+        model_version=model_version,
+        since_ts=since_ts,
+        until_ts=until_ts,
+        n_decisions_by_group=dict(zip(fm.groups, fm.counts.n.tolist(), strict=True)),
+        n_labeled_by_group=dict(zip(fm.groups, fm.counts.labeled.tolist(), strict=True)),
+        confidence_intervals=_intervals_response(intervals),
+    )
+
+
 def create_app() -> FastAPI:
     configure_logging()
     app = FastAPI(
@@ -41,25 +156,116 @@ def create_app() -> FastAPI:
         version="0.1.0",
         description="Open-source responsible credit evaluation scaffold (alternative data, audit, explainability).",
     )
+    metrics = build_api_metrics()
+    app.state.metrics = metrics
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
 
     @app.on_event("startup")
     def _startup() -> None:
         settings = get_settings()
         app.state.settings = settings
-        redactor = build_redactor_from_settings(settings)
-        app.state.audit = AuditLogger(settings.audit_db_path, settings.audit_jsonl_path, redactor=redactor)
-        # Load model package at startup
-        try:
-            require_approval = settings.environment.lower() != "dev"
-            app.state.model_pkg = load_approved_model(
-                settings.model_registry_dir, settings.model_version, require_approval=require_approval
+        serialization.set_backend(settings.json_backend)
+        app.state.audit = build_audit_logger_from_settings(settings, for_api=True)
+        app.state.audit.add_write_failure_listener(lambda n: metrics.audit_lost_events.inc(n))
+        path = settings.fairness_ledger_path
+        app.state.fairness_ledger = None
+        app.state.fairness_ledger_saver = None
+        if path or settings.fairness_ledger_enabled:
+            ledger = FairnessLedger.load(path) if path and os.path.exists(path) else FairnessLedger()
+            # Events stored since the last save (or all of them, without one) before new ones arrive.
+            n_caught_up = ledger.catch_up(app.state.audit)
+            logger.info(
+                "fairness_ledger_caught_up", extra={"n_events": n_caught_up, "watermark_ts": ledger.watermark_ts}
+            )
+            app.state.fairness_ledger = ledger
+            app.state.audit.add_listener(ledger.observe)
+        if path:
+            app.state.fairness_ledger_saver = FairnessLedgerSaver(
+                ledger, path, interval_s=settings.fairness_ledger_save_interval_s
             )
-        except Exception as e:
+            app.state.fairness_ledger_saver.start()
+        # Serializes the "already labeled?" check with the write that labels.
+        app.state.outcomes_lock = threading.Lock()
+        # Load model package at startup; the reloader keeps app.state.model_pkg current afterwards.
+        app.state.model_pkg = None
+        require_approval = settings.environment.lower() != "dev"
+        # Other versions named per request are served from a bounded LRU.
+        app.state.model_cache = ModelCache(
+            settings.model_registry_dir,
+            require_approval=require_approval,
+            max_entries=settings.model_cache_max_entries,
+            max_bytes=settings.model_cache_max_bytes,
+        )
+        reloader = ModelReloader(
+            settings.model_registry_dir,
+            settings.model_version,
+            require_approval=require_approval,
+            on_swap=lambda pkg: setattr(app.state, "model_pkg", pkg),
+            poll_interval_s=settings.model_reload_poll_s,
+            cache=app.state.model_cache,
+        )
+        app.state.reloader = reloader
+        reloader.check()
+        if app.state.model_pkg is None:
             # API can still start for /health and /v1/models, but scoring will fail.
-            app.state.model_pkg = None
-            logger.error("model_load_failed", extra={"error": str(e)})
+            logger.error("model_load_failed", extra={"error": reloader.status().last_error})
+        reloader.start()
 
-    @app.get("/health")
+        app.state.shadow = None
+        if settings.shadow_model_version:
+            try:
+                # Challengers are compared, never used for decisions, so approval is not required.
+                challenger = load_approved_model(
+                    settings.model_registry_dir, settings.shadow_model_version, require_approval=False
+                )
+                warm_model_package(challenger)
+                app.state.shadow = ShadowScorer(
+                    challenger,
+                    app.state.audit,
+                    threshold=settings.approval_threshold,
+                    workers=settings.shadow_workers,
+                    max_queue=settings.shadow_queue_max,
+                )
+            except Exception as e:
+                logger.error("shadow_model_load_failed", extra={"error": str(e)})
+
+    def _package_for(version: str | None) -> ModelPackage:
+        pkg = app.state.model_pkg
+        if version is None or (pkg is not None and pkg.version == version):
+            if pkg is None:
+                raise HTTPException(status_code=503, detail="Model not loaded")
+            return pkg
+        cache: ModelCache = app.state.model_cache
+        try:
+            return cache.get(version)
+        except FileNotFoundError as e:
+            raise HTTPException(status_code=404, detail=f"Model version not found: {version}") from e
+        except PermissionError as e:
+            raise HTTPException(status_code=403, detail=f"Model version {version} is not approved") from e
+
+    @app.on_event("shutdown")
+    def _shutdown() -> None:
+        reloader = getattr(app.state, "reloader", None)
+        if reloader is not None:
+            reloader.stop()
+        saver = getattr(app.state, "fairness_ledger_saver", None)
+        if saver is not None:
+            saver.stop()
+        shadow = getattr(app.state, "shadow", None)
+        if shadow is not None:
+            # Finish queued comparisons before the audit writer drains.
+            shadow.close()
+        audit = getattr(app.state, "audit", None)
+        if audit is not None:
+            # Drain the background writer so no queued audit events are lost.
+            audit.close()
+        ledger = getattr(app.state, "fairness_ledger", None)
+        path = getattr(getattr(app.state, "settings", None), "fairness_ledger_path", None)
+        if ledger is not None and path:
+            # After the audit writer drained, so every persisted event is counted.
+            ledger.save(path)
+
+    @app.get("/health", response_class=FastJSONResponse)
     def health() -> dict[str, Any]:
         settings: Settings = app.state.settings
         redactor = getattr(getattr(app.state, "audit", None), "redactor", None)
@@ -68,6 +274,7 @@ def create_app() -> FastAPI:
             "environment": settings.environment,
             "model_version": settings.model_version,
             "model_loaded": app.state.model_pkg is not None,
+            "loaded_model_version": getattr(app.state.model_pkg, "version", None),
             "audit_redaction": {
                 "allow_payload_keys": sorted(redactor.allow_payload_keys) if redactor else None,
                 "hash_applicant_id": getattr(redactor, "hash_applicant_id", None),
@@ -75,24 +282,76 @@ def create_app() -> FastAPI:
             },
         }
 
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics() -> Response:
+        return Response(content=metrics.registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+    # (etag, encoded body) of the last /v1/models response; rebuilt only when the manifest changes.
+    def _version_label(version: str | None) -> str | None:
+        # A caller-supplied version becomes a metric label only if the registry has it,
+        # so query strings cannot add time series without bound.
+        if version is None:
+            return None
+        settings: Settings = app.state.settings
+        return version if get_manifest(settings.model_registry_dir).entry(version) is not None else "other"
+
+    models_cache: dict[str, tuple[str, bytes]] = {}
+
     @app.get("/v1/models", dependencies=[Depends(require_api_key)])
-    def models() -> dict[str, Any]:
+    def models(request: Request) -> Response:
         settings: Settings = app.state.settings
-        return {
-            "registry_dir": settings.model_registry_dir,
-            "active_model_version": settings.model_version,
-            "models": [m.__dict__ for m in list_models(settings.model_registry_dir)],
-        }
+        manifest = get_manifest(settings.model_registry_dir)
+        active = app.state.reloader.active_version()
+        etag = f'"{manifest.etag}-{active}"'
+        cached = models_cache.get("models")
+        if cached is None or cached[0] != etag:
+            body = {
+                "registry_dir": settings.model_registry_dir,
+                "active_model_version": active,
+                "models": [m.__dict__ for m in list_models(settings.model_registry_dir)],
+            }
+            cached = (etag, serialization.dumps(body))
+            models_cache["models"] = cached
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in {t.strip() for t in request.headers.get("if-none-match", "").split(",")}:
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached[1], media_type="application/json", headers=headers)
+
+    @app.get("/v1/admin/model/reload", dependencies=[Depends(require_api_key)], response_class=FastJSONResponse)
+    def model_reload_status() -> dict[str, Any]:
+        return asdict(app.state.reloader.status())
+
+    @app.post("/v1/admin/model/reload", dependencies=[Depends(require_api_key)], response_class=FastJSONResponse)
+    def model_reload(force: bool = False) -> dict[str, Any]:
+        """
+        Check the registry now and hot-swap the model if it changed (or unconditionally with `force`).
+        """
+        reloader: ModelReloader = app.state.reloader
+        swapped = reloader.check(force=force)
+        return {"reloaded": swapped, **asdict(reloader.status())}
+
+    @app.get("/v1/admin/model/cache", dependencies=[Depends(require_api_key)], response_class=FastJSONResponse)
+    def model_cache_stats() -> dict[str, Any]:
+        return asdict(app.state.model_cache.stats())
+
+    @app.get("/v1/shadow/summary", dependencies=[Depends(require_api_key)], response_class=FastJSONResponse)
+    def shadow_summary() -> dict[str, Any]:
+        shadow: ShadowScorer | None = app.state.shadow
+        if shadow is None:
+            raise HTTPException(status_code=404, detail="Shadow scoring is not configured")
+        return shadow.summary()
 
     @app.post("/v1/score", response_model=ScoreResponse, dependencies=[Depends(require_api_key)])
     def score(req: ScoreRequest, request: Request) -> ScoreResponse:
+        timer = start_stage_timer(request)
+        timer.mark("validate")
         rid = get_or_create_request_id(request)
         settings: Settings = app.state.settings
-        pkg = app.state.model_pkg
-        if pkg is None:
-            raise HTTPException(status_code=503, detail="Model not loaded")
+        pkg = _package_for(req.model_version)
+        timer.mark("model_lookup")
 
-        result, explanation = score_applicant(pkg, req.features.model_dump(), settings.approval_threshold)
+        features = req.features.model_dump()
+        result, explanation = score_applicant(pkg, features, settings.approval_threshold, timer=timer)
 
         # Audit event (minimal by default)
         payload: dict[str, Any] = {
@@ -101,9 +360,9 @@ def create_app() -> FastAPI:
             "reason_codes": result.reason_codes,
         }
         if settings.audit_log_request_bodies:
-            payload["features"] = req.features.model_dump()
-            if req.audit_context is not None:
-                payload["audit_context"] = req.audit_context.model_dump()
+            payload["features"] = features
+        if req.audit_context is not None and (settings.audit_log_request_bodies or settings.audit_log_audit_context):
+            payload["audit_context"] = req.audit_context.model_dump()
         app.state.audit.write(
             AuditEvent(
                 ts=now_ts(),
@@ -114,7 +373,25 @@ def create_app() -> FastAPI:
                 payload=payload,
             )
         )
+        timer.mark("audit")
 
+        if app.state.shadow is not None:
+            app.state.shadow.submit(
+                [
+                    ShadowRequest(
+                        request_id=rid,
+                        applicant_id=req.applicant_id,
+                        features=features,
+                        champion_version=pkg.version,
+                        champion_score=result.score,
+                        champion_decision=result.decision,
+                    )
+                ]
+            )
+            timer.mark("shadow")
+
+        metrics.decisions.inc(endpoint="score", model_version=pkg.version, decision=result.decision)
+        timer.finish(endpoint="score", model_version=pkg.version)
         return ScoreResponse(
             request_id=rid,
             model_version=pkg.version,
@@ -123,14 +400,120 @@ def create_app() -> FastAPI:
             reason_codes=result.reason_codes,
         )
 
+    @app.post("/v1/score:batch", response_model=ScoreBatchResponse, dependencies=[Depends(require_api_key)])
+    def score_batch(req: ScoreBatchRequest, request: Request) -> ScoreBatchResponse:
+        timer = start_stage_timer(request)
+        timer.mark("validate")
+        rid = get_or_create_request_id(request)
+        settings: Settings = app.state.settings
+        # Resolved only for the items that use it, so a missing active model fails just those.
+        default_version = req.model_version or getattr(app.state.model_pkg, "version", None)
+
+        results: list[ScoreBatchItem | None] = [None] * len(req.items)
+        by_version: dict[str | None, list[tuple[int, ScoreRequest]]] = {}
+        for i, item in enumerate(req.items):
+            try:
+                r = ScoreRequest.model_validate(item)
+            except ValidationError as e:
+                applicant_id = item.get("applicant_id") if isinstance(item, dict) else None
+                results[i] = ScoreBatchItem(
+                    index=i,
+                    applicant_id=applicant_id if isinstance(applicant_id, str) else None,
+                    errors=[{"loc": list(err["loc"]), "msg": err["msg"], "type": err["type"]} for err in e.errors()],
+                )
+                continue
+            by_version.setdefault(r.model_version or default_version, []).append((i, r))
+        # Items are validated one by one so a bad item fails alone.
+        timer.mark("validate_items")
+
+        ts = now_ts()
+        log_context = settings.audit_log_request_bodies or settings.audit_log_audit_context
+        events: list[AuditEvent] = []
+        shadow_requests: list[ShadowRequest] = []
+        n_scored = 0
+        for version, valid in by_version.items():
+            try:
+                pkg = _package_for(version)
+            except HTTPException as e:
+                # An unknown or unapproved version fails only the items that asked for it.
+                for i, r in valid:
+                    results[i] = ScoreBatchItem(
+                        index=i,
+                        applicant_id=r.applicant_id,
+                        model_version=version,
+                        errors=[{"loc": ["model_version"], "msg": e.detail, "type": "model_unavailable"}],
+                    )
+                continue
+            features_rows = [r.features.model_dump() for _, r in valid]
+            timer.mark("model_lookup")
+            scored = score_applicants_batch(pkg, features_rows, settings.approval_threshold, timer=timer)
+            n_scored += len(valid)
+            for decision, n in Counter(result.decision for result, _ in scored).items():
+                metrics.decisions.inc(n, endpoint="score_batch", model_version=pkg.version, decision=decision)
+            for (i, r), features, (result, _) in zip(valid, features_rows, scored, strict=True):
+                shadow_requests.append(
+                    ShadowRequest(
+                        request_id=rid,
+                        applicant_id=r.applicant_id,
+                        features=features,
+                        champion_version=pkg.version,
+                        champion_score=result.score,
+                        champion_decision=result.decision,
+                    )
+                )
+                results[i] = ScoreBatchItem(
+                    index=i,
+                    applicant_id=r.applicant_id,
+                    model_version=pkg.version,
+                    score=result.score,
+                    decision=result.decision,
+                    reason_codes=result.reason_codes,
+                )
+                payload: dict[str, Any] = {
+                    "score": result.score,
+                    "decision": result.decision,
+                    "reason_codes": result.reason_codes,
+                }
+                if settings.audit_log_request_bodies:
+                    payload["features"] = features
+                if r.audit_context is not None and log_context:
+                    payload["audit_context"] = r.audit_context.model_dump()
+                events.append(
+                    AuditEvent(
+                        ts=ts,
+                        request_id=rid,
+                        event_type="score",
+                        model_version=pkg.version,
+                        applicant_id=r.applicant_id,
+                        payload=payload,
+                    )
+                )
+            timer.mark("build_results")
+        # One transaction for the whole batch
+        app.state.audit.write_many(events)
+        timer.mark("audit")
+        if app.state.shadow is not None:
+            app.state.shadow.submit(shadow_requests)
+            timer.mark("shadow")
+
+        timer.finish(endpoint="score_batch", model_version=default_version)
+        return ScoreBatchResponse(
+            request_id=rid,
+            model_version=default_version,
+            n_scored=n_scored,
+            n_failed=len(req.items) - n_scored,
+            results=[r for r in results if r is not None],
+        )
+
     @app.post("/v1/explain", response_model=ExplainResponse, dependencies=[Depends(require_api_key)])
     def explain(req: ExplainRequest, request: Request) -> ExplainResponse:
+        timer = start_stage_timer(request)
+        timer.mark("validate")
         rid = get_or_create_request_id(request)
         settings: Settings = app.state.settings
-        pkg = app.state.model_pkg
-        if pkg is None:
-            raise HTTPException(status_code=503, detail="Model not loaded")
-        _, explanation = score_applicant(pkg, req.features.model_dump(), settings.approval_threshold)
+        pkg = _package_for(req.model_version)
+        timer.mark("model_lookup")
+        _, explanation = score_applicant(pkg, req.features.model_dump(), settings.approval_threshold, timer=timer)
         contrib = [
             FeatureContribution(**row) for row in explanation.get("contributions", []) if isinstance(row, dict)
         ]
@@ -150,41 +533,215 @@ def create_app() -> FastAPI:
                 payload=audit_payload,
             )
         )
+        timer.mark("audit")
+        timer.finish(endpoint="explain", model_version=pkg.version)
         return ExplainResponse(
             request_id=rid, model_version=pkg.version, score=score, base_value=base, contributions=contrib
         )
 
     @app.post("/v1/audit/fairness", response_model=FairnessReportResponse, dependencies=[Depends(require_api_key)])
     def fairness(req: FairnessReportRequest, request: Request) -> FairnessReportResponse:
+        timer = start_stage_timer(request)
+        timer.mark("validate")
         rid = get_or_create_request_id(request)
-        groups = [r.protected_group for r in req.rows]
-        y_true = [r.y_true for r in req.rows]
-        y_pred = [r.y_pred for r in req.rows]
-        sel = selection_rates_by_group(groups, y_pred, positive_label=req.positive_label)
-        tpr = tpr_by_group(groups, y_true, y_pred, positive_label=req.positive_label)
+        # List comprehensions are the cheapest way out of pydantic rows; the engine converts once.
+        fm = compute_fairness_metrics(
+            [r.protected_group for r in req.rows],
+            np.array([r.y_true for r in req.rows], dtype=np.int8),
+            np.array([r.y_pred for r in req.rows], dtype=np.int8),
+            positive_label=req.positive_label,
+        )
+        ci = None
+        if req.n_bootstrap:
+            ci = bootstrap_intervals(
+                fm.counts,
+                n_replicates=req.n_bootstrap,
+                confidence=req.confidence,
+                seed=req.bootstrap_seed,
+                method=req.bootstrap_method,
+            )
         out = FairnessReportResponse(
-            groups=sorted(set(groups)),
-            demographic_parity_difference=demographic_parity_difference(sel),
-            equal_opportunity_difference=equal_opportunity_difference(tpr),
-            selection_rate_by_group=sel,
-            tpr_by_group=tpr,
+            groups=fm.groups,
+            demographic_parity_difference=fm.demographic_parity_difference,
+            equal_opportunity_difference=fm.equal_opportunity_difference,
+            selection_rate_by_group=fm.selection_rate,
+            tpr_by_group=fm.tpr,
+            fpr_by_group=fm.fpr,
+            precision_by_group=fm.precision,
+            calibration_in_the_large_by_group=fm.calibration_in_the_large,
+            confidence_intervals=_intervals_response(ci),
         )
+        timer.mark("compute")
+        model_version = getattr(app.state.model_pkg, "version", None) if app.state.model_pkg else None
         # Audit fairness (aggregate only)
         app.state.audit.write(
             AuditEvent(
                 ts=now_ts(),
                 request_id=rid,
                 event_type="fairness_report",
-                model_version=getattr(app.state.model_pkg, "version", None) if app.state.model_pkg else None,
+                model_version=model_version,
                 applicant_id=None,
                 payload={
                     "n_rows": len(req.rows),
                     "positive_label": req.positive_label,
+                    "n_bootstrap": req.n_bootstrap,
+                    "demographic_parity_difference": out.demographic_parity_difference,
+                    "equal_opportunity_difference": out.equal_opportunity_difference,
+                },
+            )
+        )
+        timer.mark("audit")
+        timer.finish(endpoint="fairness", model_version=model_version)
+        return out
+
+    def _stored_applicant_id(applicant_id: str) -> str | None:
+        # Score events store the redacted (usually hashed) id; None when ids are removed.
+        redactor = app.state.audit.redactor
+        if redactor is None:
+            return applicant_id
+        probe = AuditEvent(
+            ts=0.0, request_id="", event_type="", model_version=None, applicant_id=applicant_id, payload={}
+        )
+        return redactor.redact_event(probe).applicant_id
+
+    @app.post("/v1/outcomes", response_model=OutcomeResponse, dependencies=[Depends(require_api_key)])
+    def record_outcomes(req: OutcomeRequest, request: Request) -> OutcomeResponse:
+        """
+        Label scored decisions with their observed outcome; each decision is labeled at most once.
+
+        Duplicates are rejected within this process, queued (async) writes included.
+        Several API processes sharing one audit store can still race on the same decision.
+        """
+        timer = start_stage_timer(request)
+        timer.mark("validate")
+        audit: AuditLogger = app.state.audit
+        ts = now_ts()
+        matched: list[tuple[int, StoredAuditEvent]] = []
+        unmatched: list[int] = []
+        with app.state.outcomes_lock:
+            # Queued score and outcome events must be visible to the lookups below.
+            audit.flush()
+            for i, o in enumerate(req.outcomes):
+                # Batch items share a request id, so the applicant narrows it to one decision.
+                matches = audit.query(
+                    limit=2,
+                    request_id=o.request_id,
+                    event_type=SCORE_EVENT_TYPE,
+                    applicant_id=_stored_applicant_id(o.applicant_id),
+                )
+                if len(matches) != 1:
+                    unmatched.append(i)
+                    continue
+                matched.append((i, matches[0]))
+            labeled = audit.labeled_score_event_ids(
+                (e.id for _, e in matched), since_ts=min((e.ts for _, e in matched), default=None)
+            )
+            events: list[AuditEvent] = []
+            for i, score_event in matched:
+                if score_event.id in labeled:
+                    # Already labeled; counting it twice would skew the ledger.
+                    unmatched.append(i)
+                    continue
+                labeled.add(score_event.id)
+                events.append(outcome_event(score_event, req.outcomes[i].outcome, ts=ts))
+            timer.mark("lookup")
+            audit.write_many(events)
+        timer.mark("audit")
+        timer.finish(endpoint="outcomes", model_version=None)
+        return OutcomeResponse(n_recorded=len(events), unmatched=sorted(unmatched))
+
+    @app.get(
+        "/v1/audit/fairness/live",
+        response_model=FairnessWindowResponse,
+        dependencies=[Depends(require_api_key)],
+    )
+    def fairness_live(
+        request: Request,
+        attribute: str,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        days: int | None = None,
+        model_version: str | None = None,
+    ) -> FairnessWindowResponse:
+        """
+        Fairness for decisions in a window of UTC days, read from the incremental ledger.
+
+        `days=N` is the last N UTC days including today (cannot be combined with `since_ts`).
+        """
+        timer = start_stage_timer(request)
+        timer.mark("validate")
+        ledger: FairnessLedger | None = app.state.fairness_ledger
+        if ledger is None:
+            raise HTTPException(status_code=404, detail="Live fairness is not configured")
+        if attribute not in ledger.attributes:
+            raise HTTPException(status_code=400, detail=f"Unknown attribute {attribute!r}; expected one of {ledger.attributes}")
+        if days is not None:
+            if since_ts is not None or days < 1:
+                raise HTTPException(status_code=400, detail="days must be >= 1 and cannot be combined with since_ts")
+            since_ts = now_ts() - (days - 1) * 86400.0
+        fm = ledger.window(attribute, since_ts=since_ts, until_ts=until_ts, model_version=model_version).metrics()
+        timer.mark("compute")
+        timer.finish(endpoint="fairness_live", model_version=_version_label(model_version))
+        return _window_response(fm, attribute=attribute, model_version=model_version, since_ts=since_ts, until_ts=until_ts)
+
+    @app.get(
+        "/v1/audit/fairness/report",
+        response_model=FairnessWindowResponse,
+        dependencies=[Depends(require_api_key)],
+    )
+    def fairness_report(
+        request: Request,
+        attribute: str,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        model_version: str | None = None,
+        n_bootstrap: int = Query(default=0, ge=0, le=10_000),
+        bootstrap_seed: int | None = None,
+    ) -> FairnessWindowResponse:
+        """
+        Fairness for decisions in `[since_ts, until_ts]`, aggregated inside the audit store.
+
+        Unlike `POST /v1/audit/fairness` no rows are uploaded; unlike `/live` the
+        window is exact to the second and does not depend on the process' ledger.
+        `n_bootstrap > 0` adds 95% bootstrap intervals drawn from the aggregated counts.
+        """
+        timer = start_stage_timer(request)
+        timer.mark("validate")
+        rid = get_or_create_request_id(request)
+        try:
+            acc = app.state.audit.fairness_counts(
+                attribute, since_ts=since_ts, until_ts=until_ts, model_version=model_version
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        timer.mark("aggregate")
+        fm = acc.metrics()
+        ci = None
+        if n_bootstrap:
+            try:
+                ci = bootstrap_intervals(fm.counts, n_replicates=n_bootstrap, seed=bootstrap_seed)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+        out = _window_response(
+            fm, attribute=attribute, model_version=model_version, since_ts=since_ts, until_ts=until_ts, intervals=ci
+        )
+        timer.mark("compute")
+        app.state.audit.write(
+            AuditEvent(
+                ts=now_ts(),
+                request_id=rid,
+                event_type="fairness_report",
+                model_version=model_version,
+                applicant_id=None,
+                payload={
+                    "n_rows": int(fm.counts.n.sum()),
                     "demographic_parity_difference": out.demographic_parity_difference,
                     "equal_opportunity_difference": out.equal_opportunity_difference,
                 },
             )
         )
+        timer.mark("audit")
+        timer.finish(endpoint="fairness_report", model_version=_version_label(model_version))
         return out
 
     @app.get(
@@ -193,8 +750,10 @@ def create_app() -> FastAPI:
         dependencies=[Depends(require_api_key)],
     )
     def list_audit_events(
+        request: Request,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
         since_ts: float | None = None,
         until_ts: float | None = None,
         request_id: str | None = None,
@@ -202,6 +761,8 @@ def create_app() -> FastAPI:
         applicant_id: str | None = None,
         model_version: str | None = None,
     ) -> AuditEventListResponse:
+        timer = start_stage_timer(request)
+        timer.mark("validate")
         audit: AuditLogger = app.state.audit
         total = audit.count(
             since_ts=since_ts,
@@ -211,22 +772,66 @@ def create_app() -> FastAPI:
             applicant_id=applicant_id,
             model_version=model_version,
         )
-        events = audit.query(
+        timer.mark("count")
+        try:
+            events = audit.query(
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                since_ts=since_ts,
+                until_ts=until_ts,
+                request_id=request_id,
+                event_type=event_type,
+                applicant_id=applicant_id,
+                model_version=model_version,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        timer.mark("query")
+        limit = max(1, min(int(limit), 1000))
+        # The model_version label is the filter, if any.
+        timer.finish(endpoint="audit_events", model_version=_version_label(model_version))
+        return AuditEventListResponse(
+            total=total,
             limit=limit,
-            offset=offset,
+            offset=max(0, int(offset)),
+            events=[AuditEventRecord(**e.__dict__) for e in events],
+            next_cursor=next_cursor(events, limit),
+        )
+
+    @app.get("/v1/audit/export", dependencies=[Depends(require_api_key)])
+    def export_audit_events(
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        request_id: str | None = None,
+        event_type: str | None = None,
+        applicant_id: str | None = None,
+        model_version: str | None = None,
+        cursor: str | None = None,
+        gzip: bool = False,
+    ) -> StreamingResponse:
+        """
+        Stream all matching audit events as NDJSON (newest first) from one server-side cursor.
+        """
+        if cursor:
+            try:
+                decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e)) from e
+        audit: AuditLogger = app.state.audit
+        events = audit.iter_events(
             since_ts=since_ts,
             until_ts=until_ts,
             request_id=request_id,
             event_type=event_type,
             applicant_id=applicant_id,
             model_version=model_version,
+            cursor=cursor,
         )
-        return AuditEventListResponse(
-            total=total,
-            limit=max(1, min(int(limit), 1000)),
-            offset=max(0, int(offset)),
-            events=[AuditEventRecord(**e.__dict__) for e in events],
-        )
+        headers = {"Content-Disposition": 'attachment; filename="audit_events.ndjson"'}
+        if gzip:
+            headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(_ndjson_chunks(events, gzip=gzip), media_type="application/x-ndjson", headers=headers)
 
     return app
 
@@ -1,12 +1,109 @@
 from __future__ import annotations
 
+import time
 import uuid
+from dataclasses import dataclass
+from typing import Any
 
 from fastapi import Request
 
+from mie_credit_platform.metrics import Counter, Histogram, MetricsRegistry, StageTimer
+
+# Keys in the per-request ASGI `state` dict (exposed to handlers as `request.state`).
+STARTED_STATE_KEY = "mie_started"
+TIMER_STATE_KEY = "mie_stage_timer"
+
 
 def get_or_create_request_id(request: Request) -> str:
     rid = request.headers.get("X-Request-Id")
     return rid or str(uuid.uuid4())
 
 
+@dataclass(frozen=True)
+class ApiMetrics:
+    registry: MetricsRegistry
+    requests: Counter
+    request_duration: Histogram
+    stage_duration: Histogram
+    decisions: Counter
+    audit_lost_events: Counter
+
+
+def build_api_metrics(registry: MetricsRegistry | None = None) -> ApiMetrics:
+    registry = registry or MetricsRegistry()
+    return ApiMetrics(
+        registry=registry,
+        requests=registry.counter(
+            "mie_http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status")
+        ),
+        request_duration=registry.histogram(
+            "mie_http_request_duration_seconds",
+            "Time from receiving the request to sending the last response byte.",
+            ("method", "route"),
+        ),
+        stage_duration=registry.histogram(
+            "mie_request_stage_duration_seconds",
+            "Time spent per handler stage (validate = body parsing, pydantic validation and auth).",
+            ("endpoint", "stage", "model_version"),
+        ),
+        decisions=registry.counter(
+            "mie_decisions_total", "Scored applicants by decision.", ("endpoint", "model_version", "decision")
+        ),
+        audit_lost_events=registry.counter(
+            "mie_audit_lost_events_total", "Audit events the background writer gave up on after retrying."
+        ),
+    )
+
+
+def start_stage_timer(request: Request) -> StageTimer:
+    """
+    Stage timer for this request, starting when the metrics middleware first saw it.
+
+    The first `mark` therefore covers everything before the handler body ran.
+    """
+    timer = StageTimer(request.scope.get("state", {}).get(STARTED_STATE_KEY))
+    setattr(request.state, TIMER_STATE_KEY, timer)
+    return timer
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request counts and latency per route template.
+
+    When the handler finished a stage timer, the time between the handler
+    returning and the response headers being sent is recorded as its
+    `serialize` stage, and all stages are flushed to `stage_duration`.
+    """
+
+    def __init__(self, app: Any, metrics: ApiMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        state = scope.setdefault("state", {})
+        state[STARTED_STATE_KEY] = started
+        status = 500
+
+        async def send_wrapper(message: dict[str, Any]) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timer: StageTimer | None = state.get(TIMER_STATE_KEY)
+                if timer is not None and timer.labels is not None:
+                    timer.mark("serialize")
+                    timer.observe(self.metrics.stage_duration, **timer.labels)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            # Unmatched paths share one label value to keep cardinality bounded.
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope.get("method", "")
+            self.metrics.requests.inc(method=method, route=path, status=status)
+            self.metrics.request_duration.observe(time.perf_counter() - started, method=method, route=path)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from mie_credit_platform import serialization
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with the configured serializer (orjson when installed).
+
+    Only for endpoints returning plain dicts: routes with a `response_model` are
+    already serialized straight to bytes by pydantic, and giving them a custom
+    response class would turn that off.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return serialization.dumps(content)
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import logging
+import math
 import os
+import queue
+import re
 import sqlite3
+import threading
 import time
-from dataclasses import asdict, dataclass, replace
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from ice.audit.segments import SegmentedJsonlWriter, ts_index_key
+from mie_credit_platform import serialization
+
+if TYPE_CHECKING:
+    from mie_credit_platform.modeling.fairness import FairnessAccumulator
 
 logger = logging.getLogger("mie.audit")
 
+SCORE_EVENT_TYPE = "score"
+OUTCOME_EVENT_TYPE = "outcome"
+
 
 @dataclass(frozen=True)
 class AuditEvent:
@@ -23,6 +39,12 @@ class AuditEvent:
     payload: dict[str, Any]
 
 
+# Called with batches of redacted, persisted events (see `AuditLogger.add_listener`).
+AuditListener = Callable[[list[AuditEvent]], None]
+# Called with the number of events the background writer gave up on.
+WriteFailureListener = Callable[[int], None]
+
+
 @dataclass(frozen=True)
 class StoredAuditEvent(AuditEvent):
     """
@@ -54,6 +76,16 @@ def _default_allow_payload_keys() -> set[str]:
         "tpr_by_group",
         "n_rows",
         "audit_context",
+        # Outcome labels (see `fairness_ledger.outcome_event`)
+        "outcome",
+        "decision_ts",
+        "score_event_id",
+        # Shadow (challenger) comparisons
+        "champion_version",
+        "champion_score",
+        "champion_decision",
+        "score_delta",
+        "decision_flip",
     }
 
 
@@ -82,6 +114,24 @@ class PIIRedactor:
         Return a sanitized copy of the given event.
         """
 
+        return self._plan.redact_event(event)
+
+    def compile(self) -> RedactionPlan:
+        """
+        Build a `RedactionPlan` for this policy (done once and cached by `redact_event`).
+        """
+
+        return RedactionPlan(self)
+
+    @cached_property
+    def _plan(self) -> RedactionPlan:
+        return self.compile()
+
+    def _redact_event_reference(self, event: AuditEvent) -> AuditEvent:
+        """
+        Straightforward (uncompiled) redaction; the compiled plan must match it exactly.
+        """
+
         safe_payload = self._redact_payload(event.payload)
         applicant_id = None if self.remove_applicant_id else event.applicant_id
         if applicant_id is not None and self.hash_applicant_id:
@@ -130,6 +180,117 @@ class PIIRedactor:
         return h.hexdigest()
 
 
+# Payload keys that normally carry plain numbers; their values skip sanitization
+# when they are exactly int/float/bool/None.
+_SCALAR_PAYLOAD_KEYS = frozenset(
+    {
+        "score",
+        "base_value",
+        "score_from_explanation",
+        "positive_label",
+        "demographic_parity_difference",
+        "equal_opportunity_difference",
+        "n_rows",
+        "champion_score",
+        "score_delta",
+        "decision_flip",
+    }
+)
+_PASSTHROUGH_TYPES = (int, float, bool, type(None))
+
+
+class RedactionPlan:
+    """
+    Precompiled form of a `PIIRedactor` policy for the audit write hot path.
+
+    Key decisions are resolved once per key, the salt is absorbed into a sha256
+    state that is copied per value, applicant-id hashes are memoized in a bounded
+    LRU, and plain scalars bypass recursive sanitization. Output is identical to
+    `PIIRedactor._redact_event_reference`.
+    """
+
+    def __init__(self, redactor: PIIRedactor, *, applicant_id_cache_size: int = 65536) -> None:
+        self._allowed = frozenset(redactor.allow_payload_keys) if redactor.allow_payload_keys is not None else None
+        self._hashed = frozenset(redactor.hash_payload_keys or ())
+        self._drop = redactor.drop_disallowed_payload_keys
+        self._remove_applicant_id = redactor.remove_applicant_id
+        self._hash_applicant_id = redactor.hash_applicant_id
+        self._truncate_at = redactor.truncate_strings_at
+        self._max_list_items = redactor.max_list_items
+        self._salted = hashlib.sha256()
+        if redactor.hash_salt:
+            self._salted.update(str(redactor.hash_salt).encode("utf-8"))
+        self._hash_cached = lru_cache(maxsize=applicant_id_cache_size)(self._hash_value)
+
+    def redact_event(self, event: AuditEvent) -> AuditEvent:
+        safe_payload = self._redact_payload(event.payload)
+        applicant_id = None if self._remove_applicant_id else event.applicant_id
+        if applicant_id is not None and self._hash_applicant_id:
+            if type(applicant_id) is str:
+                applicant_id = self._hash_cached(applicant_id)
+            else:
+                applicant_id = self._hash_value(applicant_id)
+        if type(event) is AuditEvent:
+            return AuditEvent(
+                ts=event.ts,
+                request_id=event.request_id,
+                event_type=event.event_type,
+                model_version=event.model_version,
+                applicant_id=applicant_id,
+                payload=safe_payload,
+            )
+        return replace(event, applicant_id=applicant_id, payload=safe_payload)
+
+    def _redact_payload(self, payload: Mapping[str, Any] | None) -> dict[str, Any]:
+        if not isinstance(payload, Mapping):
+            return {}
+
+        cleaned: dict[str, Any] = {}
+        allowed = self._allowed
+        hashed = self._hashed
+        log_drops = self._drop and logger.isEnabledFor(logging.DEBUG)
+        for key, value in payload.items():
+            if type(key) is not str:
+                key = str(key)
+            if allowed is not None and key not in allowed and self._drop:
+                if log_drops:
+                    logger.debug("audit_redaction_dropped_key", extra={"key": key})
+                continue
+            if key in hashed:
+                cleaned[key] = self._hash_value(value)
+            elif key in _SCALAR_PAYLOAD_KEYS and type(value) in _PASSTHROUGH_TYPES:
+                cleaned[key] = value
+            else:
+                cleaned[key] = self._sanitize_value(value)
+        return cleaned
+
+    def _sanitize_value(self, value: Any) -> Any:
+        t = type(value)
+        if t is str:
+            return value[: self._truncate_at]
+        if t is float or t is int or t is bool or value is None:
+            return value
+        if t is list and all(type(v) is str for v in value):
+            # Common case: reason_codes.
+            n = self._truncate_at
+            return [v[:n] for v in value[: self._max_list_items]]
+        # Everything else follows the reference rules exactly.
+        if isinstance(value, (int, float, bool)):
+            return value
+        if isinstance(value, str):
+            return value[: self._truncate_at]
+        if isinstance(value, Mapping):
+            return {str(k): self._sanitize_value(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple, set)):
+            return [self._sanitize_value(v) for v in list(value)[: self._max_list_items]]
+        return str(value)[: self._truncate_at]
+
+    def _hash_value(self, value: Any) -> str:
+        h = self._salted.copy()
+        h.update(str(value).encode("utf-8"))
+        return h.hexdigest()
+
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS audit_events (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -144,59 +305,460 @@ CREATE INDEX IF NOT EXISTS idx_audit_events_request_id ON audit_events(request_i
 CREATE INDEX IF NOT EXISTS idx_audit_events_ts ON audit_events(ts);
 """
 
+# Composite indexes matching the `query`/`count` filters. Every index implicitly ends
+# with the rowid (`id`), so `WHERE col = ? ORDER BY ts DESC, id DESC` is a pure index walk.
+FILTER_INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_audit_events_event_type_ts ON audit_events(event_type, ts);
+CREATE INDEX IF NOT EXISTS idx_audit_events_model_version_ts ON audit_events(model_version, ts);
+CREATE INDEX IF NOT EXISTS idx_audit_events_applicant_id_ts ON audit_events(applicant_id, ts);
+CREATE INDEX IF NOT EXISTS idx_audit_events_request_id_ts ON audit_events(request_id, ts);
+DROP INDEX IF EXISTS idx_audit_events_request_id;
+"""
+
+# Outcome events by the score event they label, for the "already labeled?" check.
+# Partial on the event type, so queries must repeat `event_type = 'outcome'` literally.
+OUTCOME_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_audit_events_outcome_score_event_id
+  ON audit_events(json_extract(payload_json, '$.score_event_id')) WHERE event_type = 'outcome';
+"""
+
+# Ordered schema migrations; the database's `PRAGMA user_version` records how many
+# have been applied. Append new entries, never edit released ones.
+MIGRATIONS: tuple[str, ...] = (SCHEMA_SQL, FILTER_INDEXES_SQL, OUTCOME_INDEX_SQL)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Apply pending migrations, each in its own transaction. Returns the resulting schema version.
+
+    Safe to run concurrently from several processes: the version is re-checked under
+    an immediate (write) lock before each step.
+    """
+
+    for target, script in enumerate(MIGRATIONS, start=1):
+        if int(conn.execute("PRAGMA user_version").fetchone()[0]) >= target:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if int(conn.execute("PRAGMA user_version").fetchone()[0]) < target:
+                for stmt in script.split(";"):
+                    if stmt.strip():
+                        conn.execute(stmt)
+                conn.execute(f"PRAGMA user_version = {target}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+class _ConnectionManager:
+    """
+    Owns the SQLite connections for one audit database.
+
+    Writes go through a single persistent connection guarded by a lock. Reads use
+    one read-only (`mode=ro`) connection per thread, so dashboard polling never
+    opens new connections or takes the write lock. In WAL mode readers and the
+    writer do not block each other.
+    """
+
+    def __init__(self, db_path: str, *, mmap_size: int, cache_size_kib: int, busy_timeout_ms: int) -> None:
+        self.db_path = db_path
+        self._mmap_size = int(mmap_size)
+        self._cache_size_kib = int(cache_size_kib)
+        self._busy_timeout_ms = int(busy_timeout_ms)
+        self._write_lock = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+    def _tune(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        conn.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
+        conn.execute(f"PRAGMA cache_size=-{self._cache_size_kib}")
+        conn.execute(f"PRAGMA mmap_size={self._mmap_size}")
+        return conn
+
+    def open_writer(self) -> sqlite3.Connection:
+        """
+        Open a new tuned read-write connection (caller owns it).
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return self._tune(conn)
+
+    @contextmanager
+    def writing(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self.open_writer()
+            yield self._writer
+
+    def open_reader(self) -> sqlite3.Connection:
+        """
+        Open a new tuned read-only connection (caller owns it).
+        """
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        return self._tune(sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None))
+
+    def reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can release it; each thread uses its own.
+            conn = self.open_reader()
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        self._local = threading.local()
+
+
+_STOP = object()
+
+
+@dataclass
+class _PreparedBatch:
+    """
+    Redacted events and their serialized payloads, grouped by target database.
+
+    `pending` holds the groups not committed yet, so a retried commit never
+    inserts a group twice; `stored` collects the committed events with their ids.
+    """
+
+    events: list[AuditEvent]
+    payloads: list[str]
+    pending: dict[str, tuple[list[AuditEvent], list[str]]]
+    stored: list[StoredAuditEvent] = field(default_factory=list)
+
+    def n_pending(self) -> int:
+        return sum(len(events) for events, _ in self.pending.values())
+
+
+class _GroupCommitWriter:
+    """
+    Drains a bounded queue of audit events on a dedicated thread.
+
+    Events are committed in one transaction once `batch_size` events are pending
+    or `max_delay_ms` has passed since the first pending event, whichever comes
+    first. Producers block when the queue is full (backpressure).
+
+    A failed commit is retried `max_retries` times with exponential backoff.
+    Events still not committed then are counted as lost: logged, reported to
+    the logger's write failure listeners and returned by the next `flush()`.
+    """
+
+    def __init__(
+        self,
+        logger_: Any,
+        *,
+        max_queue: int,
+        batch_size: int,
+        max_delay_ms: float,
+        enqueue_timeout_s: float | None,
+        max_retries: int = 3,
+        retry_backoff_s: float = 0.05,
+    ) -> None:
+        self._audit = logger_
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._batch_size = max(1, int(batch_size))
+        self._max_delay_s = max(0.0, float(max_delay_ms)) / 1000.0
+        self._enqueue_timeout_s = enqueue_timeout_s
+        self._max_retries = max(0, int(max_retries))
+        self._retry_backoff_s = max(0.0, float(retry_backoff_s))
+        self._stats_lock = threading.Lock()
+        self.lost_events = 0
+        self.failed_batches = 0
+        self._lost_since_flush = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="mie-audit-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, events: list[AuditEvent]) -> None:
+        if self._closed:
+            raise RuntimeError("AuditLogger writer is closed")
+        for e in events:
+            try:
+                self._queue.put(e, timeout=self._enqueue_timeout_s)
+            except queue.Full as exc:
+                raise TimeoutError("Audit queue is full; writer is not keeping up") from exc
+
+    def flush(self) -> int:
+        self._queue.join()
+        with self._stats_lock:
+            lost, self._lost_since_flush = self._lost_since_flush, 0
+        return lost
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            taken = 1
+            stop = item is _STOP
+            batch: list[AuditEvent] = [] if stop else [item]
+            deadline = time.monotonic() + self._max_delay_s
+            while not stop and len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self._write(batch)
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, events: list[AuditEvent]) -> None:
+        try:
+            batch = self._audit._prepare(events)
+        except Exception:
+            self._lose(len(events), attempts=0)
+            return
+        for attempt in range(self._max_retries + 1):
+            try:
+                self._audit._commit(batch)
+                break
+            except Exception:
+                if attempt == self._max_retries:
+                    self._lose(batch.n_pending(), attempts=attempt + 1)
+                    return
+                logger.warning(
+                    "audit_batch_write_retry",
+                    extra={"n_events": batch.n_pending(), "attempt": attempt + 1},
+                    exc_info=True,
+                )
+                time.sleep(self._retry_backoff_s * 2**attempt)
+        try:
+            self._audit._publish(batch)
+        except Exception:
+            # Committed to SQLite; only the JSONL mirror missed the batch.
+            logger.exception("audit_batch_publish_failed", extra={"n_events": len(batch.events)})
+
+    def _lose(self, n_events: int, *, attempts: int) -> None:
+        """
+        Account for events given up on; call from the `except` block of the last failure.
+        """
+        with self._stats_lock:
+            self.lost_events += n_events
+            self.failed_batches += 1
+            self._lost_since_flush += n_events
+            total = self.lost_events
+        logger.exception(
+            "audit_batch_write_failed",
+            extra={"n_events": n_events, "attempts": attempts, "lost_events_total": total},
+        )
+        for listener in self._audit._write_failure_listeners:
+            try:
+                listener(n_events)
+            except Exception:
+                logger.exception("audit_write_failure_listener_failed")
+
 
 class AuditLogger:
-    def __init__(self, db_path: str, jsonl_path: str | None = None, *, redactor: PIIRedactor | None = None) -> None:
+    """
+    Persists redacted audit events to SQLite (and optionally a JSONL mirror).
+
+    By default writes are synchronous. With `async_writes=True` events are handed
+    to a background group-commit writer; call `flush()` to wait for pending events
+    and `close()` on shutdown. Batches the writer could not commit are counted in
+    `lost_events` and reported to `add_write_failure_listener` listeners.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        jsonl_path: str | None = None,
+        *,
+        redactor: PIIRedactor | None = None,
+        async_writes: bool = False,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        max_delay_ms: float = 50.0,
+        enqueue_timeout_s: float | None = None,
+        mmap_size: int = 256 * 1024 * 1024,
+        cache_size_kib: int = 64 * 1024,
+        busy_timeout_ms: int = 5000,
+        jsonl_max_bytes: int | None = None,
+        jsonl_max_age_s: float | None = None,
+        jsonl_compression: str | None = "gzip",
+    ) -> None:
         self.db_path = db_path
         self.jsonl_path = jsonl_path
         self.redactor = redactor
+        self._listeners: list[AuditListener] = []
+        self._write_failure_listeners: list[WriteFailureListener] = []
+        self._jsonl = (
+            SegmentedJsonlWriter(
+                jsonl_path,
+                max_bytes=jsonl_max_bytes,
+                max_age_s=jsonl_max_age_s,
+                compression=jsonl_compression,
+                index_key=ts_index_key,
+            )
+            if jsonl_path
+            else None
+        )
+        self._conns = _ConnectionManager(
+            db_path, mmap_size=mmap_size, cache_size_kib=cache_size_kib, busy_timeout_ms=busy_timeout_ms
+        )
         self._init_storage()
+        self._writer = (
+            _GroupCommitWriter(
+                self,
+                max_queue=max_queue,
+                batch_size=batch_size,
+                max_delay_ms=max_delay_ms,
+                enqueue_timeout_s=enqueue_timeout_s,
+            )
+            if async_writes
+            else None
+        )
 
     def _init_storage(self) -> None:
         Path(os.path.dirname(self.db_path) or ".").mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript(SCHEMA_SQL)
-            conn.commit()
+        with self._conns.writing() as conn:
+            migrate(conn)
         if self.jsonl_path:
             Path(os.path.dirname(self.jsonl_path) or ".").mkdir(parents=True, exist_ok=True)
             Path(self.jsonl_path).touch(exist_ok=True)
 
-    def write(self, event: AuditEvent) -> None:
-        safe_event = self.redactor.redact_event(event) if self.redactor else event
-        payload_json = json.dumps(safe_event.payload, default=str)
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT INTO audit_events (ts, request_id, event_type, model_version, applicant_id, payload_json) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (
-                    safe_event.ts,
-                    safe_event.request_id,
-                    safe_event.event_type,
-                    safe_event.model_version,
-                    safe_event.applicant_id,
-                    payload_json,
-                ),
-            )
-            conn.commit()
+    def add_listener(self, listener: AuditListener) -> None:
+        """
+        Call `listener` with each batch of redacted events once it has been persisted,
+        as `StoredAuditEvent`s carrying their ids.
 
-        if self.jsonl_path:
-            with open(self.jsonl_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(asdict(safe_event), default=str) + "\n")
+        Listeners run on the writing thread (the background writer in async mode);
+        their exceptions are logged and never fail the write.
+        """
+        self._listeners.append(listener)
+
+    def add_write_failure_listener(self, listener: WriteFailureListener) -> None:
+        """
+        Call `listener` with the number of events each time the background writer gives up on a batch.
+        """
+        self._write_failure_listeners.append(listener)
+
+    @property
+    def lost_events(self) -> int:
+        """
+        Events the background writer could not commit since start (always 0 in sync mode).
+        """
+        return self._writer.lost_events if self._writer is not None else 0
+
+    def write(self, event: AuditEvent) -> None:
+        self.write_many([event])
 
     def write_many(self, events: Iterable[AuditEvent]) -> None:
-        for e in events:
-            self.write(e)
+        """
+        Persist events in a single SQLite transaction and a single JSONL append.
+
+        In async mode the events are queued instead, blocking while the queue is full.
+        """
+        events = list(events)
+        if not events:
+            return
+        if self._writer is not None:
+            self._writer.submit(events)
+            return
+        self._write_now(events)
+
+    def flush(self) -> int:
+        """
+        Block until every queued event has been committed or given up on (no-op in sync mode).
+
+        Returns the number of events lost since the previous `flush()`.
+        """
+        if self._writer is not None:
+            return self._writer.flush()
+        return 0
+
+    def close(self) -> None:
+        """
+        Flush pending events, stop the background writer, if any, wait for JSONL segments
+        being sealed, and release connections.
+        """
+        if self._writer is not None:
+            self._writer.close()
+        if self._jsonl is not None:
+            self._jsonl.wait_sealed()
+        self._conns.close()
+
+    def _write_now(self, events: list[AuditEvent]) -> None:
+        batch = self._prepare(events)
+        self._commit(batch)
+        self._publish(batch)
+
+    def _prepare(self, events: list[AuditEvent]) -> _PreparedBatch:
+        safe_events = [self.redactor.redact_event(e) if self.redactor else e for e in events]
+        # Each payload is serialized once; SQLite and the JSONL mirror share the text.
+        payloads = [serialization.dumps_str(e.payload) for e in safe_events]
+        return _PreparedBatch(safe_events, payloads, {"": (safe_events, payloads)})
+
+    def _commit(self, batch: _PreparedBatch) -> None:
+        if batch.pending:
+            events, payloads = batch.pending[""]
+            ids = self._write_encoded(events, payloads)
+            batch.stored.extend(stored_event(e, i) for e, i in zip(events, ids, strict=True))
+            batch.pending.clear()
+
+    def _publish(self, batch: _PreparedBatch) -> None:
+        if self._jsonl is not None:
+            self._jsonl.append(encode_jsonl_line(e, p) for e, p in zip(batch.events, batch.payloads, strict=True))
+        notify_listeners(self._listeners, batch.stored)
+
+    def _write_encoded(self, events: list[AuditEvent], payloads: list[str]) -> range:
+        """
+        Insert already redacted events whose payloads are already serialized. Returns their ids.
+        """
+        with self._conns.writing() as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO audit_events (ts, request_id, event_type, model_version, applicant_id, payload_json) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (e.ts, e.request_id, e.event_type, e.model_version, e.applicant_id, payload)
+                        for e, payload in zip(events, payloads, strict=True)
+                    ],
+                )
+                # AUTOINCREMENT ids within one write transaction are consecutive.
+                last = int(conn.execute("SELECT last_insert_rowid()").fetchone()[0])
+        return range(last - len(events) + 1, last + 1)
 
     def get(self, event_id: int) -> StoredAuditEvent | None:
         """
         Fetch a single audit event by SQLite primary key.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
-                "SELECT id, ts, request_id, event_type, model_version, applicant_id, payload_json "
-                "FROM audit_events WHERE id = ?",
-                (int(event_id),),
-            ).fetchone()
+        row = self._conns.reader().execute(
+            "SELECT id, ts, request_id, event_type, model_version, applicant_id, payload_json "
+            "FROM audit_events WHERE id = ?",
+            (int(event_id),),
+        ).fetchone()
         if not row:
             return None
         return _row_to_stored_event(row)
@@ -206,6 +768,7 @@ class AuditLogger:
         *,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
         since_ts: float | None = None,
         until_ts: float | None = None,
         request_id: str | None = None,
@@ -217,45 +780,81 @@ class AuditLogger:
         Query audit events with simple filters and pagination.
 
         Filters are AND-ed together. Results are returned in reverse chronological order.
+        Pass the `next_cursor` of a previous page (see `next_cursor`) as `cursor` for
+        keyset pagination on `(ts, id)`; it cannot be combined with `offset`.
         """
         limit = max(1, min(int(limit), 1000))
         offset = max(0, int(offset))
-
-        where: list[str] = []
-        params: list[Any] = []
-
-        if since_ts is not None:
-            where.append("ts >= ?")
-            params.append(float(since_ts))
-        if until_ts is not None:
-            where.append("ts <= ?")
-            params.append(float(until_ts))
-        if request_id:
-            where.append("request_id = ?")
-            params.append(str(request_id))
-        if event_type:
-            where.append("event_type = ?")
-            params.append(str(event_type))
-        if applicant_id:
-            where.append("applicant_id = ?")
-            params.append(str(applicant_id))
-        if model_version:
-            where.append("model_version = ?")
-            params.append(str(model_version))
-
-        sql = (
-            "SELECT id, ts, request_id, event_type, model_version, applicant_id, payload_json "
-            "FROM audit_events "
+        if cursor is not None and offset:
+            raise ValueError("cursor and offset cannot be combined")
+        where, params = _filters_sql(
+            since_ts=since_ts,
+            until_ts=until_ts,
+            request_id=request_id,
+            event_type=event_type,
+            applicant_id=applicant_id,
+            model_version=model_version,
         )
-        if where:
-            sql += "WHERE " + " AND ".join(where) + " "
-        sql += "ORDER BY ts DESC, id DESC LIMIT ? OFFSET ?"
+        after = decode_cursor(cursor) if cursor else None
+        return self._select(where, params, after=after, limit=limit, offset=offset)
+
+    def _select(
+        self,
+        where: list[str],
+        params: list[Any],
+        *,
+        after: tuple[float, int] | None,
+        limit: int,
+        offset: int = 0,
+    ) -> list[StoredAuditEvent]:
+        sql, params = _select_sql(where, params, after=after)
+        sql += " LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(sql, tuple(params)).fetchall()
+        rows = self._conns.reader().execute(sql, tuple(params)).fetchall()
         return [_row_to_stored_event(r) for r in rows]
 
+    def iter_events(
+        self,
+        *,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        request_id: str | None = None,
+        event_type: str | None = None,
+        applicant_id: str | None = None,
+        model_version: str | None = None,
+        cursor: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[StoredAuditEvent]:
+        """
+        Stream every matching event (newest first) from a single server-side cursor.
+
+        The generator owns a dedicated read-only connection, so it can be consumed
+        from any thread (e.g. a streaming HTTP response). Memory stays bounded by
+        `batch_size` regardless of the result size.
+        """
+        where, params = _filters_sql(
+            since_ts=since_ts,
+            until_ts=until_ts,
+            request_id=request_id,
+            event_type=event_type,
+            applicant_id=applicant_id,
+            model_version=model_version,
+        )
+        sql, params = _select_sql(where, params, after=decode_cursor(cursor) if cursor else None)
+        batch_size = max(1, int(batch_size))
+        conn = self._conns.open_reader()
+        try:
+            cur = conn.execute(sql, tuple(params))
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                for r in rows:
+                    yield _row_to_stored_event(r)
+        finally:
+            conn.close()
+
     def count(
         self,
         *,
@@ -269,36 +868,120 @@ class AuditLogger:
         """
         Count audit events matching the same filters as `query`.
         """
-        where: list[str] = []
-        params: list[Any] = []
-
-        if since_ts is not None:
-            where.append("ts >= ?")
-            params.append(float(since_ts))
-        if until_ts is not None:
-            where.append("ts <= ?")
-            params.append(float(until_ts))
-        if request_id:
-            where.append("request_id = ?")
-            params.append(str(request_id))
-        if event_type:
-            where.append("event_type = ?")
-            params.append(str(event_type))
-        if applicant_id:
-            where.append("applicant_id = ?")
-            params.append(str(applicant_id))
-        if model_version:
-            where.append("model_version = ?")
-            params.append(str(model_version))
-
+        where, params = _filters_sql(
+            since_ts=since_ts,
+            until_ts=until_ts,
+            request_id=request_id,
+            event_type=event_type,
+            applicant_id=applicant_id,
+            model_version=model_version,
+        )
         sql = "SELECT COUNT(1) FROM audit_events "
         if where:
             sql += "WHERE " + " AND ".join(where)
 
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(sql, tuple(params)).fetchone()
+        row = self._conns.reader().execute(sql, tuple(params)).fetchone()
         return int(row[0] if row else 0)
 
+    def fairness_counts(
+        self,
+        attribute: str,
+        *,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        model_version: str | None = None,
+        selected_decision: str = "APPROVE",
+        chunk_s: float = 86400.0,
+        first_decision_ts: float | None = None,
+    ) -> FairnessAccumulator:
+        """
+        Per-group decision and outcome counts for one `audit_context` attribute, aggregated in SQLite.
+
+        Decisions are score events in `[since_ts, until_ts]`; outcome events count
+        against their decision's time (`decision_ts`), as in the fairness ledger.
+        The window is read in `chunk_s` slices of the `ts` index, so each read
+        transaction stays short and only group totals leave the database.
+
+        Outcomes whose decision predates `first_decision_ts` (default: the oldest
+        stored score event) are skipped: their decision is no longer in the store
+        (e.g. pruned by retention), so counting them would label decisions that
+        were never counted.
+        """
+        from mie_credit_platform.modeling.fairness import FairnessAccumulator
+
+        path = fairness_attribute_path(attribute)
+        acc = FairnessAccumulator()
+        if first_decision_ts is None:
+            first_decision_ts = self.first_ts(SCORE_EVENT_TYPE)
+            if first_decision_ts is None:
+                return acc
+        mv_sql, mv_params = ("AND model_version = ? ", [model_version]) if model_version else ("", [])
+        decisions_sql = _FAIRNESS_DECISIONS_SQL.format(model_filter=mv_sql)
+        outcomes_sql = _FAIRNESS_OUTCOMES_SQL.format(model_filter=mv_sql)
+        lo_cohort = first_decision_ts if since_ts is None else max(float(since_ts), first_decision_ts)
+        hi_cohort = math.inf if until_ts is None else float(until_ts)
+
+        for lo, hi in self._ts_chunks(SCORE_EVENT_TYPE, since_ts, until_ts, chunk_s):
+            rows = self._conns.reader().execute(
+                decisions_sql, (path, selected_decision, SCORE_EVENT_TYPE, lo, hi, *mv_params)
+            ).fetchall()
+            acc += FairnessAccumulator({str(g): [n, pos, 0, 0, 0, 0, 0.0] for g, n, pos in rows})
+        # Outcomes always arrive after their decision, so only the lower bound narrows the scan.
+        for lo, hi in self._ts_chunks(OUTCOME_EVENT_TYPE, since_ts, None, chunk_s):
+            rows = self._conns.reader().execute(
+                outcomes_sql,
+                (path, *([selected_decision] * 3), OUTCOME_EVENT_TYPE, lo, hi, *mv_params, lo_cohort, hi_cohort),
+            ).fetchall()
+            acc += FairnessAccumulator({str(r[0]): [0, 0, *r[1:]] for r in rows})
+        return acc
+
+    def labeled_score_event_ids(self, score_event_ids: Iterable[int], *, since_ts: float | None = None) -> set[int]:
+        """
+        The subset of `score_event_ids` that already have an outcome event.
+
+        A lookup on the outcome index per `_ID_BATCH` ids, whatever the number of
+        stored outcomes. `since_ts` is accepted for parity with the partitioned
+        store, which uses it to skip partitions; a single database ignores it.
+        """
+        ids = sorted({int(i) for i in score_event_ids})
+        found: set[int] = set()
+        for start in range(0, len(ids), _ID_BATCH):
+            batch = ids[start : start + _ID_BATCH]
+            rows = self._conns.reader().execute(
+                _LABELED_SQL.format(placeholders=", ".join("?" * len(batch))), batch
+            ).fetchall()
+            found.update(int(r[0]) for r in rows)
+        return found
+
+    def first_ts(self, event_type: str) -> float | None:
+        """
+        Timestamp of the oldest stored event of `event_type` (None if there is none).
+        """
+        row = self._conns.reader().execute(
+            "SELECT MIN(ts) FROM audit_events WHERE event_type = ?", (event_type,)
+        ).fetchone()
+        return None if row[0] is None else float(row[0])
+
+    def _ts_chunks(
+        self, event_type: str, since_ts: float | None, until_ts: float | None, chunk_s: float
+    ) -> Iterator[tuple[float, float]]:
+        """
+        Half-open `[lo, hi)` slices covering `[since_ts, until_ts]` (open ends: the stored range).
+        """
+        if since_ts is None or until_ts is None:
+            lo_stored, hi_stored = self._conns.reader().execute(
+                "SELECT MIN(ts), MAX(ts) FROM audit_events WHERE event_type = ?", (event_type,)
+            ).fetchone()
+            if lo_stored is None:
+                return
+            since_ts = lo_stored if since_ts is None else since_ts
+            until_ts = hi_stored if until_ts is None else until_ts
+        lo, end = float(since_ts), math.nextafter(float(until_ts), math.inf)
+        while lo < end:
+            hi = min(lo + chunk_s, end)
+            yield lo, hi
+            lo = hi
+
     def export_jsonl(
         self,
         out_path: str,
@@ -309,46 +992,216 @@ class AuditLogger:
         event_type: str | None = None,
         applicant_id: str | None = None,
         model_version: str | None = None,
+        cursor: str | None = None,
         batch_size: int = 500,
     ) -> int:
         """
         Export matching audit events to a JSONL file. Returns number of rows written.
+
+        Pages are fetched with keyset pagination inside a single read transaction, so
+        the export runs in linear time and reflects one consistent snapshot even while
+        new events are being written.
         """
         Path(os.path.dirname(out_path) or ".").mkdir(parents=True, exist_ok=True)
         written = 0
-        offset = 0
         batch_size = max(1, min(int(batch_size), 5000))
-        with open(out_path, "w", encoding="utf-8") as f:
-            while True:
-                batch = self.query(
-                    limit=batch_size,
-                    offset=offset,
-                    since_ts=since_ts,
-                    until_ts=until_ts,
-                    request_id=request_id,
-                    event_type=event_type,
-                    applicant_id=applicant_id,
-                    model_version=model_version,
-                )
-                if not batch:
-                    break
-                for e in batch:
-                    f.write(json.dumps(asdict(e), default=str) + "\n")
-                    written += 1
-                offset += len(batch)
+        where, params = _filters_sql(
+            since_ts=since_ts,
+            until_ts=until_ts,
+            request_id=request_id,
+            event_type=event_type,
+            applicant_id=applicant_id,
+            model_version=model_version,
+        )
+        after = decode_cursor(cursor) if cursor else None
+        reader = self._conns.reader()
+        reader.execute("BEGIN")
+        try:
+            with open(out_path, "w", encoding="utf-8") as f:
+                while True:
+                    batch = self._select(where, params, after=after, limit=batch_size)
+                    if not batch:
+                        break
+                    f.write("".join(serialization.dumps_str(e) + "\n" for e in batch))
+                    written += len(batch)
+                    after = (batch[-1].ts, batch[-1].id)
+        finally:
+            reader.execute("COMMIT")
         return written
 
 
+# Score event ids per `labeled_score_event_ids` query, under SQLite's default limit
+# of 999 bound parameters on older builds.
+_ID_BATCH = 500
+
+# Written out to match the partial `OUTCOME_INDEX_SQL` index.
+_LABELED_SQL = """
+SELECT DISTINCT json_extract(payload_json, '$.score_event_id')
+FROM audit_events
+WHERE event_type = 'outcome' AND json_extract(payload_json, '$.score_event_id') IN ({placeholders})
+"""
+
+# Per-group tallies behind `AuditLogger.fairness_counts`; columns follow
+# `modeling.fairness.COUNT_FIELDS` (decisions: n, pred_pos; outcomes: the labeled fields).
+_FAIRNESS_DECISIONS_SQL = """
+SELECT json_extract(payload_json, ?) AS grp, COUNT(*), TOTAL(json_extract(payload_json, '$.decision') = ?)
+FROM audit_events
+WHERE event_type = ? AND ts >= ? AND ts < ? {model_filter}
+GROUP BY grp HAVING grp IS NOT NULL
+"""
+
+_FAIRNESS_OUTCOMES_SQL = """
+SELECT
+  json_extract(payload_json, ?) AS grp,
+  COUNT(*),
+  TOTAL(json_extract(payload_json, '$.decision') = ?),
+  TOTAL(json_extract(payload_json, '$.outcome') = 1),
+  TOTAL(json_extract(payload_json, '$.decision') = ? AND json_extract(payload_json, '$.outcome') = 1),
+  TOTAL(COALESCE(json_extract(payload_json, '$.score'), json_extract(payload_json, '$.decision') = ?))
+FROM audit_events
+WHERE event_type = ? AND ts >= ? AND ts < ? {model_filter}
+  AND json_extract(payload_json, '$.outcome') IN (0, 1)
+  AND json_extract(payload_json, '$.decision_ts') BETWEEN ? AND ?
+GROUP BY grp HAVING grp IS NOT NULL
+"""
+
+_FAIRNESS_ATTRIBUTE_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,63}$")
+
+
+def fairness_attribute_path(attribute: str) -> str:
+    """
+    JSON path of an `audit_context` attribute; names are restricted to identifiers.
+    """
+    if not _FAIRNESS_ATTRIBUTE_RE.match(attribute):
+        raise ValueError(f"Invalid audit_context attribute {attribute!r}")
+    return f"$.audit_context.{attribute}"
+
+
+def _filters_sql(
+    *,
+    since_ts: float | None,
+    until_ts: float | None,
+    request_id: str | None,
+    event_type: str | None,
+    applicant_id: str | None,
+    model_version: str | None,
+) -> tuple[list[str], list[Any]]:
+    where: list[str] = []
+    params: list[Any] = []
+
+    if since_ts is not None:
+        where.append("ts >= ?")
+        params.append(float(since_ts))
+    if until_ts is not None:
+        where.append("ts <= ?")
+        params.append(float(until_ts))
+    if request_id:
+        where.append("request_id = ?")
+        params.append(str(request_id))
+    if event_type:
+        where.append("event_type = ?")
+        params.append(str(event_type))
+    if applicant_id:
+        where.append("applicant_id = ?")
+        params.append(str(applicant_id))
+    if model_version:
+        where.append("model_version = ?")
+        params.append(str(model_version))
+    return where, params
+
+
+def _select_sql(
+    where: list[str], params: list[Any], *, after: tuple[float, int] | None
+) -> tuple[str, list[Any]]:
+    where = list(where)
+    params = list(params)
+    if after is not None:
+        # Keyset predicate; the (ts) index carries the rowid so this is a range seek.
+        where.append("(ts, id) < (?, ?)")
+        params.extend(after)
+    sql = (
+        "SELECT id, ts, request_id, event_type, model_version, applicant_id, payload_json "
+        "FROM audit_events "
+    )
+    if where:
+        sql += "WHERE " + " AND ".join(where) + " "
+    sql += "ORDER BY ts DESC, id DESC"
+    return sql, params
+
+
+def encode_cursor(ts: float, event_id: int) -> str:
+    """
+    Encode a `(ts, id)` keyset position as an opaque, URL-safe cursor.
+    """
+    raw = json.dumps([float(ts), int(event_id)], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, event_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return float(ts), int(event_id)
+    except Exception as e:
+        raise ValueError("Invalid audit cursor") from e
+
+
+def next_cursor(events: Sequence[StoredAuditEvent], limit: int) -> str | None:
+    """
+    Cursor for the page after `events`, or None when the page was not full.
+    """
+    if not events or len(events) < limit:
+        return None
+    last = events[-1]
+    return encode_cursor(last.ts, last.id)
+
+
+def notify_listeners(listeners: Sequence[AuditListener], events: list[AuditEvent]) -> None:
+    for listener in listeners:
+        try:
+            listener(events)
+        except Exception:
+            logger.exception("audit_listener_failed")
+
+
 def now_ts() -> float:
     return time.time()
 
 
+def encode_jsonl_line(event: AuditEvent, payload_json: str) -> str:
+    """
+    JSONL mirror line for `event` (the `asdict` layout), splicing in its already serialized payload.
+    """
+    head = serialization.dumps_str(
+        {
+            "ts": event.ts,
+            "request_id": event.request_id,
+            "event_type": event.event_type,
+            "model_version": event.model_version,
+            "applicant_id": event.applicant_id,
+        }
+    )
+    return f'{head[:-1]},"payload":{payload_json}}}'
+
+
+def stored_event(event: AuditEvent, event_id: int) -> StoredAuditEvent:
+    return StoredAuditEvent(
+        ts=event.ts,
+        request_id=event.request_id,
+        event_type=event.event_type,
+        model_version=event.model_version,
+        applicant_id=event.applicant_id,
+        payload=event.payload,
+        id=event_id,
+    )
+
+
 def _row_to_stored_event(row: Sequence[Any]) -> StoredAuditEvent:
     # row: (id, ts, request_id, event_type, model_version, applicant_id, payload_json)
     payload_raw = row[6]
     payload: dict[str, Any]
     try:
-        payload = json.loads(payload_raw) if isinstance(payload_raw, str) else {}
+        payload = serialization.loads(payload_raw) if isinstance(payload_raw, str) else {}
         if not isinstance(payload, dict):
             payload = {"_payload": payload}
     except Exception:
@@ -396,3 +1249,34 @@ def build_redactor_from_settings(settings: Any) -> PIIRedactor:
     )
 
 
+def build_audit_logger_from_settings(settings: Any, *, for_api: bool = False) -> Any:
+    """
+    Build the configured audit backend (`AuditLogger` or `PartitionedAuditLogger`).
+
+    The background writer is only enabled for the API (`for_api=True`); CLI commands
+    always write synchronously.
+    """
+
+    kwargs: dict[str, Any] = {
+        "redactor": build_redactor_from_settings(settings),
+        "mmap_size": getattr(settings, "audit_sqlite_mmap_bytes", 256 * 1024 * 1024),
+        "cache_size_kib": getattr(settings, "audit_sqlite_cache_kib", 64 * 1024),
+        "jsonl_max_bytes": getattr(settings, "audit_jsonl_rotate_max_bytes", 0),
+        "jsonl_max_age_s": getattr(settings, "audit_jsonl_rotate_max_age_s", 0.0),
+        "jsonl_compression": getattr(settings, "audit_jsonl_compression", "gzip"),
+    }
+    if for_api:
+        kwargs.update(
+            async_writes=getattr(settings, "audit_async_writes", False),
+            max_queue=getattr(settings, "audit_queue_max_events", 10000),
+            batch_size=getattr(settings, "audit_batch_max_events", 500),
+            max_delay_ms=getattr(settings, "audit_batch_max_delay_ms", 50.0),
+        )
+    partitioning = getattr(settings, "audit_partitioning", None)
+    if partitioning:
+        from mie_credit_platform.audit_partitioned import PartitionedAuditLogger
+
+        return PartitionedAuditLogger(
+            settings.audit_db_path, settings.audit_jsonl_path, granularity=partitioning, **kwargs
+        )
+    return AuditLogger(settings.audit_db_path, settings.audit_jsonl_path, **kwargs)
@@ -0,0 +1,480 @@
+from __future__ import annotations
+
+import calendar
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from ice.audit.segments import SegmentedJsonlWriter, ts_index_key
+from mie_credit_platform import serialization
+from mie_credit_platform.audit import (
+    SCORE_EVENT_TYPE,
+    AuditEvent,
+    AuditListener,
+    AuditLogger,
+    PIIRedactor,
+    StoredAuditEvent,
+    WriteFailureListener,
+    _GroupCommitWriter,
+    _PreparedBatch,
+    decode_cursor,
+    encode_cursor,
+    encode_jsonl_line,
+    notify_listeners,
+    stored_event,
+)
+
+if TYPE_CHECKING:
+    from mie_credit_platform.modeling.fairness import FairnessAccumulator
+
+logger = logging.getLogger("mie.audit")
+
+PARTITION_GRANULARITIES = ("day", "month")
+
+# Global event ids are `partition_ordinal << _ID_SHIFT | local_id`. With 32 bits for
+# the local id, ids stay below 2**53 and survive JSON round-trips through JavaScript.
+_ID_SHIFT = 32
+_LOCAL_ID_MASK = (1 << _ID_SHIFT) - 1
+
+
+@dataclass(frozen=True)
+class Partition:
+    key: str
+    ordinal: int
+    start_ts: float
+    end_ts: float  # exclusive
+    path: str
+
+    def overlaps(self, since_ts: float | None, until_ts: float | None) -> bool:
+        if since_ts is not None and self.end_ts <= since_ts:
+            return False
+        if until_ts is not None and self.start_ts > until_ts:
+            return False
+        return True
+
+
+def partition_for_ts(ts: float, granularity: str) -> tuple[str, int, float, float]:
+    """
+    Return (key, ordinal, start_ts, end_ts) of the UTC day/month containing `ts`.
+    """
+
+    t = time.gmtime(ts)
+    if granularity == "day":
+        ordinal = int(ts // 86400)
+        return time.strftime("%Y-%m-%d", t), ordinal, ordinal * 86400.0, (ordinal + 1) * 86400.0
+    if granularity == "month":
+        ordinal = t.tm_year * 12 + (t.tm_mon - 1)
+        start = calendar.timegm((t.tm_year, t.tm_mon, 1, 0, 0, 0))
+        next_year, next_month = divmod(ordinal + 1, 12)
+        end = calendar.timegm((next_year, next_month + 1, 1, 0, 0, 0))
+        return f"{t.tm_year:04d}-{t.tm_mon:02d}", ordinal, float(start), float(end)
+    raise ValueError(f"Unsupported partition granularity {granularity!r}; expected one of {PARTITION_GRANULARITIES}")
+
+
+def _key_to_ts(key: str, granularity: str) -> float:
+    fmt = "%Y-%m-%d" if granularity == "day" else "%Y-%m"
+    return float(calendar.timegm(time.strptime(key, fmt)))
+
+
+class PartitionedAuditLogger:
+    """
+    `AuditLogger`-compatible backend that stores one SQLite file per UTC day or month.
+
+    Files live next to `db_path` as `<stem>.<YYYY-MM-DD|YYYY-MM><suffix>`. Reads only
+    touch partitions overlapping `since_ts`/`until_ts`; because partitions cover
+    disjoint time ranges, visiting them newest-first yields a globally
+    `ts DESC, id DESC` ordered merge without re-sorting. Retention is a file
+    drop (`drop_partitions_before`) instead of a large `DELETE`.
+
+    Event ids are globally unique: the partition ordinal is encoded in the high bits.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        jsonl_path: str | None = None,
+        *,
+        granularity: str = "day",
+        redactor: PIIRedactor | None = None,
+        async_writes: bool = False,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+        max_delay_ms: float = 50.0,
+        enqueue_timeout_s: float | None = None,
+        mmap_size: int = 64 * 1024 * 1024,
+        cache_size_kib: int = 16 * 1024,
+        busy_timeout_ms: int = 5000,
+        jsonl_max_bytes: int | None = None,
+        jsonl_max_age_s: float | None = None,
+        jsonl_compression: str | None = "gzip",
+    ) -> None:
+        if granularity not in PARTITION_GRANULARITIES:
+            raise ValueError(f"Unsupported partition granularity {granularity!r}")
+        self.db_path = db_path
+        self.jsonl_path = jsonl_path
+        self.granularity = granularity
+        self.redactor = redactor
+        self._listeners: list[AuditListener] = []
+        self._write_failure_listeners: list[WriteFailureListener] = []
+        self._logger_kwargs = {
+            "mmap_size": mmap_size,
+            "cache_size_kib": cache_size_kib,
+            "busy_timeout_ms": busy_timeout_ms,
+        }
+        self._partitions: dict[str, AuditLogger] = {}
+        self._lock = threading.Lock()
+        Path(os.path.dirname(db_path) or ".").mkdir(parents=True, exist_ok=True)
+        self._jsonl = (
+            SegmentedJsonlWriter(
+                jsonl_path,
+                max_bytes=jsonl_max_bytes,
+                max_age_s=jsonl_max_age_s,
+                compression=jsonl_compression,
+                index_key=ts_index_key,
+            )
+            if jsonl_path
+            else None
+        )
+        self._writer = (
+            _GroupCommitWriter(
+                self,
+                max_queue=max_queue,
+                batch_size=batch_size,
+                max_delay_ms=max_delay_ms,
+                enqueue_timeout_s=enqueue_timeout_s,
+            )
+            if async_writes
+            else None
+        )
+
+    # Partition bookkeeping -----------------------------------------------------
+
+    def _path_for(self, key: str) -> str:
+        directory = os.path.dirname(self.db_path) or "."
+        stem, suffix = os.path.splitext(os.path.basename(self.db_path))
+        return os.path.join(directory, f"{stem}.{key}{suffix or '.sqlite3'}")
+
+    def partitions(self) -> list[Partition]:
+        """
+        Existing partitions, newest first.
+        """
+        directory = os.path.dirname(self.db_path) or "."
+        stem, suffix = os.path.splitext(os.path.basename(self.db_path))
+        key_re = r"\d{4}-\d{2}-\d{2}" if self.granularity == "day" else r"\d{4}-\d{2}"
+        pattern = re.compile(rf"^{re.escape(stem)}\.({key_re}){re.escape(suffix or '.sqlite3')}$")
+        out: list[Partition] = []
+        for name in os.listdir(directory):
+            m = pattern.match(name)
+            if not m:
+                continue
+            key, ordinal, start, end = partition_for_ts(_key_to_ts(m.group(1), self.granularity), self.granularity)
+            path = os.path.join(directory, name)
+            out.append(Partition(key=key, ordinal=ordinal, start_ts=start, end_ts=end, path=path))
+        return sorted(out, key=lambda p: p.start_ts, reverse=True)
+
+    def _logger(self, key: str) -> AuditLogger:
+        with self._lock:
+            part = self._partitions.get(key)
+            if part is None:
+                # Redaction and the JSONL mirror are handled once at this level.
+                part = AuditLogger(self._path_for(key), None, **self._logger_kwargs)
+                self._partitions[key] = part
+            return part
+
+    def _overlapping(self, since_ts: float | None, until_ts: float | None) -> list[Partition]:
+        return [p for p in self.partitions() if p.overlaps(since_ts, until_ts)]
+
+    # Writes --------------------------------------------------------------------
+
+    def add_listener(self, listener: AuditListener) -> None:
+        self._listeners.append(listener)
+
+    def add_write_failure_listener(self, listener: WriteFailureListener) -> None:
+        self._write_failure_listeners.append(listener)
+
+    @property
+    def lost_events(self) -> int:
+        return self._writer.lost_events if self._writer is not None else 0
+
+    def write(self, event: AuditEvent) -> None:
+        self.write_many([event])
+
+    def write_many(self, events: Iterable[AuditEvent]) -> None:
+        events = list(events)
+        if not events:
+            return
+        if self._writer is not None:
+            self._writer.submit(events)
+            return
+        self._write_now(events)
+
+    def _write_now(self, events: list[AuditEvent]) -> None:
+        batch = self._prepare(events)
+        self._commit(batch)
+        self._publish(batch)
+
+    def _prepare(self, events: list[AuditEvent]) -> _PreparedBatch:
+        safe_events = [self.redactor.redact_event(e) if self.redactor else e for e in events]
+        payloads = [serialization.dumps_str(e.payload) for e in safe_events]
+        by_key: dict[str, tuple[list[AuditEvent], list[str]]] = {}
+        for e, payload in zip(safe_events, payloads, strict=True):
+            part_events, part_payloads = by_key.setdefault(partition_for_ts(e.ts, self.granularity)[0], ([], []))
+            part_events.append(e)
+            part_payloads.append(payload)
+        return _PreparedBatch(safe_events, payloads, by_key)
+
+    def _commit(self, batch: _PreparedBatch) -> None:
+        # One transaction per partition; committed partitions are dropped from `pending`.
+        for key in list(batch.pending):
+            events, payloads = batch.pending[key]
+            ids = self._logger(key)._write_encoded(events, payloads)
+            ordinal = partition_for_ts(events[0].ts, self.granularity)[1]
+            batch.stored.extend(
+                stored_event(e, (ordinal << _ID_SHIFT) | i) for e, i in zip(events, ids, strict=True)
+            )
+            del batch.pending[key]
+
+    def _publish(self, batch: _PreparedBatch) -> None:
+        if self._jsonl is not None:
+            self._jsonl.append(encode_jsonl_line(e, p) for e, p in zip(batch.events, batch.payloads, strict=True))
+        notify_listeners(self._listeners, batch.stored)
+
+    def flush(self) -> int:
+        if self._writer is not None:
+            return self._writer.flush()
+        return 0
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._jsonl is not None:
+            self._jsonl.wait_sealed()
+        with self._lock:
+            for part in self._partitions.values():
+                part.close()
+            self._partitions.clear()
+
+    # Reads ---------------------------------------------------------------------
+
+    def _globalize(self, events: list[StoredAuditEvent], ordinal: int) -> list[StoredAuditEvent]:
+        return [replace(e, id=(ordinal << _ID_SHIFT) | e.id) for e in events]
+
+    def get(self, event_id: int) -> StoredAuditEvent | None:
+        event_id = int(event_id)
+        ordinal, local_id = event_id >> _ID_SHIFT, event_id & _LOCAL_ID_MASK
+        for p in self.partitions():
+            if p.ordinal == ordinal:
+                found = self._logger(p.key).get(local_id)
+                return self._globalize([found], ordinal)[0] if found else None
+        return None
+
+    def query(
+        self,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        request_id: str | None = None,
+        event_type: str | None = None,
+        applicant_id: str | None = None,
+        model_version: str | None = None,
+    ) -> list[StoredAuditEvent]:
+        """
+        Same contract as `AuditLogger.query`, fanned out over overlapping partitions.
+        """
+        limit = max(1, min(int(limit), 1000))
+        offset = max(0, int(offset))
+        if cursor is not None and offset:
+            raise ValueError("cursor and offset cannot be combined")
+        filters = {
+            "request_id": request_id,
+            "event_type": event_type,
+            "applicant_id": applicant_id,
+            "model_version": model_version,
+        }
+        after = decode_cursor(cursor) if cursor else None
+        upper = until_ts if after is None else min(after[0], until_ts if until_ts is not None else after[0])
+
+        out: list[StoredAuditEvent] = []
+        for p in self._overlapping(since_ts, upper):
+            part = self._logger(p.key)
+            local_cursor = None
+            if after is not None and p.start_ts <= after[0] < p.end_ts:
+                local_cursor = encode_cursor(after[0], after[1] & _LOCAL_ID_MASK)
+            if offset:
+                n = part.count(since_ts=since_ts, until_ts=until_ts, **filters)
+                if n <= offset:
+                    offset -= n
+                    continue
+            rows = part.query(
+                limit=limit - len(out),
+                offset=offset,
+                cursor=local_cursor,
+                since_ts=since_ts,
+                until_ts=until_ts,
+                **filters,
+            )
+            offset = 0
+            out.extend(self._globalize(rows, p.ordinal))
+            if len(out) >= limit:
+                break
+        return out
+
+    def count(
+        self,
+        *,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        request_id: str | None = None,
+        event_type: str | None = None,
+        applicant_id: str | None = None,
+        model_version: str | None = None,
+    ) -> int:
+        return sum(
+            self._logger(p.key).count(
+                since_ts=since_ts,
+                until_ts=until_ts,
+                request_id=request_id,
+                event_type=event_type,
+                applicant_id=applicant_id,
+                model_version=model_version,
+            )
+            for p in self._overlapping(since_ts, until_ts)
+        )
+
+    def iter_events(
+        self,
+        *,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        request_id: str | None = None,
+        event_type: str | None = None,
+        applicant_id: str | None = None,
+        model_version: str | None = None,
+        cursor: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[StoredAuditEvent]:
+        after = decode_cursor(cursor) if cursor else None
+        upper = until_ts if after is None else min(after[0], until_ts if until_ts is not None else after[0])
+        for p in self._overlapping(since_ts, upper):
+            local_cursor = None
+            if after is not None and p.start_ts <= after[0] < p.end_ts:
+                local_cursor = encode_cursor(after[0], after[1] & _LOCAL_ID_MASK)
+            for e in self._logger(p.key).iter_events(
+                since_ts=since_ts,
+                until_ts=until_ts,
+                request_id=request_id,
+                event_type=event_type,
+                applicant_id=applicant_id,
+                model_version=model_version,
+                cursor=local_cursor,
+                batch_size=batch_size,
+            ):
+                yield replace(e, id=(p.ordinal << _ID_SHIFT) | e.id)
+
+    def fairness_counts(
+        self,
+        attribute: str,
+        *,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        model_version: str | None = None,
+        selected_decision: str = "APPROVE",
+        chunk_s: float = 86400.0,
+    ) -> FairnessAccumulator:
+        """
+        `AuditLogger.fairness_counts` summed over partitions.
+
+        Partitions after `until_ts` are still read: outcomes land in the partition
+        of their arrival, which can be later than their decision's. Outcomes of
+        decisions older than the oldest remaining score event (e.g. in dropped
+        partitions) are skipped.
+        """
+        from mie_credit_platform.modeling.fairness import FairnessAccumulator
+
+        acc = FairnessAccumulator()
+        first_decision_ts = self.first_ts(SCORE_EVENT_TYPE)
+        if first_decision_ts is None:
+            return acc
+        for p in self._overlapping(since_ts, None):
+            acc += self._logger(p.key).fairness_counts(
+                attribute,
+                since_ts=since_ts,
+                until_ts=until_ts,
+                model_version=model_version,
+                selected_decision=selected_decision,
+                chunk_s=chunk_s,
+                first_decision_ts=first_decision_ts,
+            )
+        return acc
+
+    def labeled_score_event_ids(self, score_event_ids: Iterable[int], *, since_ts: float | None = None) -> set[int]:
+        """
+        `AuditLogger.labeled_score_event_ids` over partitions overlapping `[since_ts, now]`.
+
+        Outcomes land in the partition of their arrival, so pass the oldest decision's
+        `ts` as `since_ts` to skip partitions that cannot hold them.
+        """
+        ids = {int(i) for i in score_event_ids}
+        found: set[int] = set()
+        for p in self._overlapping(since_ts, None):
+            if not ids:
+                break
+            hits = self._logger(p.key).labeled_score_event_ids(ids)
+            found |= hits
+            ids -= hits
+        return found
+
+    def first_ts(self, event_type: str) -> float | None:
+        """
+        Timestamp of the oldest stored event of `event_type`, searching partitions oldest first.
+        """
+        for p in reversed(self.partitions()):
+            ts = self._logger(p.key).first_ts(event_type)
+            if ts is not None:
+                return ts
+        return None
+
+    def export_jsonl(self, out_path: str, *, batch_size: int = 500, **filters: Any) -> int:
+        """
+        Export matching events to a JSONL file, streaming partitions newest-first.
+        """
+        Path(os.path.dirname(out_path) or ".").mkdir(parents=True, exist_ok=True)
+        written = 0
+        with open(out_path, "w", encoding="utf-8") as f:
+            for e in self.iter_events(batch_size=batch_size, **filters):
+                f.write(serialization.dumps_str(e) + "\n")
+                written += 1
+        return written
+
+    # Retention -----------------------------------------------------------------
+
+    def drop_partitions_before(self, cutoff_ts: float) -> list[str]:
+        """
+        Delete every partition that ends at or before `cutoff_ts`. Returns the dropped keys.
+
+        Each drop is a file removal, independent of the number of rows it holds.
+        """
+        dropped: list[str] = []
+        for p in self.partitions():
+            if p.end_ts > cutoff_ts:
+                continue
+            with self._lock:
+                part = self._partitions.pop(p.key, None)
+            if part is not None:
+                part.close()
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(p.path + suffix)
+                except FileNotFoundError:
+                    pass
+            dropped.append(p.key)
+            logger.info("audit_partition_dropped", extra={"partition": p.key})
+        return dropped
@@ -0,0 +1,496 @@
+from __future__ import annotations
+
+import json
+import warnings
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from mie_credit_platform.audit import AuditEvent, AuditLogger, build_redactor_from_settings
+from mie_credit_platform.bench.harness import BenchContext, Benchmark, Prepared, SkipBenchmark
+from mie_credit_platform.settings import Settings
+
+THRESHOLD = 0.5
+N_APPLICANTS = 50_000
+N_GROUPS = 4
+# Rows per transaction when populating audit databases (not timed).
+POPULATE_CHUNK = 50_000
+EVENT_TYPES = ("score", "explain")
+
+
+# Fixtures --------------------------------------------------------------------
+
+
+def _mie_package(ctx: BenchContext) -> Any:
+    def build() -> Any:
+        from mie_credit_platform.governance.registry import load_approved_model
+        from mie_credit_platform.modeling.train import TrainConfig, train_baseline_logreg
+
+        registry = ctx.path("registry")
+        train_baseline_logreg(TrainConfig(version="bench", registry_dir=str(registry), n_synth=2000, seed=ctx.seed))
+        # The same loader (and compact artifact) the API serves from.
+        return load_approved_model(str(registry), "bench", require_approval=False)
+
+    return ctx.fixture("mie_package", build)
+
+
+def _applicant_rows(ctx: BenchContext, n: int) -> list[dict[str, float]]:
+    def build() -> list[dict[str, float]]:
+        from mie_credit_platform.modeling.synthetic_data import (
+            SyntheticDataConfig,
+            make_synthetic_alt_data,
+        )
+
+        pkg = _mie_package(ctx)
+        df = make_synthetic_alt_data(SyntheticDataConfig(n=n, seed=ctx.seed))
+        return df[pkg.feature_names].astype(float).to_dict(orient="records")
+
+    return ctx.fixture(("applicant_rows", n), build)
+
+
+def make_audit_events(n: int, *, start: int = 0) -> list[AuditEvent]:
+    """
+    Deterministic score/explain events spread one second apart over `N_APPLICANTS` applicants.
+    """
+    return [
+        AuditEvent(
+            ts=1_700_000_000.0 + i,
+            request_id=f"req-{i}",
+            event_type=EVENT_TYPES[i % 2],
+            model_version="v0.1.0",
+            applicant_id=f"applicant-{i % N_APPLICANTS}",
+            payload={
+                "score": 0.42 + (i % 50) / 100,
+                "decision": "APPROVE" if i % 2 else "REVIEW",
+                "reason_codes": [
+                    "HIGH_RISK_SIGNAL:overdraft_count_12m",
+                    "HIGH_RISK_SIGNAL:cashflow_volatility_90d",
+                    "HIGH_RISK_SIGNAL:months_at_address",
+                ],
+                "features": {"rent_on_time_ratio_12m": 0.9},
+            },
+        )
+        for i in range(start, start + n)
+    ]
+
+
+def _redactor() -> Any:
+    return build_redactor_from_settings(Settings(audit_hash_salt="bench-salt"))
+
+
+def _discard_db(path: Path) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def _populated_audit(ctx: BenchContext, n: int) -> AuditLogger:
+    """
+    Audit database holding `n` events, shared by the read benchmarks of that size.
+    """
+
+    def build() -> AuditLogger:
+        audit = AuditLogger(str(ctx.path(f"audit-{n}.sqlite3")))
+        for start in range(0, n, POPULATE_CHUNK):
+            audit.write_many(make_audit_events(min(POPULATE_CHUNK, n - start), start=start))
+        return audit
+
+    return ctx.fixture(("audit", n), build)
+
+
+def _fairness_inputs(ctx: BenchContext, n: int) -> tuple[list[str], list[int], list[int]]:
+    def build() -> tuple[list[str], list[int], list[int]]:
+        rng = np.random.default_rng(ctx.seed)
+        groups = [chr(ord("A") + g) for g in rng.integers(0, N_GROUPS, n).tolist()]
+        y_true = rng.integers(0, 2, n).tolist()
+        y_pred = rng.integers(0, 2, n).tolist()
+        return groups, y_true, y_pred
+
+    return ctx.fixture(("fairness", n), build)
+
+
+# Scoring ---------------------------------------------------------------------
+
+
+def _score_applicant(ctx: BenchContext, size: int) -> Prepared:
+    from mie_credit_platform.modeling.scoring import score_applicant
+
+    pkg = _mie_package(ctx)
+    rows = _applicant_rows(ctx, size)
+
+    def run() -> None:
+        for row in rows:
+            score_applicant(pkg, row, THRESHOLD)
+
+    return Prepared(run=run, ops=size)
+
+
+def _score_applicants_batch(ctx: BenchContext, size: int) -> Prepared:
+    from mie_credit_platform.modeling.scoring import score_applicants_batch
+
+    pkg = _mie_package(ctx)
+    rows = _applicant_rows(ctx, size)
+    return Prepared(run=lambda: score_applicants_batch(pkg, rows, THRESHOLD), ops=size)
+
+
+# Audit -----------------------------------------------------------------------
+
+
+def _audit_write(ctx: BenchContext, size: int) -> Prepared:
+    events = make_audit_events(size)
+    redactor = _redactor()
+
+    def run() -> None:
+        path = ctx.path("audit-write.sqlite3")
+        audit = AuditLogger(str(path), redactor=redactor)
+        try:
+            for e in events:
+                audit.write(e)
+        finally:
+            audit.close()
+            _discard_db(path)
+
+    return Prepared(run=run, ops=size)
+
+
+def _audit_write_many(ctx: BenchContext, size: int) -> Prepared:
+    events = make_audit_events(size)
+    redactor = _redactor()
+
+    def run() -> None:
+        path = ctx.path("audit-write-many.sqlite3")
+        audit = AuditLogger(str(path), redactor=redactor)
+        try:
+            # Same batch size as the group-commit writer.
+            for start in range(0, size, 500):
+                audit.write_many(events[start : start + 500])
+        finally:
+            audit.close()
+            _discard_db(path)
+
+    return Prepared(run=run, ops=size)
+
+
+def _audit_query(ctx: BenchContext, size: int) -> Prepared:
+    from mie_credit_platform.audit import next_cursor
+
+    audit = _populated_audit(ctx, size)
+    pages = 10
+
+    def run() -> None:
+        # Newest page of one event type, then keyset pagination through the next ones.
+        cursor = None
+        for _ in range(pages):
+            events = audit.query(event_type="score", limit=100, cursor=cursor)
+            cursor = next_cursor(events, 100)
+
+    return Prepared(run=run, ops=pages)
+
+
+def _audit_query_applicant(ctx: BenchContext, size: int) -> Prepared:
+    audit = _populated_audit(ctx, size)
+    lookups = [f"applicant-{i * 7919 % min(size, N_APPLICANTS)}" for i in range(100)]
+
+    def run() -> None:
+        for applicant_id in lookups:
+            audit.query(applicant_id=applicant_id, limit=100)
+
+    return Prepared(run=run, ops=len(lookups))
+
+
+def _audit_count(ctx: BenchContext, size: int) -> Prepared:
+    audit = _populated_audit(ctx, size)
+    return Prepared(run=lambda: audit.count(event_type="score"), ops=1)
+
+
+def _audit_fairness_counts(ctx: BenchContext, size: int) -> Prepared:
+    audit = _populated_audit(ctx, size)
+    # The generated events carry no audit_context: this times the SQL scan and grouping.
+    return Prepared(run=lambda: audit.fairness_counts("sex"), ops=size // 2)
+
+
+def _audit_export_jsonl(ctx: BenchContext, size: int) -> Prepared:
+    audit = _populated_audit(ctx, size)
+    out = ctx.path("export.jsonl")
+
+    def cleanup() -> None:
+        out.unlink(missing_ok=True)
+
+    return Prepared(run=lambda: audit.export_jsonl(str(out), batch_size=5000), ops=size, cleanup=cleanup)
+
+
+# Redaction -------------------------------------------------------------------
+
+
+def _redaction_events(ctx: BenchContext, size: int) -> tuple[Any, list[AuditEvent]]:
+    return ctx.fixture(("redaction", size), lambda: (_redactor(), make_audit_events(size)))
+
+
+def _redact_event(ctx: BenchContext, size: int) -> Prepared:
+    redactor, events = _redaction_events(ctx, size)
+    # The compiled plan must stay equivalent to the reference implementation.
+    sample = events[:1000]
+    reference = [json.dumps(redactor._redact_event_reference(e).__dict__) for e in sample]
+    if [json.dumps(redactor.redact_event(e).__dict__) for e in sample] != reference:
+        raise AssertionError("compiled redaction plan diverges from the reference path")
+
+    def run() -> None:
+        for e in events:
+            redactor.redact_event(e)
+
+    return Prepared(run=run, ops=size)
+
+
+def _redact_event_reference(ctx: BenchContext, size: int) -> Prepared:
+    redactor, events = _redaction_events(ctx, size)
+
+    def run() -> None:
+        for e in events:
+            redactor._redact_event_reference(e)
+
+    return Prepared(run=run, ops=size)
+
+
+# Fairness --------------------------------------------------------------------
+
+
+def _fairness_selection_rates(ctx: BenchContext, size: int) -> Prepared:
+    from mie_credit_platform.modeling.fairness import (
+        demographic_parity_difference,
+        selection_rates_by_group,
+    )
+
+    groups, _, y_pred = _fairness_inputs(ctx, size)
+    return Prepared(run=lambda: demographic_parity_difference(selection_rates_by_group(groups, y_pred)), ops=size)
+
+
+def _fairness_tpr(ctx: BenchContext, size: int) -> Prepared:
+    from mie_credit_platform.modeling.fairness import equal_opportunity_difference, tpr_by_group
+
+    groups, y_true, y_pred = _fairness_inputs(ctx, size)
+    return Prepared(run=lambda: equal_opportunity_difference(tpr_by_group(groups, y_true, y_pred)), ops=size)
+
+
+def _fairness_metrics_arrays(ctx: BenchContext, size: int) -> Prepared:
+    from mie_credit_platform.modeling.fairness import compute_fairness_metrics
+
+    groups, y_true, y_pred = _fairness_inputs(ctx, size)
+    groups_arr = np.asarray(groups, dtype=object)
+    y_true_arr, y_pred_arr = np.asarray(y_true, dtype=np.int8), np.asarray(y_pred, dtype=np.int8)
+    return Prepared(run=lambda: compute_fairness_metrics(groups_arr, y_true_arr, y_pred_arr), ops=size)
+
+
+def _fairness_bootstrap(ctx: BenchContext, size: int) -> Prepared:
+    from mie_credit_platform.modeling.fairness import bootstrap_intervals, group_counts
+
+    groups, y_true, y_pred = _fairness_inputs(ctx, 100_000)
+    counts = group_counts(groups, y_pred, y_true)
+    # `size` is the number of replicates; the rows behind the counts stay fixed.
+    return Prepared(run=lambda: bootstrap_intervals(counts, n_replicates=size, seed=0), ops=size)
+
+
+def _fairness_ice_report(ctx: BenchContext, size: int) -> Prepared:
+    try:
+        from ice.fairness.monitor import compute_fairness_report
+    except ImportError as e:
+        raise SkipBenchmark(f"ice is not importable: {e}") from e
+
+    groups, y_true, y_pred = _fairness_inputs(ctx, size)
+    decisions = [bool(p) for p in y_pred]
+    return Prepared(
+        run=lambda: compute_fairness_report(decisions, groups, "group", outcomes=y_true),
+        ops=size,
+    )
+
+
+def _fairness_ice_reports(ctx: BenchContext, size: int) -> Prepared:
+    try:
+        from ice.fairness.monitor import compute_fairness_reports
+    except ImportError as e:
+        raise SkipBenchmark(f"ice is not importable: {e}") from e
+
+    groups, y_true, y_pred = _fairness_inputs(ctx, size)
+    rng = np.random.default_rng(ctx.seed + 1)
+    columns = {
+        "group": groups,
+        "sex": [("F", "M")[i] for i in rng.integers(0, 2, size).tolist()],
+        "age_band": [("18-24", "25-34", "35-49", "50-64", "65+")[i] for i in rng.integers(0, 5, size).tolist()],
+    }
+    decisions = [bool(p) for p in y_pred]
+    intersections = [("group", "sex"), ("sex", "age_band"), ("group", "sex", "age_band")]
+    return Prepared(
+        run=lambda: compute_fairness_reports(
+            decisions, columns, y_true, intersections=intersections, min_cell_size=30
+        ),
+        ops=size,
+    )
+
+
+def _fairness_flg_report(ctx: BenchContext, size: int) -> Prepared:
+    try:
+        from flg.fairness.metrics import group_fairness_report
+    except ImportError as e:
+        raise SkipBenchmark(f"flg fairness needs the optional 'fairlearn' package: {e}") from e
+
+    groups, y_true, y_pred = _fairness_inputs(ctx, size)
+    y_true_arr = np.asarray(y_true)
+    y_score = np.asarray(y_pred, dtype=float)
+    group = np.asarray(groups)
+    return Prepared(run=lambda: group_fairness_report(y_true=y_true_arr, y_score=y_score, group=group), ops=size)
+
+
+# ice / flg scoring -----------------------------------------------------------
+
+
+def _ice_model(ctx: BenchContext) -> Any:
+    def build() -> Any:
+        from ice.features.contract import DEFAULT_CONTRACT
+        from ice.models.sklearn_logreg import SklearnLogRegCreditModel, new_untrained_bundle
+
+        rng = np.random.default_rng(ctx.seed)
+        cols = list(DEFAULT_CONTRACT.columns())
+        x = rng.random((2000, len(cols)))
+        y = (x[:, 0] + x[:, 1] - x[:, 3] + rng.normal(0, 0.3, 2000) > 0.5).astype(int)
+        bundle = new_untrained_bundle(version="bench")
+        bundle.model.fit(x, y)
+        rows = [dict(zip(cols, r, strict=True)) for r in rng.random((N_APPLICANTS, len(cols))).tolist()]
+        return SklearnLogRegCreditModel(bundle), rows
+
+    return ctx.fixture("ice_model", build)
+
+
+def _ice_score(ctx: BenchContext, size: int) -> Prepared:
+    """
+    Per-request path of `services.api` `/v1/score`, without the audit write.
+    """
+    try:
+        from ice.explain.reason_codes import generate_reason_codes
+        from ice.features.transform import sanitize_features, to_model_vector
+    except ImportError as e:
+        raise SkipBenchmark(f"ice is not importable: {e}") from e
+
+    model, rows = _ice_model(ctx)
+    rows = rows[:size]
+
+    def run() -> None:
+        for row in rows:
+            features = sanitize_features(row)
+            x = to_model_vector(model.contract, features)
+            model.predict_proba(x)
+            generate_reason_codes(features)
+
+    return Prepared(run=run, ops=len(rows))
+
+
+def _flg_bundle(ctx: BenchContext) -> Any:
+    def build() -> Any:
+        from flg.data.synthetic import make_synthetic_training_data
+        from flg.ml.train import train_demo_model
+
+        bundle = train_demo_model(n=2000, seed=ctx.seed)
+        x, _, _ = make_synthetic_training_data(n=N_APPLICANTS, seed=ctx.seed + 1)
+        return bundle, x.to_dict(orient="records")
+
+    return ctx.fixture("flg_bundle", build)
+
+
+def _flg_score(ctx: BenchContext, size: int) -> Prepared:
+    """
+    Per-request path of `flg.api.main` `/v1/score`, without the bundle load and audit write.
+    """
+    try:
+        from flg.explainability.reason_codes import reason_codes_from_linear_model
+        from flg.features.schema import validate_feature_vector
+    except ImportError as e:
+        raise SkipBenchmark(f"flg is not importable: {e}") from e
+
+    bundle, rows = _flg_bundle(ctx)
+    rows = rows[:size]
+    feature_names = list(bundle.feature_order)
+
+    def run() -> None:
+        # The pipeline was fitted on a DataFrame; scoring plain vectors warns once per call.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            for row in rows:
+                x = validate_feature_vector(row)
+                bundle.predict_proba_one(x)
+                reason_codes_from_linear_model(feature_names=feature_names, x=x, model=bundle.model, top_k=4)
+
+    return Prepared(run=run, ops=len(rows))
+
+
+# Registry --------------------------------------------------------------------
+
+# Audit read benchmarks default to 10^4/10^5 rows; pass larger sizes (up to 10^7)
+# explicitly, e.g. `mie bench --only audit --sizes 1000000,10000000`.
+AUDIT_SIZES = (10_000, 100_000)
+
+BENCHMARKS: tuple[Benchmark, ...] = (
+    Benchmark("scoring.score_applicant", "scoring", "score_applicant, one call per applicant", (1_000,), _score_applicant),
+    Benchmark(
+        "scoring.score_applicants_batch",
+        "scoring",
+        "score_applicants_batch, one call for all applicants",
+        (1_000, 10_000),
+        _score_applicants_batch,
+    ),
+    Benchmark("audit.write", "audit", "AuditLogger.write with redaction, one transaction per event", (10_000,), _audit_write),
+    Benchmark(
+        "audit.write_many", "audit", "AuditLogger.write_many with redaction, 500 events per call", AUDIT_SIZES, _audit_write_many
+    ),
+    Benchmark("audit.query", "audit", "10 keyset-paginated pages of 100 score events", AUDIT_SIZES, _audit_query),
+    Benchmark("audit.query_applicant", "audit", "100 applicant_id lookups", AUDIT_SIZES, _audit_query_applicant),
+    Benchmark("audit.count", "audit", "count(event_type='score')", AUDIT_SIZES, _audit_count),
+    Benchmark(
+        "audit.fairness_counts", "audit", "fairness_counts over every score event (SQL aggregation)", AUDIT_SIZES, _audit_fairness_counts
+    ),
+    Benchmark("audit.export_jsonl", "audit", "export_jsonl of every row", AUDIT_SIZES, _audit_export_jsonl),
+    Benchmark("redaction.redact_event", "redaction", "PIIRedactor.redact_event (compiled plan)", (20_000,), _redact_event),
+    Benchmark(
+        "redaction.redact_event_reference",
+        "redaction",
+        "uncompiled reference redaction path",
+        (20_000,),
+        _redact_event_reference,
+    ),
+    Benchmark(
+        "fairness.selection_rates",
+        "fairness",
+        "selection_rates_by_group + demographic_parity_difference",
+        (10_000, 100_000),
+        _fairness_selection_rates,
+    ),
+    Benchmark(
+        "fairness.tpr", "fairness", "tpr_by_group + equal_opportunity_difference", (10_000, 100_000), _fairness_tpr
+    ),
+    Benchmark(
+        "fairness.metrics_arrays",
+        "fairness",
+        "compute_fairness_metrics on numpy inputs (all per-group rates)",
+        (10_000, 100_000),
+        _fairness_metrics_arrays,
+    ),
+    Benchmark(
+        "fairness.bootstrap",
+        "fairness",
+        "bootstrap_intervals over the counts of 100k rows (size = replicates)",
+        (1_000, 10_000),
+        _fairness_bootstrap,
+    ),
+    Benchmark(
+        "fairness.ice_report", "fairness", "ice compute_fairness_report with outcomes", (10_000, 100_000), _fairness_ice_report
+    ),
+    Benchmark(
+        "fairness.ice_reports",
+        "fairness",
+        "ice compute_fairness_reports: 3 attributes + 3 intersections",
+        (10_000, 100_000),
+        _fairness_ice_reports,
+    ),
+    Benchmark(
+        "fairness.flg_report", "fairness", "flg group_fairness_report (fairlearn)", (10_000, 100_000), _fairness_flg_report
+    ),
+    Benchmark("ice.score", "ice", "ice scoring path, one applicant at a time", (1_000,), _ice_score),
+    Benchmark("flg.score", "flg", "flg scoring path, one applicant at a time", (1_000,), _flg_score),
+)
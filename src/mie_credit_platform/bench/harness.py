@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import gc
+import importlib.metadata
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+REPORT_FORMAT = 1
+
+# Runs slower than baseline * (1 + tolerance) are flagged as regressions.
+DEFAULT_TOLERANCE = 0.10
+
+
+class SkipBenchmark(Exception):
+    """
+    Raised by a setup function when a benchmark cannot run here (e.g. a missing optional package).
+    """
+
+
+@dataclass(frozen=True)
+class Prepared:
+    # Performs `ops` operations per call; only this is timed.
+    run: Callable[[], object]
+    ops: int
+    cleanup: Callable[[], None] | None = None
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    group: str
+    description: str
+    sizes: tuple[int, ...]
+    setup: Callable[[BenchContext, int], Prepared]
+
+
+class BenchContext:
+    """
+    Scratch space and lazily built fixtures shared by every benchmark in one run.
+    """
+
+    def __init__(self, workdir: str | None = None, *, seed: int = 7) -> None:
+        self.seed = seed
+        self._owned = workdir is None
+        self.workdir = Path(workdir or tempfile.mkdtemp(prefix="mie-bench-"))
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self._fixtures: dict[Any, Any] = {}
+        self._n_paths = 0
+
+    def fixture(self, key: Any, build: Callable[[], Any]) -> Any:
+        if key not in self._fixtures:
+            self._fixtures[key] = build()
+        return self._fixtures[key]
+
+    def path(self, name: str) -> Path:
+        """
+        Fresh, unique path under the working directory.
+        """
+        self._n_paths += 1
+        return self.workdir / f"{self._n_paths:04d}-{name}"
+
+    def close(self) -> None:
+        for value in self._fixtures.values():
+            close = getattr(value, "close", None)
+            if callable(close):
+                close()
+        self._fixtures.clear()
+        if self._owned:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    # Nearest-rank percentile; repeat counts are small.
+    idx = max(0, min(len(sorted_values) - 1, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def measure(prepared: Prepared, *, repeat: int, warmup: bool = True) -> dict[str, Any]:
+    """
+    Time `repeat` calls of `prepared.run` (after one untimed warmup call) with the GC disabled.
+    """
+    if warmup:
+        prepared.run()
+    times: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            prepared.run()
+            times.append(time.perf_counter() - started)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    ordered = sorted(times)
+    median = _percentile(ordered, 0.5)
+    return {
+        "ops": prepared.ops,
+        "repeat": len(times),
+        "times_s": times,
+        "min_s": ordered[0],
+        "median_s": median,
+        "p95_s": _percentile(ordered, 0.95),
+        "mean_s": sum(times) / len(times),
+        "us_per_op": median / prepared.ops * 1e6 if prepared.ops else None,
+        "ops_per_s": prepared.ops / median if median > 0 else None,
+    }
+
+
+def select(benchmarks: Iterable[Benchmark], only: Iterable[str] | None = None) -> list[Benchmark]:
+    """
+    Benchmarks whose name or group matches one of `only` (a prefix match on the dotted name).
+    """
+    patterns = [p for p in (only or []) if p]
+    if not patterns:
+        return list(benchmarks)
+    return [
+        b
+        for b in benchmarks
+        if any(b.group == p or b.name == p or b.name.startswith(p.rstrip(".") + ".") for p in patterns)
+    ]
+
+
+def environment() -> dict[str, Any]:
+    versions: dict[str, str | None] = {}
+    for dist in ("inclusive-credit-engine", "numpy", "pandas", "scikit-learn", "fastapi", "pydantic"):
+        try:
+            versions[dist] = importlib.metadata.version(dist)
+        except importlib.metadata.PackageNotFoundError:
+            versions[dist] = None
+    try:
+        git_rev: str | None = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        git_rev = None
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "sqlite": sqlite3.sqlite_version,
+        "git_rev": git_rev,
+        "packages": versions,
+    }
+
+
+@dataclass
+class SuiteOptions:
+    repeat: int = 5
+    warmup: bool = True
+    # Overrides every selected benchmark's default sizes.
+    sizes: tuple[int, ...] | None = None
+    workdir: str | None = None
+    seed: int = 7
+    progress: Callable[[str], None] | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+def run_benchmarks(benchmarks: Iterable[Benchmark], options: SuiteOptions | None = None) -> dict[str, Any]:
+    """
+    Run benchmarks and return a JSON-serializable report.
+
+    Each (benchmark, size) pair becomes one result keyed by `"<name>[<size>]"`.
+    A setup that raises `SkipBenchmark` is recorded as skipped; any other failure
+    is recorded as an error so one broken case does not abort the run.
+    """
+    options = options or SuiteOptions()
+    ctx = BenchContext(options.workdir, seed=options.seed)
+    results: list[dict[str, Any]] = []
+    started = time.time()
+    try:
+        for bench in benchmarks:
+            for size in options.sizes or bench.sizes:
+                record: dict[str, Any] = {
+                    "key": result_key(bench.name, size),
+                    "name": bench.name,
+                    "group": bench.group,
+                    "size": size,
+                }
+                if options.progress is not None:
+                    options.progress(record["key"])
+                prepared: Prepared | None = None
+                try:
+                    prepared = bench.setup(ctx, size)
+                    record.update(measure(prepared, repeat=options.repeat, warmup=options.warmup))
+                except SkipBenchmark as e:
+                    record["skipped"] = str(e)
+                except Exception as e:
+                    record["error"] = f"{type(e).__name__}: {e}"
+                finally:
+                    if prepared is not None and prepared.cleanup is not None:
+                        prepared.cleanup()
+                results.append(record)
+    finally:
+        ctx.close()
+    return {
+        "format": REPORT_FORMAT,
+        "created_at_unix": started,
+        "elapsed_s": round(time.time() - started, 3),
+        "environment": environment(),
+        "options": {"repeat": options.repeat, "warmup": options.warmup, "seed": options.seed, **options.extra},
+        "results": results,
+    }
+
+
+def result_key(name: str, size: int) -> str:
+    return f"{name}[{size}]"
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], *, tolerance: float = DEFAULT_TOLERANCE) -> dict[str, Any]:
+    """
+    Compare median times against a baseline report.
+
+    `ratio` is current / baseline median, so values above 1 are slower. A result
+    is a `regression` above `1 + tolerance`, an `improvement` below
+    `1 / (1 + tolerance)`, `new` when the baseline lacks it and `ok` otherwise.
+    """
+    if baseline.get("format") != REPORT_FORMAT:
+        raise ValueError(f"Unsupported baseline format {baseline.get('format')!r}; expected {REPORT_FORMAT}")
+    previous = {r["key"]: r for r in baseline.get("results", []) if "median_s" in r}
+    rows: list[dict[str, Any]] = []
+    for r in report["results"]:
+        if "median_s" not in r:
+            continue
+        base = previous.get(r["key"])
+        if base is None:
+            rows.append({"key": r["key"], "status": "new", "median_s": r["median_s"]})
+            continue
+        ratio = r["median_s"] / base["median_s"] if base["median_s"] > 0 else float("inf")
+        if ratio > 1 + tolerance:
+            status = "regression"
+        elif ratio < 1 / (1 + tolerance):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "key": r["key"],
+                "status": status,
+                "ratio": round(ratio, 4),
+                "median_s": r["median_s"],
+                "baseline_median_s": base["median_s"],
+            }
+        )
+    current = {r["key"] for r in report["results"]}
+    return {
+        "tolerance": tolerance,
+        "baseline_git_rev": baseline.get("environment", {}).get("git_rev"),
+        "regressions": sum(1 for row in rows if row["status"] == "regression"),
+        "improvements": sum(1 for row in rows if row["status"] == "improvement"),
+        "missing": sorted(k for k in previous if k not in current),
+        "results": rows,
+    }
+
+
+def load_report(path: str) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def write_report(report: dict[str, Any], path: str) -> None:
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f"{out.name}.tmp")
+    tmp.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(out)
@@ -1,18 +1,16 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 from typing import Optional
 
 import typer
 
-from mie_credit_platform.governance.registry import approve_model, list_models
-from mie_credit_platform.governance.registry import load_approved_model
-from mie_credit_platform.audit import AuditLogger, build_redactor_from_settings
-from mie_credit_platform.modeling.scoring import score_applicant
-from mie_credit_platform.modeling.train import TrainConfig, train_baseline_logreg
 from mie_credit_platform.settings import get_settings
 
+# Commands import what they need when they run, so light commands (list-models,
+# audit-*) never pay for pandas/sklearn. tests/test_mie_cli_imports.py guards this.
 
 app = typer.Typer(help="MIE Credit Platform CLI (training, registry, governance).")
 
@@ -27,6 +25,7 @@ def train(
     """
     Train a demo baseline model on synthetic data and write a versioned model package.
     """
+    from mie_credit_platform.modeling.train import TrainConfig, train_baseline_logreg
 
     res = train_baseline_logreg(TrainConfig(version=version, registry_dir=out, n_synth=n, seed=seed))
     typer.echo(json.dumps(res, indent=2))
@@ -34,6 +33,8 @@ def train(
 
 @app.command("list-models")
 def list_models_cmd(registry_dir: Optional[str] = typer.Option(None, help="Registry directory.")) -> None:
+    from mie_credit_platform.governance.registry import list_models
+
     settings = get_settings()
     d = registry_dir or settings.model_registry_dir
     models = list_models(d)
@@ -46,12 +47,30 @@ def approve_model_cmd(
     registry_dir: Optional[str] = typer.Option(None, help="Registry directory."),
     approved: bool = typer.Option(True, help="Set approved true/false."),
 ) -> None:
+    from mie_credit_platform.governance.registry import approve_model
+
     settings = get_settings()
     d = registry_dir or settings.model_registry_dir
     approve_model(d, version, approved=approved)
     typer.echo(json.dumps({"version": version, "approved": approved, "registry_dir": d}, indent=2))
 
 
+@app.command("activate-model")
+def activate_model_cmd(
+    version: str = typer.Argument(..., help="Model version to serve."),
+    registry_dir: Optional[str] = typer.Option(None, help="Registry directory."),
+) -> None:
+    """
+    Point the registry's ACTIVE marker at a version; running APIs hot-reload it.
+    """
+    from mie_credit_platform.governance.registry import set_active_version
+
+    settings = get_settings()
+    d = registry_dir or settings.model_registry_dir
+    set_active_version(d, version)
+    typer.echo(json.dumps({"active_version": version, "registry_dir": d}, indent=2))
+
+
 @app.command("show-model-card")
 def show_model_card(
     version: str = typer.Argument(..., help="Model version."),
@@ -79,6 +98,9 @@ def score(
     """
     Score an applicant using the active model package.
     """
+    from mie_credit_platform.governance.registry import load_approved_model
+    from mie_credit_platform.modeling.scoring import score_applicant
+
     settings = get_settings()
     d = registry_dir or settings.model_registry_dir
     v = version or settings.model_version
@@ -116,6 +138,57 @@ def score(
     )
 
 
+@app.command("score-file")
+def score_file_cmd(
+    input_path: str = typer.Argument(..., help="CSV, JSONL or Parquet file with one applicant per row."),
+    output: str = typer.Option(..., help="Output file (.csv, .jsonl or .parquet; .gz allowed for csv/jsonl)."),
+    input_format: Optional[str] = typer.Option(None, help="Input format (default: from suffix)."),
+    output_format: Optional[str] = typer.Option(None, help="Output format (default: from suffix)."),
+    chunk_size: int = typer.Option(50000, min=1, help="Rows scored per chunk."),
+    workers: int = typer.Option(0, min=0, help="Score chunks on a process pool of this size (0 = in-process; pays off for heavier models)."),
+    id_column: str = typer.Option("applicant_id", help="Column holding applicant ids (row number if absent)."),
+    audit: bool = typer.Option(False, help="Write one audit event per scored row (bulk, per chunk)."),
+    threshold: Optional[float] = typer.Option(None, help="Approval threshold (overrides settings)."),
+    registry_dir: Optional[str] = typer.Option(None, help="Registry directory."),
+    version: Optional[str] = typer.Option(None, help="Model version (overrides settings)."),
+    require_approval: Optional[bool] = typer.Option(
+        None, help="Require model approval (defaults to env!=dev)."
+    ),
+) -> None:
+    """
+    Score a whole file in chunks, writing scores, decisions and reason codes in input order.
+    """
+    from mie_credit_platform.audit import build_audit_logger_from_settings
+    from mie_credit_platform.file_scoring import score_file
+
+    settings = get_settings()
+    req_approval = (
+        require_approval if require_approval is not None else settings.environment.lower() != "dev"
+    )
+    audit_logger = build_audit_logger_from_settings(settings) if audit else None
+    try:
+        summary = score_file(
+            input_path,
+            output,
+            registry_dir=registry_dir or settings.model_registry_dir,
+            version=version or settings.model_version,
+            require_approval=req_approval,
+            threshold=float(threshold if threshold is not None else settings.approval_threshold),
+            input_format=input_format,
+            output_format=output_format,
+            chunk_size=chunk_size,
+            workers=workers,
+            id_column=id_column,
+            audit=audit_logger,
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+    finally:
+        if audit_logger is not None:
+            audit_logger.close()
+    typer.echo(json.dumps(summary, indent=2))
+
+
 @app.command()
 def explain(
     applicant_id: str = typer.Option(..., help="Applicant identifier."),
@@ -130,6 +203,9 @@ def explain(
     """
     Produce a best-effort explanation (linear models only).
     """
+    from mie_credit_platform.governance.registry import load_approved_model
+    from mie_credit_platform.modeling.scoring import score_applicant
+
     settings = get_settings()
     d = registry_dir or settings.model_registry_dir
     v = version or settings.model_version
@@ -160,6 +236,7 @@ def explain(
 def audit_events(
     limit: int = typer.Option(50, help="Max events to return (<=1000)."),
     offset: int = typer.Option(0, help="Pagination offset."),
+    cursor: Optional[str] = typer.Option(None, help="Keyset cursor from a previous page's next_cursor."),
     since_ts: Optional[float] = typer.Option(None, help="Filter: ts >= since_ts."),
     until_ts: Optional[float] = typer.Option(None, help="Filter: ts <= until_ts."),
     request_id: Optional[str] = typer.Option(None, help="Filter by request id."),
@@ -171,12 +248,12 @@ def audit_events(
     """
     List audit events from the SQLite audit store.
     """
+    from mie_credit_platform.audit import build_audit_logger_from_settings, next_cursor
+
     settings = get_settings()
-    audit = AuditLogger(
-        audit_db_path or settings.audit_db_path,
-        settings.audit_jsonl_path,
-        redactor=build_redactor_from_settings(settings),
-    )
+    if audit_db_path:
+        settings = settings.model_copy(update={"audit_db_path": audit_db_path})
+    audit = build_audit_logger_from_settings(settings)
     total = audit.count(
         since_ts=since_ts,
         until_ts=until_ts,
@@ -185,9 +262,12 @@ def audit_events(
         applicant_id=applicant_id,
         model_version=model_version,
     )
+    if cursor and offset:
+        raise typer.BadParameter("Provide only one of --cursor or --offset")
     events = audit.query(
         limit=limit,
         offset=offset,
+        cursor=cursor,
         since_ts=since_ts,
         until_ts=until_ts,
         request_id=request_id,
@@ -202,6 +282,7 @@ def audit_events(
                 "limit": max(1, min(int(limit), 1000)),
                 "offset": max(0, int(offset)),
                 "events": [e.__dict__ for e in events],
+                "next_cursor": next_cursor(events, max(1, min(int(limit), 1000))),
             },
             indent=2,
         )
@@ -217,17 +298,18 @@ def audit_export(
     event_type: Optional[str] = typer.Option(None, help="Filter by event type."),
     applicant_id: Optional[str] = typer.Option(None, help="Filter by applicant id."),
     model_version: Optional[str] = typer.Option(None, help="Filter by model version."),
+    cursor: Optional[str] = typer.Option(None, help="Resume after this keyset cursor."),
     audit_db_path: Optional[str] = typer.Option(None, help="Override audit sqlite path."),
 ) -> None:
     """
     Export audit events to a JSONL file.
     """
+    from mie_credit_platform.audit import build_audit_logger_from_settings
+
     settings = get_settings()
-    audit = AuditLogger(
-        audit_db_path or settings.audit_db_path,
-        settings.audit_jsonl_path,
-        redactor=build_redactor_from_settings(settings),
-    )
+    if audit_db_path:
+        settings = settings.model_copy(update={"audit_db_path": audit_db_path})
+    audit = build_audit_logger_from_settings(settings)
     n = audit.export_jsonl(
         out_path,
         since_ts=since_ts,
@@ -236,7 +318,161 @@ def audit_export(
         event_type=event_type,
         applicant_id=applicant_id,
         model_version=model_version,
+        cursor=cursor,
     )
     typer.echo(json.dumps({"out_path": out_path, "rows_written": n}, indent=2))
 
 
+@app.command("audit-prune")
+def audit_prune(
+    older_than_days: float = typer.Option(..., help="Drop partitions that ended more than N days ago."),
+    audit_db_path: Optional[str] = typer.Option(None, help="Override audit sqlite path."),
+) -> None:
+    """
+    Apply audit retention by dropping whole time partitions (requires MIE_AUDIT_PARTITIONING).
+    """
+    from mie_credit_platform.audit import build_audit_logger_from_settings
+
+    settings = get_settings()
+    if audit_db_path:
+        settings = settings.model_copy(update={"audit_db_path": audit_db_path})
+    if not settings.audit_partitioning:
+        raise typer.BadParameter("Retention pruning requires a partitioned audit store (MIE_AUDIT_PARTITIONING)")
+    audit = build_audit_logger_from_settings(settings)
+    dropped = audit.drop_partitions_before(time.time() - older_than_days * 86400)
+    typer.echo(json.dumps({"dropped_partitions": dropped}, indent=2))
+
+
+@app.command("fairness-report")
+def fairness_report(
+    attribute: str = typer.Option(..., help="audit_context attribute to group by, e.g. sex or age_band."),
+    since_ts: Optional[float] = typer.Option(None, help="Decisions made at or after this time."),
+    until_ts: Optional[float] = typer.Option(None, help="Decisions made at or before this time."),
+    model_version: Optional[str] = typer.Option(None, help="Only decisions by this model version."),
+    chunk_s: float = typer.Option(86400.0, min=1.0, help="Seconds of audit history aggregated per query."),
+    n_bootstrap: int = typer.Option(0, min=0, help="Bootstrap replicates for confidence intervals (0 = none)."),
+    confidence: float = typer.Option(0.95, min=0.5, max=0.999, help="Confidence level of the intervals."),
+    seed: Optional[int] = typer.Option(None, help="Seed for reproducible bootstrap intervals."),
+    audit_db_path: Optional[str] = typer.Option(None, help="Override audit sqlite path."),
+) -> None:
+    """
+    Fairness metrics for a window of decisions, aggregated inside the audit store.
+    """
+    from mie_credit_platform.audit import build_audit_logger_from_settings
+    from mie_credit_platform.modeling.fairness import bootstrap_intervals
+
+    settings = get_settings()
+    if audit_db_path:
+        settings = settings.model_copy(update={"audit_db_path": audit_db_path})
+    audit = build_audit_logger_from_settings(settings)
+    try:
+        acc = audit.fairness_counts(
+            attribute, since_ts=since_ts, until_ts=until_ts, model_version=model_version, chunk_s=chunk_s
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+    fm = acc.metrics()
+    ci = None
+    if n_bootstrap:
+        try:
+            ci = bootstrap_intervals(fm.counts, n_replicates=n_bootstrap, confidence=confidence, seed=seed).to_dict()
+        except ValueError as e:
+            raise typer.BadParameter(str(e)) from e
+    typer.echo(
+        json.dumps(
+            {
+                "attribute": attribute,
+                "model_version": model_version,
+                "since_ts": since_ts,
+                "until_ts": until_ts,
+                "groups": fm.groups,
+                "demographic_parity_difference": fm.demographic_parity_difference,
+                "equal_opportunity_difference": fm.equal_opportunity_difference,
+                "selection_rate_by_group": fm.selection_rate,
+                "tpr_by_group": fm.tpr,
+                "fpr_by_group": fm.fpr,
+                "precision_by_group": fm.precision,
+                "calibration_in_the_large_by_group": fm.calibration_in_the_large,
+                "counts": acc.to_dict(),
+                "confidence_intervals": ci,
+            },
+            indent=2,
+        )
+    )
+
+
+@app.command()
+def bench(
+    out: Optional[str] = typer.Option(None, help="Write the JSON report here (default: stdout)."),
+    baseline: Optional[str] = typer.Option(None, help="Compare against a previously saved report."),
+    only: Optional[str] = typer.Option(
+        None, help="Comma-separated benchmark names or groups, e.g. 'audit' or 'scoring.score_applicant,ice'."
+    ),
+    sizes: Optional[str] = typer.Option(
+        None, help="Comma-separated sizes overriding the defaults, e.g. 10000,1000000,10000000 with --only audit."
+    ),
+    repeat: int = typer.Option(5, min=1, help="Timed runs per benchmark and size."),
+    warmup: bool = typer.Option(True, help="Run each case once untimed before timing."),
+    tolerance: float = typer.Option(0.10, min=0.0, help="Slowdown vs baseline flagged as a regression."),
+    fail_on_regression: bool = typer.Option(False, help="Exit 1 if any benchmark regressed vs the baseline."),
+    workdir: Optional[str] = typer.Option(None, help="Scratch directory (default: a temporary one)."),
+    list_only: bool = typer.Option(False, "--list", help="List benchmarks and exit."),
+) -> None:
+    """
+    Time the platform's hot paths and emit a machine-readable JSON report.
+    """
+    from mie_credit_platform.bench.cases import BENCHMARKS
+    from mie_credit_platform.bench.harness import (
+        SuiteOptions,
+        compare,
+        load_report,
+        run_benchmarks,
+        select,
+        write_report,
+    )
+
+    patterns = [p.strip() for p in only.split(",")] if only else None
+    selected = select(BENCHMARKS, patterns)
+    if list_only:
+        typer.echo(
+            json.dumps(
+                [{"name": b.name, "group": b.group, "sizes": list(b.sizes), "description": b.description} for b in selected],
+                indent=2,
+            )
+        )
+        return
+    if not selected:
+        raise typer.BadParameter(f"No benchmark matches {only!r}")
+    try:
+        size_override = tuple(int(s) for s in sizes.split(",") if s.strip()) if sizes else None
+    except ValueError as e:
+        raise typer.BadParameter(f"Invalid --sizes {sizes!r}") from e
+    baseline_report = load_report(baseline) if baseline else None
+
+    report = run_benchmarks(
+        selected,
+        SuiteOptions(
+            repeat=repeat,
+            warmup=warmup,
+            sizes=size_override,
+            workdir=workdir,
+            progress=lambda key: typer.echo(f"running {key}", err=True),
+        ),
+    )
+    if baseline_report is not None:
+        try:
+            report["comparison"] = compare(report, baseline_report, tolerance=tolerance)
+        except ValueError as e:
+            raise typer.BadParameter(str(e)) from e
+        report["comparison"]["baseline"] = baseline
+    if out:
+        write_report(report, out)
+        typer.echo(f"wrote {out}", err=True)
+    else:
+        typer.echo(json.dumps(report, indent=2, sort_keys=True))
+    if baseline_report is not None and fail_on_regression and report["comparison"]["regressions"]:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import calendar
+import heapq
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from mie_credit_platform.audit import (
+    OUTCOME_EVENT_TYPE,
+    SCORE_EVENT_TYPE,
+    AuditEvent,
+    AuditLogger,
+    StoredAuditEvent,
+)
+from mie_credit_platform.modeling.fairness import FairnessAccumulator
+
+__all__ = [
+    "DEFAULT_ATTRIBUTES",
+    "DEFAULT_OVERLAP_S",
+    "OUTCOME_EVENT_TYPE",
+    "SCORE_EVENT_TYPE",
+    "SELECTED_DECISION",
+    "FairnessLedger",
+    "FairnessLedgerSaver",
+    "outcome_event",
+]
+
+logger = logging.getLogger(__name__)
+
+# `AuditContext` fields; each one is tracked as a separate protected attribute.
+DEFAULT_ATTRIBUTES = ("age_band", "race_ethnicity", "sex")
+SELECTED_DECISION = "APPROVE"
+
+_DAY_S = 86400
+_FORMAT = 1
+# How far behind the watermark `catch_up` re-reads; covers events committed out of time order.
+DEFAULT_OVERLAP_S = 60.0
+
+# (UTC day ordinal, model version or "", attribute)
+BucketKey = tuple[int, str, str]
+
+
+def _day(ts: float) -> int:
+    return int(ts // _DAY_S)
+
+
+def outcome_event(score_event: StoredAuditEvent, outcome: int, *, ts: float) -> AuditEvent:
+    """
+    Audit event labelling a stored score event with its observed outcome (1 = positive).
+
+    The decision, score and audit context are copied so the event can be folded
+    into a ledger without looking the score event up again.
+    """
+    payload: dict[str, Any] = {
+        "outcome": int(outcome),
+        "decision": score_event.payload.get("decision"),
+        "score": score_event.payload.get("score"),
+        "decision_ts": score_event.ts,
+        "score_event_id": score_event.id,
+    }
+    if score_event.payload.get("audit_context") is not None:
+        payload["audit_context"] = score_event.payload["audit_context"]
+    return AuditEvent(
+        ts=ts,
+        request_id=score_event.request_id,
+        event_type=OUTCOME_EVENT_TYPE,
+        model_version=score_event.model_version,
+        applicant_id=None,
+        payload=payload,
+    )
+
+
+class FairnessLedger:
+    """
+    Per-day fairness accumulators fed from audit events as they are written.
+
+    A score event with an `audit_context` counts one decision per protected
+    attribute in the UTC day it was made. An outcome event labels that decision
+    in the same day bucket (keyed by `decision_ts`), so a window always
+    describes the cohort of decisions made in it. A window is the sum of its
+    day buckets: reading it costs O(groups x days), never a scan of the store.
+
+    `watermark_ts` is the newest observed event's time. `catch_up` folds in the
+    stored events after it, so a ledger saved by a process that then stopped
+    (or never saved) is brought level with the audit store on the next start.
+    It re-reads `overlap_s` behind the watermark and skips the ids already
+    observed there, so events sharing the watermark's time or committed up to
+    `overlap_s` out of time order are neither lost nor counted twice.
+
+    States from other workers or processes combine with `merge`.
+    """
+
+    def __init__(
+        self,
+        *,
+        attributes: Sequence[str] = DEFAULT_ATTRIBUTES,
+        selected_decision: str = SELECTED_DECISION,
+        overlap_s: float = DEFAULT_OVERLAP_S,
+    ) -> None:
+        self.attributes = tuple(attributes)
+        self.selected_decision = selected_decision
+        self.overlap_s = float(overlap_s)
+        self._buckets: dict[BucketKey, FairnessAccumulator] = {}
+        self.watermark_ts: float | None = None
+        # Ids of stored events observed within `overlap_s` of the watermark, oldest first in the heap.
+        self._recent_ids: set[int] = set()
+        self._recent_heap: list[tuple[float, int]] = []
+        self._lock = threading.Lock()
+
+    def observe(self, events: Iterable[AuditEvent]) -> None:
+        """
+        Fold score and outcome events in; other event types are ignored, and so are
+        stored events whose id was already observed.
+
+        Suitable as an audit logger listener (see `AuditLogger.add_listener`).
+        """
+        with self._lock:
+            for e in events:
+                event_id = getattr(e, "id", None)
+                if event_id is not None and event_id in self._recent_ids:
+                    continue
+                if e.event_type == SCORE_EVENT_TYPE:
+                    self._fold(e, e.ts, outcome=None)
+                elif e.event_type == OUTCOME_EVENT_TYPE:
+                    decision_ts = e.payload.get("decision_ts")
+                    outcome = e.payload.get("outcome")
+                    if isinstance(decision_ts, (int, float)) and outcome in (0, 1):
+                        self._fold(e, float(decision_ts), outcome=int(outcome))
+                else:
+                    continue
+                if self.watermark_ts is None or e.ts > self.watermark_ts:
+                    self.watermark_ts = e.ts
+                if event_id is not None:
+                    self._recent_ids.add(event_id)
+                    heapq.heappush(self._recent_heap, (e.ts, event_id))
+            self._prune_recent()
+
+    def _prune_recent(self) -> None:
+        if self.watermark_ts is None:
+            return
+        horizon = self.watermark_ts - self.overlap_s
+        while self._recent_heap and self._recent_heap[0][0] < horizon:
+            self._recent_ids.discard(heapq.heappop(self._recent_heap)[1])
+
+    def catch_up(self, audit: AuditLogger, *, batch_size: int = 1000) -> int:
+        """
+        Fold in stored score and outcome events from `overlap_s` before `watermark_ts`
+        on (all of them when it is unset), skipping ids already observed. Returns the
+        number of events folded in.
+
+        Call before registering `observe` as a listener, so no event is counted twice.
+        """
+        with self._lock:
+            since_ts = None if self.watermark_ts is None else self.watermark_ts - self.overlap_s
+            seen = set(self._recent_ids)
+        n = 0
+        for event_type in (SCORE_EVENT_TYPE, OUTCOME_EVENT_TYPE):
+            batch: list[StoredAuditEvent] = []
+            for e in audit.iter_events(since_ts=since_ts, event_type=event_type, batch_size=batch_size):
+                if e.id in seen:
+                    continue
+                batch.append(e)
+                if len(batch) >= batch_size:
+                    self.observe(batch)
+                    n += len(batch)
+                    batch = []
+            self.observe(batch)
+            n += len(batch)
+        return n
+
+    def _fold(self, e: AuditEvent, decision_ts: float, *, outcome: int | None) -> None:
+        context = e.payload.get("audit_context")
+        if not isinstance(context, Mapping):
+            return
+        selected = e.payload.get("decision") == self.selected_decision
+        score = e.payload.get("score")
+        day, version = _day(decision_ts), e.model_version or ""
+        for attribute in self.attributes:
+            group = context.get(attribute)
+            if group is None:
+                continue
+            key = (day, version, attribute)
+            acc = self._buckets.get(key)
+            if acc is None:
+                acc = self._buckets[key] = FairnessAccumulator()
+            if outcome is None:
+                acc.add_decision(str(group), selected)
+            else:
+                acc.add_outcome(
+                    str(group), selected, bool(outcome), float(score) if isinstance(score, (int, float)) else None
+                )
+
+    def window(
+        self,
+        attribute: str,
+        *,
+        since_ts: float | None = None,
+        until_ts: float | None = None,
+        model_version: str | None = None,
+    ) -> FairnessAccumulator:
+        """
+        Merged counts for one attribute over the UTC days overlapping `[since_ts, until_ts]`.
+
+        Buckets are whole days, so a partial day at either end is included in full.
+        """
+        first = None if since_ts is None else _day(since_ts)
+        last = None if until_ts is None else _day(until_ts)
+        out = FairnessAccumulator()
+        with self._lock:
+            for (day, version, attr), acc in self._buckets.items():
+                if attr != attribute or (model_version is not None and version != model_version):
+                    continue
+                if (first is not None and day < first) or (last is not None and day > last):
+                    continue
+                out += acc
+        return out
+
+    def days(self) -> list[int]:
+        with self._lock:
+            return sorted({day for day, _, _ in self._buckets})
+
+    def merge(self, other: FairnessLedger) -> None:
+        """
+        Add another ledger's counts (e.g. from another worker) into this one.
+        """
+        with other._lock:
+            items = [(key, acc.copy()) for key, acc in other._buckets.items()]
+            other_watermark = other.watermark_ts
+            other_recent = list(other._recent_heap)
+        with self._lock:
+            if other_watermark is not None and (self.watermark_ts is None or other_watermark > self.watermark_ts):
+                self.watermark_ts = other_watermark
+            for key, acc in items:
+                mine = self._buckets.get(key)
+                if mine is None:
+                    self._buckets[key] = acc
+                else:
+                    mine += acc
+            for ts, event_id in other_recent:
+                if event_id not in self._recent_ids:
+                    self._recent_ids.add(event_id)
+                    heapq.heappush(self._recent_heap, (ts, event_id))
+            self._prune_recent()
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            buckets = [
+                {
+                    "day": time.strftime("%Y-%m-%d", time.gmtime(day * _DAY_S)),
+                    "model_version": version or None,
+                    "attribute": attribute,
+                    "counts": acc.to_dict(),
+                }
+                for (day, version, attribute), acc in sorted(self._buckets.items())
+            ]
+            watermark_ts = self.watermark_ts
+            recent_ids = [[ts, event_id] for ts, event_id in sorted(self._recent_heap)]
+        return {
+            "format": _FORMAT,
+            "attributes": list(self.attributes),
+            "selected_decision": self.selected_decision,
+            "overlap_s": self.overlap_s,
+            "watermark_ts": watermark_ts,
+            "recent_ids": recent_ids,
+            "buckets": buckets,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> FairnessLedger:
+        if data.get("format") != _FORMAT:
+            raise ValueError(f"Unsupported fairness ledger format {data.get('format')!r}")
+        ledger = cls(
+            attributes=data.get("attributes") or DEFAULT_ATTRIBUTES,
+            selected_decision=data.get("selected_decision") or SELECTED_DECISION,
+            overlap_s=float(data.get("overlap_s", DEFAULT_OVERLAP_S)),
+        )
+        for b in data.get("buckets") or []:
+            day = _day(calendar.timegm(time.strptime(b["day"], "%Y-%m-%d")))
+            key = (day, b.get("model_version") or "", str(b["attribute"]))
+            ledger._buckets[key] = FairnessAccumulator.from_dict(b["counts"])
+        if data.get("watermark_ts") is not None:
+            ledger.watermark_ts = float(data["watermark_ts"])
+        for ts, event_id in data.get("recent_ids") or []:
+            ledger._recent_ids.add(int(event_id))
+            ledger._recent_heap.append((float(ts), int(event_id)))
+        heapq.heapify(ledger._recent_heap)
+        return ledger
+
+    def save(self, path: str) -> None:
+        """
+        Write the state as JSON, atomically replacing `path`.
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, separators=(",", ":"))
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, *paths: str) -> FairnessLedger:
+        """
+        Load one saved state, merging several (e.g. one file per worker) when given more.
+        """
+        if not paths:
+            raise ValueError("At least one path is required")
+        ledgers = [cls.from_dict(json.loads(Path(p).read_text(encoding="utf-8"))) for p in paths]
+        for other in ledgers[1:]:
+            ledgers[0].merge(other)
+        return ledgers[0]
+
+
+class FairnessLedgerSaver:
+    """
+    Saves a ledger to `path` every `interval_s` seconds on a background thread.
+
+    Bounds what a crash can lose to one interval; the rest is recovered by
+    `FairnessLedger.catch_up` on the next start.
+    """
+
+    def __init__(self, ledger: FairnessLedger, path: str, *, interval_s: float = 60.0) -> None:
+        self.ledger = ledger
+        self.path = path
+        self.interval_s = float(interval_s)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mie-fairness-ledger-saver", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(1.0, self.interval_s))
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.ledger.save(self.path)
+            except Exception as e:  # pragma: no cover - keep saving on the next tick
+                logger.error("fairness_ledger_save_failed", extra={"error": str(e), "path": self.path})
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import IO, Any
+
+import numpy as np
+import pandas as pd
+
+from mie_credit_platform import serialization
+from mie_credit_platform.audit import AuditEvent, now_ts
+from mie_credit_platform.governance.registry import load_approved_model
+from mie_credit_platform.modeling.model_io import ModelPackage
+from mie_credit_platform.modeling.scoring import score_matrix
+
+logger = logging.getLogger("mie.file_scoring")
+
+FILE_FORMATS = ("csv", "jsonl", "parquet")
+
+OUTPUT_COLUMNS = ["applicant_id", "model_version", "score", "decision", "reason_codes", "error"]
+
+
+def detect_format(path: str, fmt: str | None = None) -> str:
+    """
+    Resolve the file format from `fmt` or the path suffix (`.gz` is allowed for csv/jsonl).
+    """
+    if fmt is not None:
+        if fmt not in FILE_FORMATS:
+            raise ValueError(f"Unsupported format {fmt!r}; expected one of {FILE_FORMATS}")
+        return fmt
+    name = path.lower().removesuffix(".gz")
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if name.endswith((".parquet", ".pq")):
+        return "parquet"
+    raise ValueError(f"Cannot infer file format from {path!r}; pass one of {FILE_FORMATS} explicitly")
+
+
+def _pyarrow_parquet() -> Any:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise RuntimeError("Parquet files require the optional 'pyarrow' package (pip install '.[parquet]')") from e
+    return pq
+
+
+def _id_text(value: Any) -> str | None:
+    if value is None or value == "" or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+def _iter_jsonl_chunks(path: str, chunk_size: int, id_column: str) -> Iterator[pd.DataFrame]:
+    # Parsed line by line: pandas' JSON reader turns integer ids into floats (123 -> 123.0)
+    # as soon as one row in the chunk has a null id, whatever `dtype` says.
+    opener = gzip.open if path.lower().endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        records: list[dict[str, Any]] = []
+        for line in f:
+            if line.strip():
+                records.append(serialization.loads(line))
+            if len(records) >= chunk_size:
+                yield _records_frame(records, id_column)
+                records = []
+        if records:
+            yield _records_frame(records, id_column)
+
+
+def _records_frame(records: list[dict[str, Any]], id_column: str) -> pd.DataFrame:
+    df = pd.DataFrame.from_records(records)
+    if id_column in df.columns:
+        df[id_column] = pd.Series([_id_text(r.get(id_column)) for r in records], index=df.index, dtype=object)
+    return df
+
+
+def iter_input_chunks(
+    path: str, fmt: str, chunk_size: int, id_column: str = "applicant_id"
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream an input file as DataFrames of at most `chunk_size` rows.
+
+    `id_column` is read as text (leading zeros kept, no float coercion) with
+    blank values as missing.
+    """
+    if fmt == "csv":
+        with pd.read_csv(
+            path, chunksize=chunk_size, dtype={id_column: str}, keep_default_na=False, na_values={id_column: [""]}
+        ) as reader:
+            yield from reader
+    elif fmt == "jsonl":
+        yield from _iter_jsonl_chunks(path, chunk_size, id_column)
+    else:
+        for batch in _pyarrow_parquet().ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+
+
+@dataclass(frozen=True)
+class ChunkInput:
+    applicant_ids: list[str]
+    x: np.ndarray
+    # False for rows with missing or non-numeric features; those are reported, not scored.
+    valid: np.ndarray
+
+
+@dataclass(frozen=True)
+class ChunkScores:
+    scores: list[float | None]
+    decisions: list[str | None]
+    reason_codes: list[list[str]]
+
+
+def prepare_chunk(df: pd.DataFrame, feature_names: list[str], id_column: str, first_row: int) -> ChunkInput:
+    missing = [c for c in feature_names if c not in df.columns]
+    if missing:
+        raise ValueError(f"Input is missing feature columns: {missing}")
+    if id_column in df.columns:
+        # Missing ids fall back to the row number, like a file without an id column.
+        ids = []
+        for row, value in enumerate(df[id_column].tolist(), start=first_row):
+            text = _id_text(value)
+            ids.append(str(row) if text is None else text)
+    else:
+        ids = [str(i) for i in range(first_row, first_row + len(df))]
+    x = df[feature_names].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    valid = np.isfinite(x).all(axis=1)
+    if not valid.all():
+        x[~valid] = 0.0
+    return ChunkInput(applicant_ids=ids, x=x, valid=valid)
+
+
+def score_chunk(pkg: ModelPackage, chunk: ChunkInput, threshold: float) -> ChunkScores:
+    res = score_matrix(pkg, chunk.x, threshold)
+    if chunk.valid.all():
+        return ChunkScores(scores=res.scores.tolist(), decisions=res.decisions, reason_codes=res.reason_codes)
+    ok = chunk.valid.tolist()
+    return ChunkScores(
+        scores=[s if v else None for s, v in zip(res.scores.tolist(), ok, strict=True)],
+        decisions=[d if v else None for d, v in zip(res.decisions, ok, strict=True)],
+        reason_codes=[r if v else [] for r, v in zip(res.reason_codes, ok, strict=True)],
+    )
+
+
+# Process-pool workers load the package once in their initializer.
+_WORKER_PKG: ModelPackage | None = None
+
+
+def _init_worker(registry_dir: str, version: str, require_approval: bool) -> None:
+    global _WORKER_PKG
+    _WORKER_PKG = load_approved_model(registry_dir, version, require_approval=require_approval)
+
+
+def _score_in_worker(chunk: ChunkInput, threshold: float) -> ChunkScores:
+    assert _WORKER_PKG is not None
+    return score_chunk(_WORKER_PKG, chunk, threshold)
+
+
+def _ordered_map(
+    submit: Callable[[ChunkInput], Future[ChunkScores]], items: Iterable[ChunkInput], max_in_flight: int
+) -> Iterator[tuple[ChunkInput, ChunkScores]]:
+    # Unlike Executor.map, only keeps `max_in_flight` chunks in memory; results stay in input order.
+    pending: deque[tuple[ChunkInput, Future[ChunkScores]]] = deque()
+    for item in items:
+        pending.append((item, submit(item)))
+        if len(pending) >= max_in_flight:
+            chunk, fut = pending.popleft()
+            yield chunk, fut.result()
+    while pending:
+        chunk, fut = pending.popleft()
+        yield chunk, fut.result()
+
+
+class _OutputWriter:
+    def __init__(self, path: str, fmt: str) -> None:
+        self.fmt = fmt
+        self._parquet: Any = None
+        self._fh: IO[str] | None = None
+        self._header = True
+        if fmt != "parquet":
+            self._fh = (
+                gzip.open(path, "wt", encoding="utf-8", newline="")
+                if path.endswith(".gz")
+                else open(path, "w", encoding="utf-8", newline="")
+            )
+        self.path = path
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.fmt == "csv":
+            assert self._fh is not None
+            out = df.assign(reason_codes=df["reason_codes"].map(";".join))
+            out.to_csv(self._fh, index=False, header=self._header)
+        elif self.fmt == "jsonl":
+            assert self._fh is not None
+            self._fh.write(df.to_json(orient="records", lines=True))
+        else:
+            import pyarrow as pa
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = _pyarrow_parquet().ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table)
+        self._header = False
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def score_file(
+    input_path: str,
+    output_path: str,
+    *,
+    registry_dir: str,
+    version: str,
+    require_approval: bool,
+    threshold: float,
+    input_format: str | None = None,
+    output_format: str | None = None,
+    chunk_size: int = 50_000,
+    workers: int = 0,
+    id_column: str = "applicant_id",
+    audit: Any | None = None,
+) -> dict[str, Any]:
+    """
+    Score every row of a CSV/JSONL/Parquet file and write results in input order.
+
+    Input is streamed in `chunk_size` row chunks and each chunk is scored as one
+    matrix. With `workers > 0`, chunks are scored on a process pool (each worker
+    loads the model once) while the main process keeps reading and writing; at
+    most `2 * workers` chunks are in flight. Rows with missing or non-numeric
+    features get an `error` instead of a score. When `audit` is given, one
+    `score` event per scored row is written in bulk per chunk, all sharing one
+    request id.
+    """
+
+    in_fmt = detect_format(input_path, input_format)
+    out_fmt = detect_format(output_path, output_format)
+    pkg = load_approved_model(registry_dir, version, require_approval=require_approval)
+    request_id = f"score-file-{uuid.uuid4().hex}"
+    started = time.perf_counter()
+
+    def chunks() -> Iterator[ChunkInput]:
+        first_row = 0
+        for df in iter_input_chunks(input_path, in_fmt, chunk_size, id_column):
+            yield prepare_chunk(df, pkg.feature_names, id_column, first_row)
+            first_row += len(df)
+
+    n_rows = n_scored = n_chunks = 0
+    writer = _OutputWriter(output_path, out_fmt)
+    executor: ProcessPoolExecutor | None = None
+    try:
+        if workers > 0:
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(registry_dir, version, require_approval)
+            )
+            pool = executor
+            results = _ordered_map(lambda c: pool.submit(_score_in_worker, c, threshold), chunks(), 2 * workers)
+        else:
+            results = ((c, score_chunk(pkg, c, threshold)) for c in chunks())
+
+        for chunk, scored in results:
+            ok = chunk.valid.tolist()
+            writer.write(
+                pd.DataFrame(
+                    {
+                        "applicant_id": chunk.applicant_ids,
+                        "model_version": pkg.version,
+                        "score": scored.scores,
+                        "decision": scored.decisions,
+                        "reason_codes": scored.reason_codes,
+                        "error": [None if v else "missing_or_invalid_features" for v in ok],
+                    },
+                    columns=OUTPUT_COLUMNS,
+                )
+            )
+            n_valid = int(chunk.valid.sum())
+            if audit is not None and n_valid:
+                ts = now_ts()
+                audit.write_many(
+                    AuditEvent(
+                        ts=ts,
+                        request_id=request_id,
+                        event_type="score",
+                        model_version=pkg.version,
+                        applicant_id=applicant_id,
+                        payload={"score": score, "decision": decision, "reason_codes": codes},
+                    )
+                    for applicant_id, score, decision, codes, v in zip(
+                        chunk.applicant_ids, scored.scores, scored.decisions, scored.reason_codes, ok, strict=True
+                    )
+                    if v
+                )
+            n_rows += len(ok)
+            n_scored += n_valid
+            n_chunks += 1
+    finally:
+        writer.close()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "input": input_path,
+        "output": output_path,
+        "model_version": pkg.version,
+        "request_id": request_id,
+        "rows": n_rows,
+        "scored": n_scored,
+        "failed": n_rows - n_scored,
+        "chunks": n_chunks,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_s": round(n_rows / elapsed, 1) if elapsed > 0 else None,
+    }
+    logger.info("score_file_done", extra=summary)
+    return summary
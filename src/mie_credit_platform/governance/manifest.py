@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from mie_credit_platform.modeling.artifacts import COMPACT_ARTIFACT, REQUIRED_ARTIFACTS
+
+logger = logging.getLogger("mie.registry")
+
+MANIFEST_FILE = ".manifest.json"
+MANIFEST_FORMAT = 1
+# Tracked for change detection only.
+OPTIONAL_ARTIFACTS = (COMPACT_ARTIFACT, "APPROVED")
+
+# (st_mtime_ns, st_size) of a file, or None when it does not exist.
+Stamp = tuple[int, int] | None
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    version: str
+    approved: bool
+    metadata: dict[str, Any] | None
+    missing_artifacts: tuple[str, ...]
+    # File name -> stamp for the required and optional artifacts (including APPROVED).
+    stamps: dict[str, Stamp]
+
+
+def _stamp(path: Path) -> Stamp:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_metadata(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _read_approved(path: Path) -> bool:
+    try:
+        return path.read_text(encoding="utf-8").strip().lower() == "true"
+    except OSError:
+        return False
+
+
+class RegistryManifest:
+    """
+    In-memory (and on-disk, `<registry>/.manifest.json`) index of a model registry.
+
+    Refreshes are incremental: the version list is only re-scanned when the
+    registry directory's mtime changes, and a version's `metadata.json` /
+    `APPROVED` files are only re-read when their (mtime, size) stamp changes, so
+    an unchanged registry costs a handful of `stat` calls per version and no
+    reads. Full refreshes are throttled to one per `max_age_s`; single-version
+    lookups (`entry`) always re-stat that version so approval checks are current.
+    """
+
+    def __init__(self, registry_dir: str, *, max_age_s: float = 2.0, persist: bool = True) -> None:
+        self.registry_dir = registry_dir
+        self.max_age_s = max_age_s
+        self.persist = persist
+        self._root = Path(registry_dir)
+        self._lock = threading.Lock()
+        self._entries: dict[str, ManifestEntry] = {}
+        self._root_mtime_ns: int | None = None
+        self._refreshed_at: float | None = None
+        self._load()
+        self._etag = self._digest()
+
+    # Public API ----------------------------------------------------------------
+
+    @property
+    def etag(self) -> str:
+        """
+        Content tag that changes whenever any entry changes (unquoted).
+        """
+        self._maybe_refresh()
+        return self._etag
+
+    def entries(self) -> list[ManifestEntry]:
+        """
+        All versions sorted by name (refreshed if the last full refresh is older than `max_age_s`).
+        """
+        self._maybe_refresh()
+        with self._lock:
+            return [self._entries[v] for v in sorted(self._entries)]
+
+    def entry(self, version: str) -> ManifestEntry | None:
+        """
+        Current entry for one version, re-stating its files first.
+        """
+        d = self._root / version
+        with self._lock:
+            if not d.is_dir():
+                if self._entries.pop(version, None) is not None:
+                    self._changed()
+                return None
+            entry = self._scan_version(version, self._entries.get(version))
+            if entry != self._entries.get(version):
+                self._entries[version] = entry
+                self._changed()
+            return entry
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """
+        Bring the manifest up to date. Returns True if anything changed.
+        """
+        with self._lock:
+            changed = False
+            root_stamp = _stamp(self._root)
+            if root_stamp is None:
+                changed = bool(self._entries)
+                self._entries = {}
+            else:
+                if force or root_stamp[0] != self._root_mtime_ns:
+                    versions = {p.name for p in os.scandir(self._root) if p.is_dir()}
+                    for gone in set(self._entries) - versions:
+                        del self._entries[gone]
+                        changed = True
+                    self._root_mtime_ns = root_stamp[0]
+                else:
+                    versions = set(self._entries)
+                for version in versions:
+                    prev = self._entries.get(version)
+                    entry = self._scan_version(version, prev)
+                    if entry != prev:
+                        self._entries[version] = entry
+                        changed = True
+            self._refreshed_at = time.monotonic()
+            if changed:
+                self._changed()
+            return changed
+
+    # Internals -----------------------------------------------------------------
+
+    def _maybe_refresh(self) -> None:
+        if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.max_age_s:
+            self.refresh()
+
+    def _scan_version(self, version: str, prev: ManifestEntry | None) -> ManifestEntry:
+        d = self._root / version
+        stamps: dict[str, Stamp] = {name: _stamp(d / name) for name in (*REQUIRED_ARTIFACTS, *OPTIONAL_ARTIFACTS)}
+        if prev is not None and prev.stamps == stamps:
+            return prev
+        if prev is not None and prev.stamps.get("metadata.json") == stamps["metadata.json"]:
+            metadata = prev.metadata
+        else:
+            metadata = _read_metadata(d / "metadata.json") if stamps["metadata.json"] else None
+        if prev is not None and prev.stamps.get("APPROVED") == stamps["APPROVED"]:
+            approved = prev.approved
+        else:
+            approved = _read_approved(d / "APPROVED") if stamps["APPROVED"] else False
+        return ManifestEntry(
+            version=version,
+            approved=approved,
+            metadata=metadata,
+            missing_artifacts=tuple(name for name in REQUIRED_ARTIFACTS if stamps[name] is None),
+            stamps=stamps,
+        )
+
+    def _changed(self) -> None:
+        self._etag = self._digest()
+        self._save()
+
+    def _digest(self) -> str:
+        digest = hashlib.sha256()
+        for version in sorted(self._entries):
+            e = self._entries[version]
+            digest.update(json.dumps([version, e.approved, e.missing_artifacts, e.stamps], sort_keys=True).encode())
+        return digest.hexdigest()[:32]
+
+    def _load(self) -> None:
+        path = self._root / MANIFEST_FILE
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("format") != MANIFEST_FORMAT:
+            return
+        try:
+            for raw in data["entries"]:
+                stamps = {k: tuple(v) if v is not None else None for k, v in raw["stamps"].items()}
+                entry = ManifestEntry(
+                    version=raw["version"],
+                    approved=bool(raw["approved"]),
+                    metadata=raw["metadata"],
+                    missing_artifacts=tuple(raw["missing_artifacts"]),
+                    stamps=stamps,  # type: ignore[arg-type]
+                )
+                self._entries[entry.version] = entry
+        except (KeyError, TypeError):
+            self._entries = {}
+            return
+        # Entries are only reused when their stamps still match, so a stale file is harmless;
+        # the version list is always re-scanned once per process.
+        self._root_mtime_ns = None
+
+    def _save(self) -> None:
+        if not self.persist or not self._root.is_dir():
+            return
+        path = self._root / MANIFEST_FILE
+        tmp = path.with_name(f"{MANIFEST_FILE}.{os.getpid()}.tmp")
+        data = {
+            "format": MANIFEST_FORMAT,
+            "entries": [asdict(self._entries[v]) for v in sorted(self._entries)],
+        }
+        before = _stamp(self._root)
+        try:
+            tmp.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as e:
+            # Read-only registries still get the in-memory index.
+            logger.debug("registry_manifest_not_saved", extra={"error": str(e)})
+            return
+        # Writing the manifest changes the root's mtime; adopt it if the scan was current
+        # before the write, so the next refresh can still skip the version re-scan.
+        after = _stamp(self._root)
+        if before is not None and after is not None and before[0] == self._root_mtime_ns:
+            self._root_mtime_ns = after[0]
+
+
+_MANIFESTS: dict[str, RegistryManifest] = {}
+_MANIFESTS_LOCK = threading.Lock()
+
+
+def get_manifest(registry_dir: str) -> RegistryManifest:
+    """
+    Process-wide manifest for `registry_dir`.
+    """
+    key = os.path.abspath(registry_dir)
+    with _MANIFESTS_LOCK:
+        manifest = _MANIFESTS.get(key)
+        if manifest is None:
+            manifest = RegistryManifest(registry_dir)
+            _MANIFESTS[key] = manifest
+        return manifest
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from mie_credit_platform.governance.registry import load_approved_model, registry_fingerprint
+from mie_credit_platform.modeling.model_io import ModelPackage
+
+logger = logging.getLogger("mie.model_cache")
+
+
+@dataclass(frozen=True)
+class ModelCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    load_errors: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+    versions: list[str]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    pkg: ModelPackage
+    nbytes: int
+    fingerprint: str
+
+
+def estimate_package_bytes(pkg: ModelPackage) -> int:
+    """
+    Approximate resident size of a package (pickled model plus compiled kernel arrays).
+    """
+    nbytes = len(pickle.dumps(pkg.model, protocol=pickle.HIGHEST_PROTOCOL))
+    if pkg.kernel is not None:
+        nbytes += pkg.kernel.coef.nbytes + pkg.kernel.weights.nbytes + pkg.kernel.offsets.nbytes
+    return nbytes
+
+
+class ModelCache:
+    """
+    Bounded LRU of approved `ModelPackage`s keyed by version.
+
+    Entries are evicted least-recently-used first once either `max_entries` or the
+    `max_bytes` budget is exceeded (the most recent entry is always kept, even if
+    it alone exceeds the budget). Concurrent misses for the same version load it
+    once. `revalidate` drops entries whose registry artifacts or approval changed,
+    so the next request reloads them and re-checks approval.
+    """
+
+    def __init__(
+        self,
+        registry_dir: str,
+        *,
+        require_approval: bool,
+        max_entries: int = 4,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.registry_dir = registry_dir
+        self.require_approval = require_approval
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = int(max_bytes)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._loading: dict[str, threading.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._load_errors = 0
+
+    def get(self, version: str) -> ModelPackage:
+        """
+        Return the package for `version`, loading it on a miss.
+
+        Raises FileNotFoundError for unknown versions and PermissionError for
+        unapproved ones (when approval is required).
+        """
+        with self._lock:
+            entry = self._entries.get(version)
+            if entry is not None:
+                self._entries.move_to_end(version)
+                self._hits += 1
+                return entry.pkg
+            load_lock = self._loading.setdefault(version, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._entries.get(version)
+                if entry is not None:
+                    # Loaded by a concurrent request while we waited.
+                    self._entries.move_to_end(version)
+                    self._hits += 1
+                    return entry.pkg
+                self._misses += 1
+            try:
+                fingerprint = registry_fingerprint(self.registry_dir, version)
+                pkg = load_approved_model(self.registry_dir, version, require_approval=self.require_approval)
+            except Exception:
+                with self._lock:
+                    self._load_errors += 1
+                    self._loading.pop(version, None)
+                raise
+            nbytes = estimate_package_bytes(pkg)
+            with self._lock:
+                self._entries[version] = _Entry(pkg=pkg, nbytes=nbytes, fingerprint=fingerprint)
+                self._bytes += nbytes
+                self._evict_locked()
+                self._loading.pop(version, None)
+            logger.info("model_cache_loaded", extra={"model_version": version, "bytes": nbytes})
+            return pkg
+
+    def _evict_locked(self) -> None:
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            version, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.nbytes
+            self._evictions += 1
+            logger.info("model_cache_evicted", extra={"model_version": version})
+
+    def invalidate(self, version: str) -> bool:
+        with self._lock:
+            entry = self._entries.pop(version, None)
+            if entry is None:
+                return False
+            self._bytes -= entry.nbytes
+            self._invalidations += 1
+            return True
+
+    def revalidate(self) -> list[str]:
+        """
+        Drop entries whose artifacts or approval marker changed. Returns the dropped versions.
+        """
+        with self._lock:
+            cached = [(v, e.fingerprint) for v, e in self._entries.items()]
+        stale = [v for v, fp in cached if registry_fingerprint(self.registry_dir, v) != fp]
+        return [v for v in stale if self.invalidate(v)]
+
+    def stats(self) -> ModelCacheStats:
+        with self._lock:
+            return ModelCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                load_errors=self._load_errors,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+                versions=list(self._entries),
+            )
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from mie_credit_platform.modeling.model_io import is_approved, load_model_package, model_dir, set_approved
+from mie_credit_platform.governance.manifest import REQUIRED_ARTIFACTS, get_manifest
+
+# model_io (numpy, the scoring kernel) is imported only by the functions that load or write
+# packages, so listing and approval checks stay cheap for the CLI.
 
 
 @dataclass(frozen=True)
@@ -16,34 +18,77 @@ class ModelInfo:
 
 
 def list_models(registry_dir: str) -> list[ModelInfo]:
-    d = Path(registry_dir)
-    if not d.exists():
-        return []
-    out: list[ModelInfo] = []
-    for child in sorted([p for p in d.iterdir() if p.is_dir()], key=lambda p: p.name):
-        md_path = child / "metadata.json"
-        md = json.loads(md_path.read_text(encoding="utf-8")) if md_path.exists() else None
-        out.append(ModelInfo(version=child.name, approved=is_approved(registry_dir, child.name), metadata=md))
-    return out
+    """
+    All versions in the registry, served from the incrementally refreshed manifest.
+    """
+    return [
+        ModelInfo(version=e.version, approved=e.approved, metadata=e.metadata)
+        for e in get_manifest(registry_dir).entries()
+    ]
+
+
+def is_approved(registry_dir: str, version: str) -> bool:
+    entry = get_manifest(registry_dir).entry(version)
+    return entry is not None and entry.approved
 
 
 def approve_model(registry_dir: str, version: str, approved: bool = True) -> None:
+    from mie_credit_platform.modeling.model_io import set_approved
+
     set_approved(registry_dir, version, approved)
 
 
+ACTIVE_POINTER = "ACTIVE"
+
+
+def get_active_version(registry_dir: str, default: str) -> str:
+    """
+    Version named by `<registry_dir>/ACTIVE`, or `default` when no pointer is set.
+    """
+    path = Path(registry_dir) / ACTIVE_POINTER
+    if path.exists():
+        version = path.read_text(encoding="utf-8").strip()
+        if version:
+            return version
+    return default
+
+
+def set_active_version(registry_dir: str, version: str) -> None:
+    assert_model_ready(registry_dir, version)
+    path = Path(registry_dir) / ACTIVE_POINTER
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(version + "\n", encoding="utf-8")
+    # Atomic replace so watchers never observe a half-written pointer.
+    tmp.replace(path)
+
+
+def registry_fingerprint(registry_dir: str, version: str) -> str:
+    """
+    Cheap change marker for one model version: stat of each artifact plus the approval flag.
+    """
+    entry = get_manifest(registry_dir).entry(version)
+    if entry is None:
+        return f"{version}|missing"
+    stamps = "|".join(f"{name}:{stamp}" for name, stamp in sorted(entry.stamps.items()))
+    return f"{version}|{stamps}|approved:{entry.approved}"
+
+
 def assert_model_ready(registry_dir: str, version: str) -> None:
-    d = model_dir(registry_dir, version)
-    if not d.exists():
+    entry = get_manifest(registry_dir).entry(version)
+    if entry is None:
         raise FileNotFoundError(f"Model version not found: {version} in {registry_dir}")
-    for required in ["model.joblib", "feature_list.json", "metadata.json"]:
-        if not (d / required).exists():
+    d = Path(registry_dir) / version
+    for required in REQUIRED_ARTIFACTS:
+        if required in entry.missing_artifacts:
             raise FileNotFoundError(f"Missing required artifact: {d / required}")
 
 
 def load_approved_model(registry_dir: str, version: str, require_approval: bool) -> Any:
     assert_model_ready(registry_dir, version)
     if require_approval and not is_approved(registry_dir, version):
-        raise PermissionError(f"Model version {version} is not approved (see {model_dir(registry_dir, version)})")
+        raise PermissionError(f"Model version {version} is not approved (see {Path(registry_dir) / version})")
+    from mie_credit_platform.modeling.model_io import load_model_package
+
     return load_model_package(registry_dir, version)
 
 
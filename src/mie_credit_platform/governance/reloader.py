@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from mie_credit_platform.governance.model_cache import ModelCache
+from mie_credit_platform.governance.registry import (
+    get_active_version,
+    load_approved_model,
+    registry_fingerprint,
+)
+from mie_credit_platform.modeling.model_io import ModelPackage
+from mie_credit_platform.modeling.scoring import score_applicants_batch
+
+logger = logging.getLogger("mie.reload")
+
+
+@dataclass(frozen=True)
+class ReloadStatus:
+    active_version: str | None
+    loaded_version: str | None
+    fingerprint: str | None
+    reload_count: int
+    last_check_ts: float | None
+    last_reload_ts: float | None
+    last_error: str | None
+    watching: bool
+
+
+def warm_model_package(pkg: ModelPackage, n_rows: int = 8) -> None:
+    """
+    Run the full scoring path once so lazy sklearn/numpy state is built before traffic arrives.
+    """
+    score_applicants_batch(pkg, [{} for _ in range(n_rows)], threshold=0.5)
+
+
+class ModelReloader:
+    """
+    Watches the registry for a new active version (the `ACTIVE` pointer, falling
+    back to `default_version`) or a changed `APPROVED` marker, and hot-swaps the
+    served `ModelPackage`.
+
+    The replacement is loaded and warmed on the caller's thread (the background
+    watcher, or an admin request) and then published with a single reference
+    assignment via `on_swap`. Requests that already picked up the old package
+    finish on it. A failed load keeps the current package; revoking approval of
+    the served version unloads it when approval is required.
+
+    Each check also drops stale entries from the optional secondary `cache`.
+    """
+
+    def __init__(
+        self,
+        registry_dir: str,
+        default_version: str,
+        *,
+        require_approval: bool,
+        on_swap: Callable[[ModelPackage | None], None],
+        poll_interval_s: float = 5.0,
+        cache: ModelCache | None = None,
+    ) -> None:
+        self.registry_dir = registry_dir
+        self.default_version = default_version
+        self.require_approval = require_approval
+        self.poll_interval_s = poll_interval_s
+        self._on_swap = on_swap
+        self._cache = cache
+        self._package: ModelPackage | None = None
+        self._fingerprint: str | None = None
+        self._reload_count = 0
+        self._last_check_ts: float | None = None
+        self._last_reload_ts: float | None = None
+        self._last_error: str | None = None
+        # Serializes check/reload; never held by the scoring path.
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def package(self) -> ModelPackage | None:
+        return self._package
+
+    def active_version(self) -> str:
+        return get_active_version(self.registry_dir, self.default_version)
+
+    def check(self, *, force: bool = False) -> bool:
+        """
+        Reload if the active version or its artifacts changed (always when `force`). Returns True on swap.
+        """
+        if self._cache is not None:
+            self._cache.revalidate()
+        with self._lock:
+            self._last_check_ts = time.time()
+            version = self.active_version()
+            try:
+                fingerprint = registry_fingerprint(self.registry_dir, version)
+            except OSError as e:
+                self._last_error = str(e)
+                return False
+            if not force and fingerprint == self._fingerprint:
+                return False
+            try:
+                pkg = load_approved_model(self.registry_dir, version, require_approval=self.require_approval)
+                warm_model_package(pkg)
+            except PermissionError as e:
+                self._last_error = str(e)
+                self._fingerprint = fingerprint
+                if self._package is not None and self._package.version == version:
+                    logger.error("model_approval_revoked", extra={"model_version": version})
+                    self._publish(None)
+                return False
+            except Exception as e:
+                # Keep serving the current package and retry once the artifacts change again.
+                self._last_error = str(e)
+                self._fingerprint = fingerprint
+                logger.error("model_reload_failed", extra={"model_version": version, "error": str(e)})
+                return False
+            previous = self._package.version if self._package is not None else None
+            self._fingerprint = fingerprint
+            self._last_error = None
+            self._publish(pkg)
+            self._reload_count += 1
+            self._last_reload_ts = time.time()
+            logger.info("model_reloaded", extra={"model_version": version, "previous_version": previous})
+            return True
+
+    def _publish(self, pkg: ModelPackage | None) -> None:
+        self._package = pkg
+        self._on_swap(pkg)
+
+    def status(self) -> ReloadStatus:
+        return ReloadStatus(
+            active_version=self.active_version(),
+            loaded_version=self._package.version if self._package is not None else None,
+            fingerprint=self._fingerprint,
+            reload_count=self._reload_count,
+            last_check_ts=self._last_check_ts,
+            last_reload_ts=self._last_reload_ts,
+            last_error=self._last_error,
+            watching=self._thread is not None and self._thread.is_alive(),
+        )
+
+    def start(self) -> None:
+        if self.poll_interval_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mie-model-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(1.0, self.poll_interval_s))
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval_s):
+            try:
+                self.check()
+            except Exception as e:  # pragma: no cover - the watcher must never die
+                logger.error("model_reload_check_failed", extra={"error": str(e)})
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+# Prometheus text exposition format 0.0.4.
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; finer than the Prometheus client defaults because most stages take well under 5ms.
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _fmt(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_str(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple("" if labels[n] is None else str(labels[n]) for n in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}") from e
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """
+    Monotonic counter, one series per label combination.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_label_str(self.labelnames, key)} {_fmt(value)}"
+
+
+class Histogram(_Metric):
+    """
+    Fixed-bucket histogram. Observing is a binary search plus two additions under a lock.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> None:
+        if "le" in labelnames:
+            raise ValueError("'le' is reserved for histogram buckets")
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        # Per series: [count per bucket (non-cumulative, last is +Inf)..., sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[idx] += 1
+            series[-1] += value
+
+    def snapshot(self, **labels: Any) -> tuple[int, float]:
+        """
+        (count, sum) of one series.
+        """
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            if series is None:
+                return 0, 0.0
+            return int(sum(series[:-1])), series[-1]
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        bounds = [*self.buckets, math.inf]
+        for key, series in items:
+            cumulative = 0.0
+            for bound, n in zip(bounds, series[:-1], strict=True):
+                cumulative += n
+                le = 'le="' + _fmt(bound) + '"'
+                yield f"{self.name}_bucket{_label_str(self.labelnames, key, le)} {_fmt(cumulative)}"
+            labels = _label_str(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_fmt(series[-1])}"
+            yield f"{self.name}_count{labels} {_fmt(cumulative)}"
+
+
+class MetricsRegistry:
+    """
+    In-process metric registry rendered in the Prometheus text format.
+
+    `counter` and `histogram` return the existing metric when called again with
+    the same name, so modules can declare what they use without coordinating.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def _get_or_create(self, cls: type[Any], name: str, help: str, labelnames: Sequence[str], **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a different {metric.kind}")
+            return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = [self._metrics[n] for n in sorted(self._metrics)]
+        return "\n".join(m.render() for m in metrics) + "\n"
+
+
+class StageTimer:
+    """
+    Splits one request's wall time into consecutive named stages.
+
+    Each `mark(stage)` closes the stage that started at the previous mark (or at
+    `started`). Nothing is recorded until `observe` is called, so requests that
+    fail halfway leave no partial stage samples.
+    """
+
+    def __init__(self, started: float | None = None) -> None:
+        self._last = started if started is not None else time.perf_counter()
+        self.stages: list[tuple[str, float]] = []
+        # Set by `finish`; the request completed and its stages should be recorded.
+        self.labels: dict[str, Any] | None = None
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    def finish(self, **labels: Any) -> None:
+        self.labels = labels
+
+    def observe(self, histogram: Histogram, **labels: Any) -> None:
+        for stage, seconds in self.stages:
+            histogram.observe(seconds, stage=stage, **labels)
@@ -1,5 +1,14 @@
-from mie_credit_platform.modeling.schemas import ApplicantFeatures, ScoreRequest
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["ApplicantFeatures", "ScoreRequest"]
 
 
+def __getattr__(name: str) -> Any:
+    # Lazy so that importing a light submodule (e.g. `modeling.artifacts`) does not build the pydantic schemas.
+    if name in __all__:
+        from mie_credit_platform.modeling import schemas
+
+        return getattr(schemas, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
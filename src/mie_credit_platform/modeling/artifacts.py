@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+# File names inside a model package directory. Kept dependency-free so registry
+# tooling can use them without importing numpy or sklearn.
+REQUIRED_ARTIFACTS = ("model.joblib", "feature_list.json", "metadata.json")
+
+# Pickle-free artifact for linear pipelines: raw arrays only, loadable without sklearn.
+COMPACT_ARTIFACT = "model.linear.npz"
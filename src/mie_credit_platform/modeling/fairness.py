@@ -1,44 +1,382 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 
-def _safe_rate(numer: float, denom: float) -> float:
-    return float(numer / denom) if denom else 0.0
+if TYPE_CHECKING:
+    from ice.fairness.bootstrap import FairnessIntervals
 
 
-def selection_rates_by_group(groups: list[str], y_pred: list[int], positive_label: int = 1) -> dict[str, float]:
-    counts = defaultdict(int)
-    pos = defaultdict(int)
-    for g, yp in zip(groups, y_pred, strict=True):
-        counts[g] += 1
-        if yp == positive_label:
-            pos[g] += 1
-    return {g: _safe_rate(pos[g], counts[g]) for g in sorted(counts.keys())}
+def _rates(numer: np.ndarray, denom: np.ndarray) -> np.ndarray:
+    out = np.zeros(len(denom), dtype=np.float64)
+    np.divide(numer, denom, out=out, where=denom > 0)
+    return out
 
 
-def tpr_by_group(groups: list[str], y_true: list[int], y_pred: list[int], positive_label: int = 1) -> dict[str, float]:
-    tp = defaultdict(int)
-    p = defaultdict(int)
-    for g, yt, yp in zip(groups, y_true, y_pred, strict=True):
-        if yt == positive_label:
-            p[g] += 1
-            if yp == positive_label:
-                tp[g] += 1
-    return {g: _safe_rate(tp[g], p[g]) for g in sorted(p.keys())}
+def factorize_groups(groups: Iterable[Any]) -> tuple[list[str], np.ndarray]:
+    """
+    Encode group labels as integer codes with one hash pass.
 
+    Returns the sorted labels (as strings) and a code array indexing into them,
+    so per-group results keep the sorted-key order of the original helpers.
+    Missing groups (None or NaN) get code -1 and no label.
+    """
+    import pandas as pd
 
-def demographic_parity_difference(selection_rate: dict[str, float]) -> float:
-    if not selection_rate:
-        return 0.0
-    vals = list(selection_rate.values())
-    return float(max(vals) - min(vals))
+    if isinstance(groups, (np.ndarray, pd.Series, pd.Index)):
+        values = groups
+    else:
+        values = np.asarray(groups if isinstance(groups, (list, tuple)) else list(groups), dtype=object)
+    codes, uniques = pd.factorize(values, sort=True)
+    return [str(g) for g in uniques], codes.astype(np.intp, copy=False)
 
 
-def equal_opportunity_difference(tpr: dict[str, float]) -> float:
-    if not tpr:
+@dataclass(frozen=True)
+class GroupCounts:
+    """
+    Confusion counts per group (aligned with `groups`).
+
+    `n`/`pred_pos` cover every decision; the remaining fields only cover rows with
+    a known outcome (`labeled`), which is all rows when `y_true` was given.
+    `labeled_score_sum` is the sum of predicted scores (or hard predictions) over
+    labeled rows and backs calibration-in-the-large.
+    """
+
+    groups: list[str]
+    n: np.ndarray
+    pred_pos: np.ndarray
+    labeled: np.ndarray
+    labeled_pred_pos: np.ndarray
+    true_pos: np.ndarray
+    tp: np.ndarray
+    labeled_score_sum: np.ndarray
+
+    @property
+    def fp(self) -> np.ndarray:
+        return self.labeled_pred_pos - self.tp
+
+    @property
+    def true_neg(self) -> np.ndarray:
+        return self.labeled - self.true_pos
+
+
+def _as_labels(values: Sequence[Any] | np.ndarray | None, positive_label: Any, n: int, name: str) -> np.ndarray | None:
+    if values is None:
+        return None
+    arr = np.asarray(values)
+    if arr.shape != (n,):
+        raise ValueError(f"{name} has {arr.size} values, expected {n}")
+    return arr == positive_label
+
+
+def group_counts(
+    groups: Iterable[Any],
+    y_pred: Sequence[Any] | np.ndarray,
+    y_true: Sequence[Any] | np.ndarray | None = None,
+    *,
+    y_score: Sequence[float] | np.ndarray | None = None,
+    positive_label: Any = 1,
+) -> GroupCounts:
+    """
+    Tally per-group counts with `np.bincount` after factorizing the groups once.
+
+    Without `y_true` only `n` and `pred_pos` are filled in. Rows without a group
+    are left out, as in the fairness ledger and the audit store's counts.
+    """
+    labels, codes = factorize_groups(groups)
+    n_rows, k = len(codes), len(labels)
+    pred = _as_labels(y_pred, positive_label, n_rows, "y_pred")
+    true = _as_labels(y_true, positive_label, n_rows, "y_true")
+    if y_score is None:
+        score = pred
+    else:
+        score = np.asarray(y_score, dtype=np.float64)
+        if score.shape != (n_rows,):
+            raise ValueError(f"y_score has {score.size} values, expected {n_rows}")
+    keep = codes >= 0
+    if not keep.all():
+        codes, pred, score = codes[keep], pred[keep], score[keep]
+        true = None if true is None else true[keep]
+
+    n = np.bincount(codes, minlength=k).astype(np.int64)
+    pred_pos = np.bincount(codes, weights=pred, minlength=k).astype(np.int64)
+    if true is None:
+        zeros = np.zeros(k, dtype=np.int64)
+        return GroupCounts(labels, n, pred_pos, zeros, zeros, zeros, zeros, np.zeros(k, dtype=np.float64))
+    return GroupCounts(
+        groups=labels,
+        n=n,
+        pred_pos=pred_pos,
+        labeled=n,
+        labeled_pred_pos=pred_pos,
+        true_pos=np.bincount(codes, weights=true, minlength=k).astype(np.int64),
+        tp=np.bincount(codes, weights=pred & true, minlength=k).astype(np.int64),
+        labeled_score_sum=np.bincount(codes, weights=score, minlength=k).astype(np.float64),
+    )
+
+
+def _spread(values: dict[str, float]) -> float:
+    if not values:
         return 0.0
-    vals = list(tpr.values())
+    vals = list(values.values())
     return float(max(vals) - min(vals))
 
 
+@dataclass(frozen=True)
+class FairnessMetrics:
+    """
+    Per-group fairness metrics derived from one set of `GroupCounts`.
+
+    Rate dicts only include groups where the rate is defined: TPR needs actual
+    positives, FPR actual negatives, precision predicted positives and
+    calibration any labeled rows.
+    `calibration_in_the_large` is mean predicted score minus observed positive
+    rate (positive = over-prediction).
+    """
+
+    counts: GroupCounts
+    selection_rate: dict[str, float]
+    tpr: dict[str, float]
+    fpr: dict[str, float]
+    precision: dict[str, float]
+    calibration_in_the_large: dict[str, float]
+
+    @property
+    def groups(self) -> list[str]:
+        return self.counts.groups
+
+    @property
+    def demographic_parity_difference(self) -> float:
+        return _spread(self.selection_rate)
+
+    @property
+    def equal_opportunity_difference(self) -> float:
+        return _spread(self.tpr)
+
+
+def metrics_from_counts(counts: GroupCounts) -> FairnessMetrics:
+    def by_group(values: np.ndarray, defined: np.ndarray) -> dict[str, float]:
+        return {g: float(v) for g, v, ok in zip(counts.groups, values.tolist(), defined.tolist(), strict=True) if ok}
+
+    has_rows = counts.n > 0
+    return FairnessMetrics(
+        counts=counts,
+        selection_rate=by_group(_rates(counts.pred_pos, counts.n), has_rows),
+        tpr=by_group(_rates(counts.tp, counts.true_pos), counts.true_pos > 0),
+        fpr=by_group(_rates(counts.fp, counts.true_neg), counts.true_neg > 0),
+        precision=by_group(_rates(counts.tp, counts.labeled_pred_pos), counts.labeled_pred_pos > 0),
+        calibration_in_the_large=by_group(
+            _rates(counts.labeled_score_sum, counts.labeled) - _rates(counts.true_pos, counts.labeled),
+            counts.labeled > 0,
+        ),
+    )
+
+
+def compute_fairness_metrics(
+    groups: Iterable[Any],
+    y_true: Sequence[Any] | np.ndarray,
+    y_pred: Sequence[Any] | np.ndarray,
+    *,
+    y_score: Sequence[float] | np.ndarray | None = None,
+    positive_label: Any = 1,
+) -> FairnessMetrics:
+    """
+    Selection rate, TPR, FPR, precision and calibration-in-the-large per group.
+    """
+    return metrics_from_counts(
+        group_counts(groups, y_pred, y_true, y_score=y_score, positive_label=positive_label)
+    )
+
+
+def count_cells(counts: GroupCounts) -> np.ndarray:
+    """
+    `(groups, 6)` table of tp, fp, fn, tn, then unlabeled selected / not selected
+    (the cell layout of `ice.fairness.bootstrap.CELLS`).
+
+    Raises ValueError when the counts are not a consistent confusion table,
+    e.g. more labeled decisions than decisions.
+    """
+    fn = counts.true_pos - counts.tp
+    unlabeled_pos = counts.pred_pos - counts.labeled_pred_pos
+    cells = np.column_stack(
+        [
+            counts.tp,
+            counts.fp,
+            fn,
+            counts.true_neg - counts.fp,
+            unlabeled_pos,
+            counts.n - counts.labeled - unlabeled_pos,
+        ]
+    ).astype(np.int64)
+    negative = (cells < 0).any(axis=1)
+    if negative.any():
+        bad = [g for g, neg in zip(counts.groups, negative.tolist(), strict=True) if neg]
+        raise ValueError(f"Inconsistent fairness counts for groups {bad} (e.g. more labeled decisions than decisions)")
+    return cells
+
+
+def bootstrap_intervals(
+    counts: GroupCounts,
+    *,
+    n_replicates: int = 1000,
+    confidence: float = 0.95,
+    seed: int | None = None,
+    method: str = "multinomial",
+) -> FairnessIntervals:
+    """
+    Percentile bootstrap intervals for selection rates, disparate impact and TPR/FPR gaps.
+
+    Replicates are drawn over the per-group count table in one vectorized call,
+    so the cost does not grow with the number of rows behind `counts`.
+    """
+    from ice.fairness.bootstrap import bootstrap_counts
+
+    return bootstrap_counts(
+        counts.groups, count_cells(counts), n_replicates=n_replicates, confidence=confidence, seed=seed, method=method
+    )
+
+
+# Order of the per-group count vector kept by `FairnessAccumulator` (and in its serialized form).
+COUNT_FIELDS = ("n", "pred_pos", "labeled", "labeled_pred_pos", "true_pos", "tp", "labeled_score_sum")
+
+
+class FairnessAccumulator:
+    """
+    Mergeable per-group confusion counts.
+
+    Decisions and outcome labels are folded in one at a time as they arrive (an
+    outcome is counted against the decision it labels), and partial states from
+    other workers or time buckets combine with `+` and `-`. Reading metrics costs
+    O(groups) however many rows were folded in.
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, counts: Mapping[str, Sequence[float]] | None = None) -> None:
+        self._counts: dict[str, list[float]] = {}
+        for group, row in (counts or {}).items():
+            if len(row) != len(COUNT_FIELDS):
+                raise ValueError(f"Expected {len(COUNT_FIELDS)} counts for group {group!r}, got {len(row)}")
+            self._counts[str(group)] = [*(int(v) for v in row[:-1]), float(row[-1])]
+
+    def _row(self, group: str) -> list[float]:
+        row = self._counts.get(group)
+        if row is None:
+            row = self._counts[group] = [0, 0, 0, 0, 0, 0, 0.0]
+        return row
+
+    def add_decision(self, group: str, selected: bool) -> None:
+        row = self._row(str(group))
+        row[0] += 1
+        if selected:
+            row[1] += 1
+
+    def add_outcome(self, group: str, selected: bool, positive: bool, score: float | None = None) -> None:
+        """
+        Label a decision already counted with `add_decision`.
+
+        `score` feeds calibration-in-the-large; without it the hard decision is used.
+        """
+        row = self._row(str(group))
+        row[2] += 1
+        if selected:
+            row[3] += 1
+        if positive:
+            row[4] += 1
+            if selected:
+                row[5] += 1
+        row[6] += float(selected) if score is None else float(score)
+
+    def add_counts(self, counts: GroupCounts) -> None:
+        """
+        Fold in counts tallied in bulk (e.g. by `group_counts`).
+        """
+        columns = [getattr(counts, f).tolist() for f in COUNT_FIELDS]
+        for group, *values in zip(counts.groups, *columns, strict=True):
+            row = self._row(group)
+            for i, v in enumerate(values):
+                row[i] += v
+
+    @property
+    def groups(self) -> list[str]:
+        return sorted(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FairnessAccumulator):
+            return NotImplemented
+        return self._counts == other._counts
+
+    def copy(self) -> FairnessAccumulator:
+        return FairnessAccumulator(self._counts)
+
+    def __iadd__(self, other: FairnessAccumulator) -> FairnessAccumulator:
+        for group, values in other._counts.items():
+            row = self._row(group)
+            for i, v in enumerate(values):
+                row[i] += v
+        return self
+
+    def __add__(self, other: FairnessAccumulator) -> FairnessAccumulator:
+        out = self.copy()
+        out += other
+        return out
+
+    def __isub__(self, other: FairnessAccumulator) -> FairnessAccumulator:
+        """
+        Remove a state previously merged in (e.g. a bucket leaving a rolling window).
+        """
+        for group, values in other._counts.items():
+            row = self._counts.get(group)
+            if row is None or any(a < b for a, b in zip(row[:-1], values[:-1], strict=True)):
+                raise ValueError(f"Cannot subtract counts for group {group!r} that were never added")
+            for i, v in enumerate(values):
+                row[i] -= v
+            if not any(row[:-1]):
+                del self._counts[group]
+        return self
+
+    def __sub__(self, other: FairnessAccumulator) -> FairnessAccumulator:
+        out = self.copy()
+        out -= other
+        return out
+
+    def counts(self) -> GroupCounts:
+        groups = self.groups
+        columns = np.array([self._counts[g] for g in groups], dtype=np.float64).reshape(len(groups), len(COUNT_FIELDS))
+        arrays = {f: columns[:, i].astype(np.int64) for i, f in enumerate(COUNT_FIELDS[:-1])}
+        return GroupCounts(groups=groups, labeled_score_sum=columns[:, -1], **arrays)
+
+    def metrics(self) -> FairnessMetrics:
+        return metrics_from_counts(self.counts())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"fields": list(COUNT_FIELDS), "groups": {g: list(self._counts[g]) for g in self.groups}}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> FairnessAccumulator:
+        fields = tuple(data.get("fields", COUNT_FIELDS))
+        if fields != COUNT_FIELDS:
+            raise ValueError(f"Unsupported fairness count fields {fields}; expected {COUNT_FIELDS}")
+        return cls(data.get("groups") or {})
+
+
+def selection_rates_by_group(groups: list[str], y_pred: list[int], positive_label: int = 1) -> dict[str, float]:
+    return metrics_from_counts(group_counts(groups, y_pred, positive_label=positive_label)).selection_rate
+
+
+def tpr_by_group(groups: list[str], y_true: list[int], y_pred: list[int], positive_label: int = 1) -> dict[str, float]:
+    return compute_fairness_metrics(groups, y_true, y_pred, positive_label=positive_label).tpr
+
+
+def demographic_parity_difference(selection_rate: dict[str, float]) -> float:
+    return _spread(selection_rate)
+
+
+def equal_opportunity_difference(tpr: dict[str, float]) -> float:
+    return _spread(tpr)
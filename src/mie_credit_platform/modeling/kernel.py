@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger("mie.kernel")
+
+
+@dataclass(frozen=True)
+class KernelOutput:
+    scores: np.ndarray
+    contributions: np.ndarray
+    reason_codes: list[list[str]]
+
+
+@dataclass(frozen=True)
+class LinearKernel:
+    """
+    Fused scoring kernel for Pipeline(StandardScaler -> LogisticRegression).
+
+    The scaler is folded into the weights at compile time, so one pass over a raw
+    feature matrix yields the score, the per-feature logit contributions and the
+    reason codes. Contributions keep the same definition as the original
+    explanation: `coef * (x - mean) / scale`.
+    """
+
+    feature_names: tuple[str, ...]
+    coef: np.ndarray
+    weights: np.ndarray
+    offsets: np.ndarray
+    intercept: float
+    n_reason_codes: int = 3
+
+    @property
+    def bias(self) -> float:
+        """Intercept of the folded model: `logit = x @ weights + bias`."""
+        return self.intercept + float(np.sum(self.offsets))
+
+    def predict_scores(self, x: np.ndarray) -> np.ndarray:
+        """Scores only (no contributions or reason codes)."""
+        with np.errstate(over="ignore"):
+            return 1 / (1 + np.exp(-(x @ self.weights + self.bias)))
+
+    def evaluate(self, x: np.ndarray) -> KernelOutput:
+        contrib = x * self.weights + self.offsets
+        logits = self.intercept + contrib.sum(axis=1)
+        with np.errstate(over="ignore"):
+            scores = 1 / (1 + np.exp(-logits))
+        # Stable argsort matches `sorted(...)` tie-breaking of the explanation rows.
+        worst = np.argsort(contrib, axis=1, kind="stable")[:, : self.n_reason_codes]
+        names = self.feature_names
+        reason_codes = [[f"HIGH_RISK_SIGNAL:{names[i]}" for i in row] for row in worst.tolist()]
+        return KernelOutput(scores=scores, contributions=contrib, reason_codes=reason_codes)
+
+    def explain(self, x: np.ndarray, out: KernelOutput | None = None) -> list[dict[str, Any]]:
+        """
+        Build one explanation dict per row of `x` (see `explain_linear_if_possible`).
+        """
+        out = out if out is not None else self.evaluate(x)
+        names = self.feature_names
+        weights = [float(w) for w in self.coef]
+        explanations: list[dict[str, Any]] = []
+        for x_row, c_row, score, codes in zip(
+            x.tolist(), out.contributions.tolist(), out.scores.tolist(), out.reason_codes, strict=True
+        ):
+            explanations.append(
+                {
+                    "explain_type": "linear_logit_contributions",
+                    "base_value": self.intercept,
+                    "score_from_explanation": float(score),
+                    "contributions": [
+                        {"feature": name, "value": val, "weight": w, "contribution": c}
+                        for name, val, w, c in zip(names, x_row, weights, c_row, strict=True)
+                    ],
+                    "reason_codes": codes,
+                }
+            )
+        return explanations
+
+
+@dataclass(frozen=True)
+class LinearParams:
+    """
+    Fitted parameters of Pipeline(StandardScaler -> LogisticRegression).
+    """
+
+    coef: np.ndarray
+    mean: np.ndarray
+    scale: np.ndarray
+    intercept: float
+
+
+def linear_params(model: Any) -> LinearParams | None:
+    """
+    Extract scaler and logistic-regression parameters, or None for other model types.
+    """
+
+    if not hasattr(model, "named_steps"):
+        return None
+    steps = model.named_steps
+    if "scaler" not in steps or "clf" not in steps:
+        return None
+    scaler = steps["scaler"]
+    clf = steps["clf"]
+    if not hasattr(clf, "coef_") or not hasattr(clf, "intercept_") or clf.coef_.shape[0] != 1:
+        return None
+    return LinearParams(
+        coef=np.asarray(clf.coef_[0], dtype=float),
+        mean=np.asarray(scaler.mean_, dtype=float),
+        scale=np.asarray(scaler.scale_, dtype=float),
+        intercept=float(clf.intercept_[0]),
+    )
+
+
+def build_linear_kernel(feature_names: list[str], params: LinearParams) -> LinearKernel:
+    return LinearKernel(
+        feature_names=tuple(feature_names),
+        coef=params.coef,
+        weights=params.coef / params.scale,
+        offsets=-params.coef * params.mean / params.scale,
+        intercept=params.intercept,
+    )
+
+
+@dataclass(frozen=True)
+class CompactLinearModel:
+    """
+    sklearn-free stand-in for the fitted pipeline, backed by a `LinearKernel`.
+
+    Loaded from the compact `.npz` artifact; implements `predict_proba` so code that
+    expects an sklearn-style model keeps working.
+    """
+
+    kernel: LinearKernel
+
+    def predict_proba(self, x: Any) -> np.ndarray:
+        scores = self.kernel.predict_scores(np.asarray(x, dtype=float))
+        return np.column_stack([1.0 - scores, scores])
+
+
+def compile_linear_kernel(model: Any, feature_names: list[str], *, verify: bool = True) -> LinearKernel | None:
+    """
+    Compile a fitted sklearn Pipeline(StandardScaler -> LogisticRegression) into a `LinearKernel`.
+
+    Returns None for other model types. When `verify` is set, the kernel is checked
+    against `model.predict_proba` on a deterministic probe matrix and discarded
+    (with a warning) if it disagrees, so callers fall back to the sklearn path.
+    """
+
+    if isinstance(model, CompactLinearModel):
+        return model.kernel
+    params = linear_params(model)
+    if params is None:
+        return None
+    kernel = build_linear_kernel(feature_names, params)
+    if verify:
+        rng = np.random.default_rng(0)
+        probe = params.mean + params.scale * rng.standard_normal((64, len(feature_names)))
+        try:
+            verify_linear_kernel(kernel, model, probe)
+        except ValueError as e:
+            logger.warning("linear_kernel_rejected", extra={"error": str(e)})
+            return None
+    return kernel
+
+
+def verify_linear_kernel(kernel: LinearKernel, model: Any, x: np.ndarray, *, atol: float = 1e-9) -> float:
+    """
+    Assert the kernel reproduces `model.predict_proba(x)[:, 1]`. Returns the max abs difference.
+    """
+
+    expected = model.predict_proba(x)[:, 1]
+    actual = kernel.evaluate(x).scores
+    max_diff = float(np.max(np.abs(expected - actual))) if len(x) else 0.0
+    if not max_diff <= atol:
+        raise ValueError(f"Linear kernel disagrees with sklearn pipeline (max abs diff {max_diff:.3g} > {atol:.3g})")
+    return max_diff
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass
+import logging
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import joblib
+import numpy as np
+
+from mie_credit_platform.modeling.artifacts import COMPACT_ARTIFACT
+from mie_credit_platform.modeling.kernel import (
+    CompactLinearModel,
+    LinearKernel,
+    LinearParams,
+    build_linear_kernel,
+    compile_linear_kernel,
+    linear_params,
+)
+
+COMPACT_FORMAT_VERSION = 1
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -14,16 +31,33 @@ class ModelPackage:
     model: Any
     feature_names: list[str]
     metadata: dict[str, Any]
+    # Fused scoring kernel compiled at load time (None for non-linear models).
+    kernel: LinearKernel | None = field(default=None, repr=False, compare=False)
 
 
 def model_dir(registry_dir: str, version: str) -> Path:
     return Path(registry_dir) / version
 
 
-def save_model_package(pkg: ModelPackage, registry_dir: str) -> Path:
+def save_model_package(pkg: ModelPackage, registry_dir: str, *, compact: bool = True) -> Path:
+    import joblib
+
     d = model_dir(registry_dir, pkg.version)
     d.mkdir(parents=True, exist_ok=True)
+    # A compact artifact from an earlier save of this version would shadow the new model.
+    (d / COMPACT_ARTIFACT).unlink(missing_ok=True)
     joblib.dump(pkg.model, d / "model.joblib")
+    if compact:
+        params = linear_params(pkg.model)
+        if params is not None:
+            model_path = d / "model.joblib"
+            save_compact_linear(
+                d / COMPACT_ARTIFACT,
+                pkg.feature_names,
+                params,
+                model_sha256=file_sha256(model_path),
+                model_stamp=file_stamp(model_path),
+            )
     (d / "feature_list.json").write_text(json.dumps(pkg.feature_names, indent=2), encoding="utf-8")
     (d / "metadata.json").write_text(json.dumps(pkg.metadata, indent=2), encoding="utf-8")
     if not (d / "APPROVED").exists():
@@ -31,12 +65,104 @@ def save_model_package(pkg: ModelPackage, registry_dir: str) -> Path:
     return d
 
 
-def load_model_package(registry_dir: str, version: str) -> ModelPackage:
+def load_model_package(registry_dir: str, version: str, *, prefer_compact: bool = True) -> ModelPackage:
+    """
+    Load a model package, using the compact linear artifact when present (no unpickling, no sklearn import).
+
+    The compact artifact is only used when it was built from this `model.joblib`
+    (same mtime and size, so the pickle is never read); otherwise the pickled model is loaded.
+    """
     d = model_dir(registry_dir, version)
-    model = joblib.load(d / "model.joblib")
     feature_names = json.loads((d / "feature_list.json").read_text(encoding="utf-8"))
     metadata = json.loads((d / "metadata.json").read_text(encoding="utf-8"))
-    return ModelPackage(version=version, model=model, feature_names=feature_names, metadata=metadata)
+    compact_path = d / COMPACT_ARTIFACT
+    kernel = None
+    if prefer_compact and compact_path.exists():
+        kernel = load_compact_linear(compact_path, feature_names, model_stamp=file_stamp(d / "model.joblib"))
+        if kernel is None:
+            logger.warning("compact_model_artifact_stale", extra={"path": str(compact_path)})
+    if kernel is not None:
+        model: Any = CompactLinearModel(kernel)
+    else:
+        import joblib
+
+        model = joblib.load(d / "model.joblib")
+        kernel = compile_linear_kernel(model, feature_names)
+    return ModelPackage(
+        version=version, model=model, feature_names=feature_names, metadata=metadata, kernel=kernel
+    )
+
+
+def file_stamp(path: Path) -> tuple[int, int]:
+    """
+    (st_mtime_ns, st_size) of a file: a cheap check that it has not been rewritten.
+    """
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def save_compact_linear(
+    path: Path,
+    feature_names: list[str],
+    params: LinearParams,
+    *,
+    model_sha256: str,
+    model_stamp: tuple[int, int],
+) -> None:
+    """
+    Write the compact artifact, recording the sha256 and `file_stamp` of the `model.joblib` it was built from.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(
+            f,
+            format_version=np.int64(COMPACT_FORMAT_VERSION),
+            model_sha256=np.str_(model_sha256),
+            model_stamp=np.asarray(model_stamp, dtype=np.int64),
+            feature_names=np.asarray(feature_names, dtype=np.str_),
+            coef=params.coef,
+            mean=params.mean,
+            scale=params.scale,
+            intercept=np.float64(params.intercept),
+        )
+    os.replace(tmp, path)
+
+
+def load_compact_linear(
+    path: Path, feature_names: list[str], *, model_stamp: tuple[int, int] | None = None
+) -> LinearKernel | None:
+    """
+    Build a `LinearKernel` from a compact artifact, checking it against `feature_list.json`.
+
+    With `model_stamp`, returns None when the artifact was not built from a
+    `model.joblib` with that `file_stamp` (or predates recorded stamps).
+    """
+    with np.load(path, allow_pickle=False) as z:
+        version = int(z["format_version"])
+        if version != COMPACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported compact model format {version} in {path}")
+        if model_stamp is not None and (
+            "model_stamp" not in z.files or tuple(int(v) for v in z["model_stamp"]) != tuple(model_stamp)
+        ):
+            return None
+        stored_names = [str(n) for n in z["feature_names"]]
+        params = LinearParams(
+            coef=np.asarray(z["coef"], dtype=float),
+            mean=np.asarray(z["mean"], dtype=float),
+            scale=np.asarray(z["scale"], dtype=float),
+            intercept=float(z["intercept"]),
+        )
+    if stored_names != list(feature_names):
+        raise ValueError(f"Compact model features do not match feature_list.json in {path.parent}")
+    return build_linear_kernel(feature_names, params)
 
 
 def is_approved(registry_dir: str, version: str) -> bool:
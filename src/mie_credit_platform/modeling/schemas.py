@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any, Literal
+
 from pydantic import BaseModel, Field, PositiveInt
 
 
@@ -44,10 +46,17 @@ class AuditContext(BaseModel):
     sex: str | None = Field(default=None, description="Self-reported categories (if applicable).")
 
 
+# Registry directory names; also keeps request-supplied versions from escaping the registry.
+MODEL_VERSION_PATTERN = r"^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$"
+
+
 class ScoreRequest(BaseModel):
     applicant_id: str = Field(min_length=1, max_length=128)
     features: ApplicantFeatures
     audit_context: AuditContext | None = None
+    model_version: str | None = Field(
+        default=None, pattern=MODEL_VERSION_PATTERN, description="Approved model version to use (default: active)."
+    )
 
 
 class ScoreResponse(BaseModel):
@@ -58,9 +67,44 @@ class ScoreResponse(BaseModel):
     reason_codes: list[str] = Field(description="Human-readable reason codes derived from model explanation.")
 
 
+class ScoreBatchRequest(BaseModel):
+    """
+    A batch of applicants to score in one call.
+
+    Items are validated individually as `ScoreRequest`s so that one malformed row
+    is reported back without failing the whole batch.
+    """
+
+    items: list[Any] = Field(min_length=1, max_length=50000)
+    model_version: str | None = Field(
+        default=None, pattern=MODEL_VERSION_PATTERN, description="Default version for items that do not name one."
+    )
+
+
+class ScoreBatchItem(BaseModel):
+    index: int = Field(description="Position of the item in the request batch.")
+    applicant_id: str | None = None
+    model_version: str | None = None
+    score: float | None = Field(default=None, ge=0, le=1)
+    decision: str | None = None
+    reason_codes: list[str] = Field(default_factory=list)
+    errors: list[dict[str, Any]] | None = Field(
+        default=None, description="Validation errors for this item (input values are not echoed)."
+    )
+
+
+class ScoreBatchResponse(BaseModel):
+    request_id: str
+    model_version: str | None = Field(description="Version for items that do not name one (None when none is loaded).")
+    n_scored: int
+    n_failed: int
+    results: list[ScoreBatchItem]
+
+
 class ExplainRequest(BaseModel):
     applicant_id: str = Field(min_length=1, max_length=128)
     features: ApplicantFeatures
+    model_version: str | None = Field(default=None, pattern=MODEL_VERSION_PATTERN)
 
 
 class FeatureContribution(BaseModel):
@@ -87,6 +131,32 @@ class FairnessRow(BaseModel):
 class FairnessReportRequest(BaseModel):
     rows: list[FairnessRow]
     positive_label: int = 1
+    # Bootstrap replicates for confidence intervals; 0 reports point estimates only.
+    n_bootstrap: int = Field(default=0, ge=0, le=10_000)
+    bootstrap_method: Literal["multinomial", "poisson"] = "multinomial"
+    bootstrap_seed: int | None = None
+    confidence: float = Field(default=0.95, gt=0, lt=1)
+
+
+class FairnessIntervalsResponse(BaseModel):
+    """
+    Percentile bootstrap intervals as `[lower, upper]` pairs.
+
+    Disparate impact is each group's selection rate over the `reference` group's
+    (the highest observed selection rate).
+    """
+
+    method: str
+    n_replicates: int
+    confidence: float
+    reference: str | None
+    selection_rate_by_group: dict[str, tuple[float, float]]
+    disparate_impact_by_group: dict[str, tuple[float, float]]
+    tpr_by_group: dict[str, tuple[float, float]]
+    fpr_by_group: dict[str, tuple[float, float]]
+    demographic_parity_difference: tuple[float, float] | None
+    equal_opportunity_difference: tuple[float, float] | None
+    fpr_difference: tuple[float, float] | None
 
 
 class FairnessReportResponse(BaseModel):
@@ -95,6 +165,42 @@ class FairnessReportResponse(BaseModel):
     equal_opportunity_difference: float
     selection_rate_by_group: dict[str, float]
     tpr_by_group: dict[str, float]
+    fpr_by_group: dict[str, float] = Field(default_factory=dict)
+    precision_by_group: dict[str, float] = Field(default_factory=dict)
+    # Mean prediction minus observed positive rate; positive values mean over-prediction.
+    calibration_in_the_large_by_group: dict[str, float] = Field(default_factory=dict)
+    confidence_intervals: FairnessIntervalsResponse | None = None
+
+
+class FairnessWindowResponse(FairnessReportResponse):
+    """
+    Fairness over a time window, read from the incremental ledger.
+
+    Selection rates cover every decision in the window; the outcome-based rates
+    only cover decisions whose outcome has been reported.
+    """
+
+    attribute: str
+    model_version: str | None
+    since_ts: float | None
+    until_ts: float | None
+    n_decisions_by_group: dict[str, int]
+    n_labeled_by_group: dict[str, int]
+
+
+class OutcomeRecord(BaseModel):
+    request_id: str = Field(min_length=1, max_length=128)
+    applicant_id: str = Field(min_length=1, max_length=128)
+    outcome: int = Field(ge=0, le=1, description="Observed outcome of the decision (1 = positive, e.g. repaid).")
+
+
+class OutcomeRequest(BaseModel):
+    outcomes: list[OutcomeRecord] = Field(min_length=1, max_length=1000)
+
+
+class OutcomeResponse(BaseModel):
+    n_recorded: int
+    unmatched: list[int] = Field(description="Indexes of outcomes without a matching score event.")
 
 
 class AuditEventRecord(BaseModel):
@@ -116,5 +222,8 @@ class AuditEventListResponse(BaseModel):
     limit: int
     offset: int
     events: list[AuditEventRecord]
+    next_cursor: str | None = Field(
+        default=None, description="Opaque cursor for the next page (pass as `cursor`); null on the last page."
+    )
 
 
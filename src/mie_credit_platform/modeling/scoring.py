@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 
+from mie_credit_platform.metrics import StageTimer
+from mie_credit_platform.modeling.kernel import LinearKernel, compile_linear_kernel
 from mie_credit_platform.modeling.model_io import ModelPackage
 
 
@@ -17,14 +18,71 @@ class ScoreResult:
 
 
 def score_applicant(
-    pkg: ModelPackage, features: dict[str, float], threshold: float
+    pkg: ModelPackage, features: dict[str, float], threshold: float, *, timer: StageTimer | None = None
 ) -> tuple[ScoreResult, dict[str, Any]]:
-    x = _vectorize(features, pkg.feature_names)
-    proba = float(pkg.model.predict_proba(x)[0, 1])
-    decision = "APPROVE" if proba >= threshold else "REVIEW"
-    explanation = explain_linear_if_possible(pkg, features)
-    reason_codes = explanation.get("reason_codes", [])
-    return ScoreResult(score=proba, decision=decision, reason_codes=reason_codes), explanation
+    return score_applicants_batch(pkg, [features], threshold, timer=timer)[0]
+
+
+def score_applicants_batch(
+    pkg: ModelPackage,
+    features_rows: list[dict[str, float]],
+    threshold: float,
+    *,
+    timer: StageTimer | None = None,
+) -> list[tuple[ScoreResult, dict[str, Any]]]:
+    """
+    Score many applicants at once.
+
+    Builds a single feature matrix and, when the package carries a compiled linear
+    kernel, gets scores, contributions and reason codes from one kernel pass.
+    Otherwise it makes one `predict_proba` call over all rows. Results are returned
+    in input order. With a `timer`, the `predict` and `explain` stages are marked.
+    """
+
+    if not features_rows:
+        return []
+    x = _vectorize_many(features_rows, pkg.feature_names)
+    if pkg.kernel is not None:
+        out = pkg.kernel.evaluate(x)
+        proba = out.scores.tolist()
+        if timer is not None:
+            timer.mark("predict")
+        explanations = pkg.kernel.explain(x, out)
+    else:
+        proba = pkg.model.predict_proba(x)[:, 1].tolist()
+        if timer is not None:
+            timer.mark("predict")
+        explanations = explain_linear_batch_if_possible(pkg, x)
+    results: list[tuple[ScoreResult, dict[str, Any]]] = []
+    for p, explanation in zip(proba, explanations, strict=True):
+        decision = "APPROVE" if p >= threshold else "REVIEW"
+        reason_codes = explanation.get("reason_codes", [])
+        results.append((ScoreResult(score=float(p), decision=decision, reason_codes=reason_codes), explanation))
+    if timer is not None:
+        timer.mark("explain")
+    return results
+
+
+@dataclass(frozen=True)
+class MatrixScores:
+    scores: np.ndarray
+    decisions: list[str]
+    reason_codes: list[list[str]]
+
+
+def score_matrix(pkg: ModelPackage, x: np.ndarray, threshold: float) -> MatrixScores:
+    """
+    Score a raw feature matrix (columns in `pkg.feature_names` order) without building explanations.
+    """
+
+    if pkg.kernel is not None:
+        out = pkg.kernel.evaluate(x)
+        scores, reason_codes = out.scores, out.reason_codes
+    else:
+        scores = pkg.model.predict_proba(x)[:, 1]
+        reason_codes = [e.get("reason_codes", []) for e in explain_linear_batch_if_possible(pkg, x)]
+    decisions = np.where(scores >= threshold, "APPROVE", "REVIEW").tolist()
+    return MatrixScores(scores=scores, decisions=decisions, reason_codes=reason_codes)
 
 
 def _vectorize(features: dict[str, float], feature_names: list[str]) -> np.ndarray:
@@ -32,48 +90,39 @@ def _vectorize(features: dict[str, float], feature_names: list[str]) -> np.ndarr
     return np.asarray([row], dtype=float)
 
 
+def _vectorize_many(features_rows: list[dict[str, float]], feature_names: list[str]) -> np.ndarray:
+    return np.asarray(
+        [[float(features.get(k, 0.0)) for k in feature_names] for features in features_rows], dtype=float
+    )
+
+
+def _kernel_for(pkg: ModelPackage) -> LinearKernel | None:
+    if pkg.kernel is not None:
+        return pkg.kernel
+    # Packages built in-process (e.g. right after training) have no compiled kernel yet.
+    return compile_linear_kernel(pkg.model, pkg.feature_names, verify=False)
+
+
 def explain_linear_if_possible(pkg: ModelPackage, features: dict[str, float]) -> dict[str, Any]:
     """
     Best-effort explanation for sklearn Pipeline(StandardScaler -> LogisticRegression).
     Falls back to empty explanation for other model types.
+
+    Reason codes show the most negative contributors as "drivers of risk".
     """
 
-    model = pkg.model
-    if not hasattr(model, "named_steps"):
-        return {}
-    steps = model.named_steps
-    if "scaler" not in steps or "clf" not in steps:
-        return {}
-    scaler = steps["scaler"]
-    clf = steps["clf"]
-    if not hasattr(clf, "coef_") or not hasattr(clf, "intercept_"):
+    kernel = _kernel_for(pkg)
+    if kernel is None:
         return {}
+    return kernel.explain(_vectorize(features, pkg.feature_names))[0]
 
-    feature_names = pkg.feature_names
-    x_raw = np.asarray([float(features.get(k, 0.0)) for k in feature_names], dtype=float)
-    x_scaled = (x_raw - scaler.mean_) / scaler.scale_
-    coefs = clf.coef_[0]
-    intercept = float(clf.intercept_[0])
-
-    contrib = coefs * x_scaled
-    logit = intercept + float(np.sum(contrib))
-    score = float(1 / (1 + math.exp(-logit)))
-
-    rows = []
-    for name, val, w, c in zip(feature_names, x_raw, coefs, contrib, strict=True):
-        rows.append({"feature": name, "value": float(val), "weight": float(w), "contribution": float(c)})
-
-    # Reason codes: show the most negative contributors as "drivers of risk"
-    rows_sorted = sorted(rows, key=lambda r: r["contribution"])
-    worst = rows_sorted[:3]
-    reason_codes = [f"HIGH_RISK_SIGNAL:{r['feature']}" for r in worst]
-
-    return {
-        "explain_type": "linear_logit_contributions",
-        "base_value": intercept,
-        "score_from_explanation": score,
-        "contributions": rows,
-        "reason_codes": reason_codes,
-    }
 
+def explain_linear_batch_if_possible(pkg: ModelPackage, x_raw: np.ndarray) -> list[dict[str, Any]]:
+    """
+    Vectorized counterpart of `explain_linear_if_possible` for a raw feature matrix.
+    """
 
+    kernel = _kernel_for(pkg)
+    if kernel is None:
+        return [{} for _ in range(len(x_raw))]
+    return kernel.explain(x_raw)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+JSON_BACKENDS = ("auto", "orjson", "json")
+
+
+def _default(obj: Any) -> Any:
+    # Mirrors what orjson handles natively, then falls back to `str` like `json.dumps(default=str)`.
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    tolist = getattr(obj, "tolist", None)
+    if callable(tolist):  # numpy scalars and arrays
+        return tolist()
+    return str(obj)
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    name: str
+    # Compact UTF-8 JSON; dataclasses, numpy values and non-str keys are supported,
+    # anything else unknown is written as `str(obj)`.
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[str | bytes], Any]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+STDLIB_BACKEND = JsonBackend(name="json", dumps=_stdlib_dumps, loads=json.loads)
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _orjson_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+    ORJSON_BACKEND: JsonBackend | None = JsonBackend(name="orjson", dumps=_orjson_dumps, loads=orjson.loads)
+else:  # pragma: no cover - optional dependency
+    ORJSON_BACKEND = None
+
+
+def resolve_backend(name: str = "auto") -> JsonBackend:
+    """
+    Backend for a `json_backend` setting: `auto` prefers orjson when it is installed.
+    """
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Unsupported JSON backend {name!r}; expected one of {JSON_BACKENDS}")
+    if name == "json":
+        return STDLIB_BACKEND
+    if ORJSON_BACKEND is None:
+        if name == "orjson":
+            raise RuntimeError("JSON backend 'orjson' requires the optional 'orjson' package (pip install '.[orjson]')")
+        return STDLIB_BACKEND
+    return ORJSON_BACKEND
+
+
+_lock = threading.Lock()
+_backend = resolve_backend()
+
+
+def get_backend() -> JsonBackend:
+    return _backend
+
+
+def set_backend(name: str) -> JsonBackend:
+    """
+    Switch the process-wide backend (e.g. from `Settings.json_backend` at API startup).
+    """
+    global _backend
+    backend = resolve_backend(name)
+    with _lock:
+        _backend = backend
+    return backend
+
+
+def dumps(obj: Any) -> bytes:
+    return _backend.dumps(obj)
+
+
+def dumps_str(obj: Any) -> str:
+    return _backend.dumps(obj).decode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    return _backend.loads(data)
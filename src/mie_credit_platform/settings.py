@@ -15,19 +15,39 @@ class Settings(BaseSettings):
     # Model / registry
     model_registry_dir: str = "models"
     model_version: str = "v0.1.0"
+    # Registry watcher for hot reloads (seconds between checks; 0 disables polling)
+    model_reload_poll_s: float = 5.0
+    # LRU of additional versions requested per call (beyond the active one)
+    model_cache_max_entries: int = 4
+    model_cache_max_bytes: int = 512 * 1024 * 1024
+    # Shadow scoring: challenger version scored off the request path (unset disables)
+    shadow_model_version: str | None = None
+    shadow_workers: int = 2
+    shadow_queue_max: int = 10000
 
     # API
     environment: str = "dev"
     require_api_key: bool = False
     api_key: str | None = None
 
+    # JSON for plain-dict responses, audit payloads and logs: "auto" (orjson if installed), "orjson" or "json"
+    json_backend: str = "auto"
+
     # Decisions
     approval_threshold: float = 0.60
 
     # Audit logging
     audit_db_path: str = "data/audit.sqlite3"
+    # "day" or "month" stores one SQLite file per period next to audit_db_path
+    audit_partitioning: str | None = None
     audit_jsonl_path: str = "data/audit.jsonl"
+    # JSONL rotation into compressed, indexed segments (0 disables a trigger; both are off by default)
+    audit_jsonl_rotate_max_bytes: int = 0
+    audit_jsonl_rotate_max_age_s: float = 0.0
+    audit_jsonl_compression: str | None = "gzip"
     audit_log_request_bodies: bool = False
+    # Record only the score request's audit_context (protected-attribute buckets), not its features
+    audit_log_audit_context: bool = False
     audit_allow_payload_keys: list[str] | None = None
     audit_hash_payload_keys: list[str] = []
     audit_drop_unknown_payload_keys: bool = True
@@ -36,6 +56,25 @@ class Settings(BaseSettings):
     audit_hash_salt: str | None = None
     audit_truncate_payload_strings: int = 256
     audit_max_list_items: int = 50
+    # Background group-commit writer (API only; the CLI always writes synchronously)
+    audit_async_writes: bool = False
+    audit_queue_max_events: int = 10000
+    audit_batch_max_events: int = 500
+    audit_batch_max_delay_ms: float = 50.0
+    # SQLite tuning for the audit store
+    audit_sqlite_mmap_bytes: int = 256 * 1024 * 1024
+    audit_sqlite_cache_kib: int = 64 * 1024
+
+    # Incremental fairness counts fed from score/outcome audit events, served by
+    # /v1/audit/fairness/live. Off unless a path is set or fairness_ledger_enabled is true:
+    # without a saved state, startup replays every score/outcome event in the store.
+    # On startup the saved state is loaded and caught up from the audit store; it is saved every
+    # fairness_ledger_save_interval_s (0 = only on shutdown). After startup a process only
+    # sees its own writes: with several API processes give each its own path, and read
+    # store-wide numbers from /v1/audit/fairness/report.
+    fairness_ledger_path: str | None = None
+    fairness_ledger_enabled: bool = False
+    fairness_ledger_save_interval_s: float = 60.0
 
 
 def get_settings() -> Settings:
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from mie_credit_platform.audit import AuditEvent, now_ts
+from mie_credit_platform.modeling.model_io import ModelPackage
+from mie_credit_platform.modeling.scoring import score_applicants_batch
+
+logger = logging.getLogger("mie.shadow")
+
+SHADOW_EVENT_TYPE = "shadow_score"
+
+# 0.05-wide bins over the full range of challenger - champion score deltas.
+DELTA_BIN_EDGES = np.linspace(-1.0, 1.0, 41)
+
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class ShadowRequest:
+    request_id: str
+    applicant_id: str
+    features: dict[str, float]
+    champion_version: str
+    champion_score: float
+    champion_decision: str
+
+
+class ShadowStats:
+    """
+    Running champion/challenger comparison totals for this process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.n_compared = 0
+        self.n_agree = 0
+        self.transitions: Counter[tuple[str, str]] = Counter()
+        self.delta_counts = np.zeros(len(DELTA_BIN_EDGES) - 1, dtype=np.int64)
+        self.delta_sum = 0.0
+        self.delta_abs_sum = 0.0
+        self.delta_abs_max = 0.0
+
+    def add(self, champion: list[str], challenger: list[str], deltas: np.ndarray) -> None:
+        counts, _ = np.histogram(np.clip(deltas, -1.0, 1.0), bins=DELTA_BIN_EDGES)
+        abs_deltas = np.abs(deltas)
+        pairs = Counter(zip(champion, challenger, strict=True))
+        with self._lock:
+            self.n_compared += len(deltas)
+            self.n_agree += sum(n for (a, b), n in pairs.items() if a == b)
+            self.transitions.update(pairs)
+            self.delta_counts += counts
+            self.delta_sum += float(deltas.sum())
+            self.delta_abs_sum += float(abs_deltas.sum())
+            self.delta_abs_max = max(self.delta_abs_max, float(abs_deltas.max(initial=0.0)))
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            n = self.n_compared
+            return {
+                "n_compared": n,
+                "agreement_rate": self.n_agree / n if n else None,
+                "flips": {f"{a}->{b}": c for (a, b), c in sorted(self.transitions.items()) if a != b},
+                "decisions": {f"{a}->{b}": c for (a, b), c in sorted(self.transitions.items())},
+                "score_delta": {
+                    "mean": self.delta_sum / n if n else None,
+                    "mean_abs": self.delta_abs_sum / n if n else None,
+                    "max_abs": self.delta_abs_max if n else None,
+                    "histogram": {
+                        "edges": [round(float(e), 6) for e in DELTA_BIN_EDGES],
+                        "counts": self.delta_counts.tolist(),
+                    },
+                },
+            }
+
+
+class ShadowScorer:
+    """
+    Scores live traffic with a challenger model on background workers.
+
+    `submit` never blocks the champion's response: requests are dropped (and
+    counted) when the bounded queue is full. Each worker drains up to
+    `batch_size` queued requests, scores them in one vectorized call, records one
+    `shadow_score` audit event per request (tagged with the challenger version)
+    and folds the divergence into `ShadowStats`.
+    """
+
+    def __init__(
+        self,
+        challenger: ModelPackage,
+        audit: Any,
+        *,
+        threshold: float,
+        workers: int = 2,
+        max_queue: int = 10000,
+        batch_size: int = 256,
+    ) -> None:
+        self.challenger = challenger
+        self.threshold = threshold
+        self.stats = ShadowStats()
+        self._audit = audit
+        self._batch_size = max(1, int(batch_size))
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._counter_lock = threading.Lock()
+        self._dropped = 0
+        self._failed = 0
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._run, name=f"mie-shadow-{i}", daemon=True) for i in range(max(1, int(workers)))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, requests: list[ShadowRequest]) -> int:
+        """
+        Enqueue requests for shadow scoring. Returns how many were accepted.
+        """
+        if self._closed:
+            return 0
+        accepted = 0
+        for r in requests:
+            try:
+                self._queue.put_nowait(r)
+            except queue.Full:
+                with self._counter_lock:
+                    self._dropped += len(requests) - accepted
+                break
+            accepted += 1
+        return accepted
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for t in self._threads:
+            t.join()
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "challenger_version": self.challenger.version,
+            "queued": self._queue.qsize(),
+            "dropped": self._dropped,
+            "failed": self._failed,
+            **self.stats.summary(),
+        }
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            batch: list[ShadowRequest] = [item]
+            stop = False
+            while len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self._process(batch)
+            except Exception:
+                with self._counter_lock:
+                    self._failed += len(batch)
+                logger.exception("shadow_batch_failed", extra={"n_requests": len(batch)})
+            finally:
+                for _ in range(len(batch) + int(stop)):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _process(self, batch: list[ShadowRequest]) -> None:
+        pkg = self.challenger
+        started = time.perf_counter()
+        scored = score_applicants_batch(pkg, [r.features for r in batch], self.threshold)
+        challenger_scores = np.fromiter((res.score for res, _ in scored), dtype=float, count=len(batch))
+        champion_scores = np.fromiter((r.champion_score for r in batch), dtype=float, count=len(batch))
+        deltas = challenger_scores - champion_scores
+
+        ts = now_ts()
+        events: list[AuditEvent] = []
+        for r, (res, _), delta in zip(batch, scored, deltas.tolist(), strict=True):
+            events.append(
+                AuditEvent(
+                    ts=ts,
+                    request_id=r.request_id,
+                    event_type=SHADOW_EVENT_TYPE,
+                    model_version=pkg.version,
+                    applicant_id=r.applicant_id,
+                    payload={
+                        "score": res.score,
+                        "decision": res.decision,
+                        "champion_version": r.champion_version,
+                        "champion_score": r.champion_score,
+                        "champion_decision": r.champion_decision,
+                        "score_delta": delta,
+                        "decision_flip": res.decision != r.champion_decision,
+                    },
+                )
+            )
+        self._audit.write_many(events)
+        self.stats.add([r.champion_decision for r in batch], [res.decision for res, _ in scored], deltas)
+        logger.debug(
+            "shadow_batch_scored",
+            extra={"n_requests": len(batch), "elapsed_ms": (time.perf_counter() - started) * 1000.0},
+        )
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
 import time
 from dataclasses import dataclass
 from typing import Any
 
+from mie_credit_platform import serialization
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
@@ -31,7 +32,7 @@ class JsonFormatter(logging.Formatter):
                 continue
             if key not in payload:
                 payload[key] = value
-        return json.dumps(payload, default=str)
+        return serialization.dumps_str(payload)
 
 
 def configure_logging(level: int = logging.INFO) -> None:
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mie_credit_platform.modeling.model_io import load_model_package
+from mie_credit_platform.modeling.train import TrainConfig, train_baseline_logreg
+
+
+@pytest.fixture(scope="session")
+def mie_registry(tmp_path_factory):
+    registry_dir = tmp_path_factory.mktemp("mie_registry")
+    train_baseline_logreg(TrainConfig(version="v0.1.0", registry_dir=str(registry_dir), n_synth=1500, seed=3))
+    return registry_dir
+
+
+@pytest.fixture(scope="session")
+def mie_pkg(mie_registry):
+    # The sklearn pipeline itself, not the compact artifact written next to it.
+    return load_model_package(str(mie_registry), "v0.1.0", prefer_compact=False)
+
+
+@pytest.fixture()
+def mie_multi_registry(mie_registry, tmp_path):
+    """
+    Writable registry holding v0.1.0 and a v0.2.0 copy of it.
+    """
+    d = tmp_path / "registry"
+    shutil.copytree(mie_registry / "v0.1.0", d / "v0.1.0")
+    shutil.copytree(mie_registry / "v0.1.0", d / "v0.2.0")
+    md_path = d / "v0.2.0" / "metadata.json"
+    md = json.loads(md_path.read_text(encoding="utf-8"))
+    md_path.write_text(json.dumps({**md, "version": "v0.2.0"}), encoding="utf-8")
+    return d
+
+
+@pytest.fixture()
+def mie_client(mie_registry, tmp_path, monkeypatch):
+    monkeypatch.setenv("MIE_MODEL_REGISTRY_DIR", str(mie_registry))
+    monkeypatch.setenv("MIE_MODEL_VERSION", "v0.1.0")
+    monkeypatch.setenv("MIE_ENVIRONMENT", "dev")
+    monkeypatch.setenv("MIE_AUDIT_DB_PATH", str(tmp_path / "audit.sqlite3"))
+    monkeypatch.setenv("MIE_AUDIT_JSONL_PATH", str(tmp_path / "audit.jsonl"))
+
+    from mie_credit_platform.api.main import create_app
+
+    with TestClient(create_app()) as client:
+        yield client
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+import time
+
+from ice.audit.events import OutcomeEvent
+from ice.audit.segments import SegmentedJsonlWriter, iter_lines, list_segments
+from ice.audit.store import append_jsonl, utcnow
+from mie_credit_platform.audit import AuditEvent, AuditLogger
+
+
+def _line(ts: float, i: int) -> str:
+    return json.dumps({"ts": ts, "request_id": f"r{i}", "payload": "x" * 40})
+
+
+def test_size_rotation_writes_compressed_indexed_segments(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    writer = SegmentedJsonlWriter(path, max_bytes=500, max_age_s=None, compression="gzip")
+    for i in range(40):
+        writer.append([_line(1000.0 + i, i)])
+    writer.wait_sealed()
+
+    segments = list_segments(path)
+    assert len(segments) > 3
+    assert segments[0].first_line == 0 and segments[0].min_ts == 1000.0
+    assert all(a.last_line + 1 == b.first_line for a, b in zip(segments, segments[1:], strict=False))
+    assert all(a.max_ts < b.min_ts for a, b in zip(segments, segments[1:], strict=False))
+    with gzip.open(tmp_path / segments[0].file, "rt", encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == segments[0].n_events
+    assert sum(s.n_events for s in segments) + len(open(path).read().splitlines()) == 40
+
+    all_ids = [json.loads(line)["request_id"] for line in iter_lines(path)]
+    assert all_ids == [f"r{i}" for i in range(40)]
+    recent = [json.loads(line)["ts"] for line in iter_lines(path, since_ts=1035.0)]
+    assert min(recent) >= segments[-1].min_ts and 1039.0 in recent
+    assert len(recent) < 40  # older segments were skipped via their index
+
+
+def test_age_rotation_and_interrupted_seal_recovery(tmp_path):
+    path = str(tmp_path / "audit.jsonl")
+    writer = SegmentedJsonlWriter(path, max_bytes=None, max_age_s=60, compression=None)
+    writer.append([_line(1000.0, 0)])
+    writer.append([_line(1001.0, 1)])  # old event timestamps alone do not trigger rotation
+    assert list_segments(path) == []
+    with open(path + ".active", "w", encoding="utf-8") as f:
+        json.dump({"inode": os.stat(path).st_ino, "opened_at": time.time() - 120}, f)
+    writer = SegmentedJsonlWriter(path, max_bytes=None, max_age_s=60, compression=None)
+    writer.append([_line(1002.0, 2)])
+    writer.wait_sealed()
+    assert [s.n_events for s in list_segments(path)] == [2]
+
+    # Simulate a crash between the rename and the sidecar write.
+    os.replace(path, str(tmp_path / "audit.000002.jsonl"))
+    # Unsealed segments are still read.
+    assert [json.loads(line)["request_id"] for line in iter_lines(path)] == ["r0", "r1", "r2"]
+    SegmentedJsonlWriter(path, compression="gzip").wait_sealed()
+    segments = list_segments(path)
+    assert [s.seq for s in segments] == [1, 2]
+    assert segments[1].file == "audit.000002.jsonl.gz" and segments[1].last_line == 2
+
+
+def test_ice_and_mie_logs_rotate(tmp_path):
+    ice_path = str(tmp_path / "ice" / "decisions.jsonl")
+    for i in range(20):
+        event = OutcomeEvent("outcome", f"app{i}", "repayment_90d", 1, utcnow())
+        append_jsonl(ice_path, event, rotate_max_bytes=400, compression="gzip")
+    assert len(list(iter_lines(ice_path))) == 20
+
+    mie_path = str(tmp_path / "mie" / "audit.jsonl")
+    audit = AuditLogger(str(tmp_path / "mie" / "audit.sqlite3"), mie_path, jsonl_max_bytes=300)
+    for i in range(10):
+        audit.write(AuditEvent(1000.0 + i, f"r{i}", "score", "v1", None, {"score": 0.5}))
+    audit.close()
+    assert list_segments(mie_path)
+    assert [json.loads(line)["request_id"] for line in iter_lines(mie_path)] == [f"r{i}" for i in range(10)]
+
+
+def test_appends_do_not_wait_for_sealing(tmp_path, monkeypatch):
+    path = str(tmp_path / "audit.jsonl")
+    writer = SegmentedJsonlWriter(path, max_bytes=200, max_age_s=None, compression="gzip")
+    release = threading.Event()
+    seal = SegmentedJsonlWriter._seal
+
+    def slow_seal(self, seq, raw):
+        release.wait(5)
+        return seal(self, seq, raw)
+
+    monkeypatch.setattr(SegmentedJsonlWriter, "_seal", slow_seal)
+    started = time.monotonic()
+    for i in range(10):
+        writer.append([_line(1000.0 + i, i)])
+    assert time.monotonic() - started < 2
+    assert list_segments(path) == []
+    # Renamed but not yet sealed segments are still read.
+    assert [json.loads(line)["request_id"] for line in iter_lines(path)] == [f"r{i}" for i in range(10)]
+
+    release.set()
+    writer.wait_sealed()
+    assert sum(s.n_events for s in list_segments(path)) + len(open(path).read().splitlines()) == 10
+    assert [json.loads(line)["request_id"] for line in iter_lines(path)] == [f"r{i}" for i in range(10)]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from ice.fairness.bootstrap import bootstrap_counts, bootstrap_rows
+from ice.fairness.monitor import compute_fairness_report
+from mie_credit_platform.audit import AuditEvent
+from mie_credit_platform.fairness_ledger import outcome_event
+from mie_credit_platform.modeling.fairness import bootstrap_intervals, count_cells, group_counts
+
+
+def _rows(n: int = 3_000, seed: int = 2):
+    rng = np.random.default_rng(seed)
+    groups = rng.choice(["a", "b", "minority"], size=n, p=[0.5, 0.45, 0.05]).tolist()
+    selected = [bool(rng.random() < (0.3 if g == "minority" else 0.5)) for g in groups]
+    outcomes = rng.integers(0, 2, n).tolist()
+    return groups, selected, outcomes
+
+
+def test_count_and_row_bootstraps_agree_and_cover_the_estimates():
+    groups, selected, outcomes = _rows()
+    report = compute_fairness_report(selected, groups, "g", outcomes=outcomes)
+    counts = group_counts(groups, [int(s) for s in selected], outcomes)
+    assert count_cells(counts).sum(axis=1).tolist() == counts.n.tolist()
+
+    by_counts = bootstrap_intervals(counts, n_replicates=2_000, seed=1)
+    by_rows = bootstrap_rows(groups, selected, outcomes, n_replicates=2_000, seed=1)
+    assert by_counts.reference == by_rows.reference == "b"
+    for g, rate in report["selection_rates"].items():
+        lo, hi = by_counts.selection_rates[g]
+        assert lo <= rate <= hi
+        assert by_rows.selection_rates[g] == pytest.approx((lo, hi), abs=0.02)
+    # The small group's interval is the widest.
+    widths = {g: hi - lo for g, (lo, hi) in by_counts.selection_rates.items()}
+    assert max(widths, key=widths.get) == "minority"
+    assert by_counts.disparate_impact["b"] == (1.0, 1.0)
+    assert by_counts.tpr_gap is not None and by_counts.fpr_gap is not None
+
+    poisson = bootstrap_counts(counts.groups, count_cells(counts), seed=1, method="poisson")
+    assert poisson.selection_rates["minority"] == pytest.approx(by_counts.selection_rates["minority"], abs=0.02)
+
+
+def test_row_bootstrap_is_reproducible_across_worker_counts():
+    groups, selected, outcomes = _rows(n=400)
+    scores = np.linspace(0, 1, 400)
+    serial = bootstrap_rows(groups, selected, outcomes, scores=scores, n_replicates=120, seed=7)
+    pooled = bootstrap_rows(groups, selected, outcomes, scores=scores, n_replicates=120, seed=7, workers=2)
+    assert serial == pooled
+    assert set(serial.calibration_in_the_large) == {"a", "b", "minority"}
+    assert serial != bootstrap_rows(groups, selected, outcomes, scores=scores, n_replicates=120, seed=8)
+
+
+def test_ice_report_intervals_are_opt_in():
+    groups, selected, outcomes = _rows(n=500)
+    assert compute_fairness_report(selected, groups, "g")["confidence_intervals"] is None
+
+    ci = compute_fairness_report(selected, groups, "g", n_bootstrap=200, seed=3)["confidence_intervals"]
+    assert set(ci["disparate_impact_pairs"]) == {"a_vs_b", "b_vs_b", "minority_vs_b"}
+    assert ci["tpr"] == {} and ci["tpr_gap"] is None  # no outcomes
+    rows = compute_fairness_report(
+        selected, groups, "g", outcomes=outcomes, n_bootstrap=200, seed=3, bootstrap_method="rows"
+    )["confidence_intervals"]
+    assert rows["method"] == "rows" and set(rows["tpr"]) == {"a", "b", "minority"}
+    with pytest.raises(ValueError):
+        compute_fairness_report(selected, groups, "g", n_bootstrap=10, bootstrap_method="jackknife")
+    with pytest.raises(ValueError):
+        bootstrap_rows(groups, selected, confidence=1.0)
+
+
+def test_fairness_endpoint_returns_intervals_on_request(mie_client):
+    groups, selected, outcomes = _rows(n=300)
+    rows = [
+        {"protected_group": g, "y_true": t, "y_pred": int(s)}
+        for g, s, t in zip(groups, selected, outcomes, strict=True)
+    ]
+    assert mie_client.post("/v1/audit/fairness", json={"rows": rows}).json()["confidence_intervals"] is None
+
+    body = {"rows": rows, "n_bootstrap": 300, "bootstrap_seed": 5, "confidence": 0.9}
+    r = mie_client.post("/v1/audit/fairness", json=body)
+    assert r.status_code == 200
+    point, ci = r.json(), r.json()["confidence_intervals"]
+    assert ci["n_replicates"] == 300 and ci["confidence"] == 0.9
+    rates = point["selection_rate_by_group"]
+    assert ci["reference"] == max(rates, key=rates.get)
+    lo, hi = ci["demographic_parity_difference"]
+    assert lo <= point["demographic_parity_difference"] <= hi
+    assert mie_client.post("/v1/audit/fairness", json=body).json()["confidence_intervals"] == ci
+    assert mie_client.post("/v1/audit/fairness", json={**body, "n_bootstrap": -1}).status_code == 422
+
+
+def test_inconsistent_counts_are_rejected(mie_client):
+    audit = mie_client.app.state.audit
+    score = AuditEvent(
+        ts=1_000.0,
+        request_id="r0",
+        event_type="score",
+        model_version="v1",
+        applicant_id=None,
+        payload={"score": 0.9, "decision": "REVIEW", "audit_context": {"sex": "f"}},
+    )
+    audit.write(score)
+    (stored,) = audit.iter_events(event_type="score")
+    # The same decision labeled twice: more labeled decisions than decisions.
+    audit.write_many([outcome_event(stored, 1, ts=2_000.0), outcome_event(stored, 1, ts=2_001.0)])
+
+    counts = audit.fairness_counts("sex").counts()
+    with pytest.raises(ValueError, match="Inconsistent"):
+        count_cells(counts)
+    with pytest.raises(ValueError, match="negative cells"):
+        bootstrap_counts(["f"], [[0, 0, 0, 0, 1, -1]])
+    r = mie_client.get("/v1/audit/fairness/report", params={"attribute": "sex", "n_bootstrap": 100})
+    assert r.status_code == 400 and "Inconsistent" in r.json()["detail"]
+
+
+def test_fairness_engine_imports_the_bootstrap_lazily():
+    code = (
+        "import sys; from mie_credit_platform.modeling import fairness; "
+        "print(sorted(m for m in sys.modules if m.startswith('ice.fairness')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
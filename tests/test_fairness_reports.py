@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from ice.audit.events import DecisionEvent
+from ice.fairness.monitor import (
+    columns_from_events,
+    compute_fairness_report,
+    compute_fairness_reports,
+)
+
+
+def _columns(n: int = 2_000, seed: int = 9):
+    rng = np.random.default_rng(seed)
+    columns = {
+        "sex": rng.choice(["F", "M"], size=n).tolist(),
+        "age_band": rng.choice(["18-24", "25-49", "65+"], size=n, p=[0.3, 0.68, 0.02]).tolist(),
+    }
+    decisions = (rng.random(n) < 0.5).tolist()
+    outcomes = rng.integers(0, 2, n).tolist()
+    return decisions, columns, outcomes
+
+
+def test_single_attribute_report_matches_the_per_group_definition():
+    decisions = [True, False, True, True, False, False]
+    groups = ["b", "a", "b", "c", "a", "b"]
+    report = compute_fairness_report(decisions, groups, "g", outcomes=[1, 1, 0, 1, 0, 1])
+    assert report["groups"] == ["a", "b", "c"]
+    assert report["selection_rates"] == pytest.approx({"a": 0.0, "b": 2 / 3, "c": 1.0})
+    assert report["disparate_impact_pairs"] == pytest.approx({"a_vs_c": 0.0, "b_vs_c": 2 / 3, "c_vs_c": 1.0})
+    assert report["error_rates"] == {
+        "a": {"tpr": 0.0, "fpr": 0.0},
+        "b": {"tpr": 0.5, "fpr": 1.0},
+        "c": {"tpr": 1.0, "fpr": 0.0},
+    }
+    assert compute_fairness_report(decisions, groups, "g")["error_rates"] is None
+    with pytest.raises(ValueError):
+        compute_fairness_report(decisions, groups[:-1], "g")
+
+
+def test_multi_attribute_and_intersectional_reports():
+    decisions, columns, outcomes = _columns()
+    out = compute_fairness_reports(decisions, columns, outcomes, intersections=[("age_band", "sex")])
+    assert list(out["reports"]) == ["sex", "age_band", "age_band|sex"]
+
+    for attribute, values in columns.items():
+        single = compute_fairness_report(decisions, values, attribute, outcomes=outcomes)
+        got = out["reports"][attribute]
+        assert got["selection_rates"] == pytest.approx(single["selection_rates"])
+        assert got["error_rates"] == single["error_rates"]
+
+    joined = [f"{a}|{s}" for a, s in zip(columns["age_band"], columns["sex"], strict=True)]
+    single = compute_fairness_report(decisions, joined, "age_band|sex", outcomes=outcomes)
+    got = out["reports"]["age_band|sex"]
+    assert got["groups"] == single["groups"]
+    assert got["disparate_impact_pairs"] == pytest.approx(single["disparate_impact_pairs"])
+    assert sum(got["group_sizes"].values()) == len(decisions)
+
+
+def test_intersections_only_count_observed_combinations():
+    # The cross-product (10^18 cells) would not fit in memory; only the rows' combinations are counted.
+    n = 3_000
+    rng = np.random.default_rng(3)
+    columns = {a: [f"{a}{i}" for i in rng.permutation(1_000_000)[:n]] for a in ("x", "y", "z")}
+    columns["z"][0] = None
+    decisions = (rng.random(n) < 0.5).tolist()
+    out = compute_fairness_reports(decisions, columns, intersections=[("x", "y", "z")])
+    got = out["reports"]["x|y|z"]
+    joined = [None if z is None else f"{x}|{y}|{z}" for x, y, z in zip(*columns.values(), strict=True)]
+    single = compute_fairness_report(decisions, joined, "x|y|z")
+    assert sorted(got["groups"]) == single["groups"] and len(got["groups"]) == n - 1
+    assert got["selection_rates"] == single["selection_rates"]
+
+
+def test_small_cells_are_suppressed_and_missing_values_skipped():
+    decisions, columns, outcomes = _columns()
+    columns["sex"][:10] = [None] * 10
+    out = compute_fairness_reports(
+        decisions, columns, outcomes, intersections=[("sex", "age_band")], min_cell_size=50
+    )
+    assert sum(out["reports"]["sex"]["group_sizes"].values()) == len(decisions) - 10
+    age = out["reports"]["age_band"]
+    assert age["suppressed_groups"] == ["65+"] and "65+" not in age["selection_rates"]
+    assert "65+" not in age["error_rates"] and all("65+" not in k for k in age["disparate_impact_pairs"])
+    cross = out["reports"]["sex|age_band"]
+    assert set(cross["suppressed_groups"]) == {"F|65+", "M|65+"}
+    assert all(n >= 50 for n in cross["group_sizes"].values())
+
+    with pytest.raises(ValueError):
+        compute_fairness_reports(decisions, columns, intersections=[("sex", "zip")])
+    with pytest.raises(ValueError):
+        compute_fairness_reports(decisions[:-1], columns)
+
+
+def test_columns_from_decision_events():
+    def event(i: int, decision: str, sensitive):
+        return DecisionEvent(
+            event_type="decision",
+            application_id=f"app-{i}",
+            request_id=f"r{i}",
+            model_name="m",
+            model_version="1",
+            decision=decision,
+            score=0.5,
+            decision_threshold=0.5,
+            reason_codes=[],
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            sensitive_attributes=sensitive,
+        )
+
+    events = [
+        event(0, "approve", {"sex": "F", "age_band": "25-49"}),
+        event(1, "deny", {"sex": "M"}),
+        event(2, "approve", None),
+    ]
+    decisions, columns, outcomes = columns_from_events(events, ["sex", "age_band"], outcomes={"app-0": 1})
+    assert decisions == [True, False, True]
+    assert columns == {"sex": ["F", "M", None], "age_band": ["25-49", None, None]}
+    assert outcomes == [1, None, None]
+
+    report = compute_fairness_reports(decisions, columns, outcomes)["reports"]["sex"]
+    assert report["selection_rates"] == {"F": 1.0, "M": 0.0}
+    assert report["error_rates"] == {"F": {"tpr": 1.0, "fpr": 0.0}}
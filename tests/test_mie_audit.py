@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import itertools
+import json
+import sqlite3
+import threading
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+from mie_credit_platform.audit import (
+    SCHEMA_SQL,
+    SCHEMA_VERSION,
+    AuditEvent,
+    AuditLogger,
+    PIIRedactor,
+    _filters_sql,
+    _select_sql,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+
+
+def _event(i: int, **overrides) -> AuditEvent:
+    fields = {
+        "ts": 1_700_000_000.0 + i,
+        "request_id": f"r{i}",
+        "event_type": "score",
+        "model_version": "v0.1.0",
+        "applicant_id": f"a{i}",
+        "payload": {"score": 0.5, "decision": "REVIEW", "reason_codes": []},
+    }
+    fields.update(overrides)
+    return AuditEvent(**fields)
+
+
+def test_async_writer_group_commits_and_flushes_on_close(tmp_path):
+    jsonl = tmp_path / "audit.jsonl"
+    audit = AuditLogger(
+        str(tmp_path / "audit.sqlite3"),
+        str(jsonl),
+        redactor=PIIRedactor(),
+        async_writes=True,
+        max_queue=16,
+        batch_size=8,
+        max_delay_ms=5,
+    )
+    threads = [
+        threading.Thread(target=lambda k=k: audit.write_many(_event(k * 100 + i) for i in range(50)))
+        for k in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    audit.write(_event(999))
+    audit.close()
+
+    assert audit.count() == 201
+    lines = jsonl.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 201
+    assert json.loads(lines[0])["applicant_id"] != "a0"  # hashed by the redactor
+    with pytest.raises(RuntimeError):
+        audit.write(_event(1000))
+
+
+def test_async_writer_retries_and_reports_lost_events(tmp_path, monkeypatch):
+    audit = AuditLogger(str(tmp_path / "audit.sqlite3"), None, async_writes=True, max_delay_ms=0)
+    lost: list[int] = []
+    audit.add_write_failure_listener(lost.append)
+    write_encoded = audit._write_encoded
+    failures = iter([True, True])
+
+    def flaky(events, payloads):
+        if next(failures, False):
+            raise sqlite3.OperationalError("database is locked")
+        return write_encoded(events, payloads)
+
+    monkeypatch.setattr(audit, "_write_encoded", flaky)
+    audit.write_many(_event(i) for i in range(3))
+    assert audit.flush() == 0 and audit.count() == 3 and lost == []
+
+    failures = itertools.repeat(True)
+    audit.write(_event(3))
+    assert audit.flush() == 1 and audit.flush() == 0
+    assert audit.lost_events == 1 and lost == [1] and audit.count() == 3
+    audit.close()
+
+
+def test_write_many_persists_in_one_call(tmp_path):
+    audit = AuditLogger(str(tmp_path / "audit.sqlite3"))
+    audit.write_many(_event(i) for i in range(10))
+    audit.write_many([])
+    assert audit.count() == 10
+    assert [e.request_id for e in audit.query(limit=3)] == ["r9", "r8", "r7"]
+
+
+def test_readers_are_persistent_read_only_and_do_not_block_writes(tmp_path):
+    audit = AuditLogger(str(tmp_path / "audit.sqlite3"))
+    audit.write(_event(0))
+    reader = audit._conns.reader()
+    assert audit._conns.reader() is reader
+    assert reader.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("DELETE FROM audit_events")
+
+    # An open read transaction must not stop the writer (WAL).
+    reader.execute("BEGIN")
+    assert reader.execute("SELECT COUNT(1) FROM audit_events").fetchone()[0] == 1
+    audit.write(_event(1))
+    reader.execute("COMMIT")
+    assert audit.count() == 2
+
+    other: list[sqlite3.Connection] = []
+    t = threading.Thread(target=lambda: other.append(audit._conns.reader()))
+    t.start()
+    t.join()
+    assert other[0] is not reader
+    audit.close()
+
+
+def test_cursor_pagination_is_stable_while_events_arrive(tmp_path):
+    audit = AuditLogger(str(tmp_path / "audit.sqlite3"))
+    # Duplicate timestamps exercise the (ts, id) tie-break.
+    audit.write_many(_event(i, ts=1_700_000_000.0 + i // 3) for i in range(30))
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        page = audit.query(limit=7, cursor=cursor)
+        seen.extend(e.id for e in page)
+        audit.write(_event(100 + len(seen), ts=1_800_000_000.0))  # newer events must not shift pages
+        cursor = next_cursor(page, 7)
+        if cursor is None:
+            break
+    assert seen == list(range(30, 0, -1))
+    assert decode_cursor(encode_cursor(1.5, 42)) == (1.5, 42)
+    with pytest.raises(ValueError):
+        audit.query(cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        audit.query(cursor=encode_cursor(1.0, 1), offset=5)
+
+    out = tmp_path / "export.jsonl"
+    n = audit.export_jsonl(str(out), event_type="score", batch_size=4, cursor=encode_cursor(1_700_000_005.0, 17))
+    ids = [json.loads(line)["id"] for line in out.read_text(encoding="utf-8").splitlines()]
+    assert n == len(ids) == 16
+    assert ids == list(range(16, 0, -1))
+
+
+def test_export_endpoint_streams_ndjson(mie_client):
+    audit = mie_client.app.state.audit
+    audit.write_many(_event(i, event_type="score" if i % 2 else "explain") for i in range(1200))
+
+    r = mie_client.get("/v1/audit/export", params={"event_type": "score"})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert len(rows) == 600
+    assert rows[0]["request_id"] == "r1199" and rows[-1]["request_id"] == "r1"
+
+    gz = mie_client.get("/v1/audit/export", params={"event_type": "score", "gzip": True})
+    assert gz.headers["content-encoding"] == "gzip"
+    assert gz.text == r.text  # httpx transparently decompresses
+
+    assert mie_client.get("/v1/audit/export", params={"cursor": "bogus"}).status_code == 400
+
+
+FILTER_VALUES = {
+    "request_id": "r1",
+    "event_type": "score",
+    "applicant_id": "a1",
+    "model_version": "v0.1.0",
+    "since_ts": 1.0,
+    "until_ts": 2.0,
+}
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        dict(zip(FILTER_VALUES, mask, strict=True))
+        for mask in itertools.product([False, True], repeat=len(FILTER_VALUES))
+    ],
+)
+def test_filtered_queries_never_scan_the_table(tmp_path, filters):
+    audit = AuditLogger(str(tmp_path / "audit.sqlite3"))
+    kwargs = {k: v for k, v in FILTER_VALUES.items() if filters[k]}
+    where, params = _filters_sql(**{k: kwargs.get(k) for k in FILTER_VALUES})
+    conn = audit._conns.reader()
+    for after in (None, (1.5, 10)):
+        sql, p = _select_sql(where, params, after=after)
+        plans = [conn.execute("EXPLAIN QUERY PLAN " + sql + " LIMIT 100", p).fetchall()]
+        count_sql = "SELECT COUNT(1) FROM audit_events " + ("WHERE " + " AND ".join(where) if where else "")
+        plans.append(conn.execute("EXPLAIN QUERY PLAN " + count_sql, params).fetchall())
+        for plan in plans:
+            details = [row[-1] for row in plan]
+            assert not any(d.startswith("SCAN audit_events") and "INDEX" not in d for d in details), details
+        assert not any("TEMP B-TREE" in row[-1] for row in plans[0]), plans[0]
+
+
+def test_migrations_upgrade_legacy_databases(tmp_path):
+    db = tmp_path / "audit.sqlite3"
+    with sqlite3.connect(db) as conn:
+        conn.executescript(SCHEMA_SQL)
+        conn.execute(
+            "INSERT INTO audit_events (ts, request_id, event_type, payload_json) VALUES (1.0, 'r', 'score', '{}')"
+        )
+    audit = AuditLogger(str(db))
+    conn = audit._conns.reader()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_audit_events_event_type_ts", "idx_audit_events_applicant_id_ts"} <= names
+    assert audit.count() == 1
+    audit.close()
+    assert AuditLogger(str(db)).count() == 1  # re-opening is a no-op migration
+
+
+@pytest.mark.parametrize(
+    "redactor",
+    [
+        PIIRedactor(),
+        PIIRedactor(allow_payload_keys={"score", "decision", "reason_codes", "nested", "secret"}, hash_salt="s"),
+        PIIRedactor(
+            allow_payload_keys={"score"},
+            hash_payload_keys={"secret"},
+            drop_disallowed_payload_keys=False,
+            truncate_strings_at=5,
+            max_list_items=2,
+        ),
+        PIIRedactor(remove_applicant_id=True, hash_payload_keys={"score"}),
+    ],
+)
+def test_compiled_redaction_matches_reference(redactor):
+    payloads = [
+        {"score": 0.5, "decision": "APPROVE", "reason_codes": ["HIGH_RISK_SIGNAL:x" * 20] * 60},
+        {"score": np.float64(0.25), "decision": None, "reason_codes": ("a", 1, None), "n_rows": True},
+        {"nested": {1: ["long" * 100, {"k": {1, 2}}], "b": object.__name__}, "secret": "ssn-123", 7: "seven"},
+        {"score": "0.9" * 200, "features": {"rent": 0.9}, "secret": {"x": 1}},
+    ]
+    for i, payload in enumerate(payloads):
+        event = _event(i, payload=payload, applicant_id=f"a{i % 2}" if i < 3 else None)
+        expected = redactor._redact_event_reference(event)
+        for _ in range(2):  # second pass hits the applicant-id LRU
+            actual = redactor.redact_event(event)
+            assert json.dumps(asdict(actual), default=str) == json.dumps(asdict(expected), default=str)
+            assert type(actual) is type(expected)
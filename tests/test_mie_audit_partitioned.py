@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from mie_credit_platform.audit import AuditEvent, AuditLogger, next_cursor
+from mie_credit_platform.audit_partitioned import PartitionedAuditLogger, partition_for_ts
+
+DAY = 86400.0
+T0 = 1_767_225_600.0  # 2026-01-01T00:00:00Z
+
+
+def _event(i: int, ts: float, **overrides) -> AuditEvent:
+    fields = {
+        "ts": ts,
+        "request_id": f"r{i}",
+        "event_type": "score" if i % 2 else "explain",
+        "model_version": "v0.1.0",
+        "applicant_id": f"a{i}",
+        "payload": {"score": 0.5},
+    }
+    fields.update(overrides)
+    return AuditEvent(**fields)
+
+
+@pytest.fixture()
+def plogger(tmp_path):
+    audit = PartitionedAuditLogger(str(tmp_path / "audit.sqlite3"), str(tmp_path / "audit.jsonl"))
+    # 5 days, 10 events per day (two share each timestamp)
+    audit.write_many(_event(d * 10 + i, T0 + d * DAY + (i // 2) * 60) for d in range(5) for i in range(10))
+    yield audit
+    audit.close()
+
+
+def test_partition_bounds():
+    assert partition_for_ts(T0 + 5, "day")[0] == "2026-01-01"
+    key, _, start, end = partition_for_ts(T0 + 40 * DAY, "month")
+    assert key == "2026-02" and start == T0 + 31 * DAY and end == T0 + 59 * DAY
+    assert partition_for_ts(T0 - 1, "month")[3] == T0  # December rolls into January
+
+
+def test_queries_fan_out_and_merge_in_ts_desc_order(plogger):
+    assert [p.key for p in plogger.partitions()][:2] == ["2026-01-05", "2026-01-04"]
+    assert plogger.count() == 50
+    assert plogger.count(since_ts=T0 + 3 * DAY, event_type="score") == 10
+
+    seen, cursor = [], None
+    while True:
+        page = plogger.query(limit=7, cursor=cursor)
+        seen.extend(page)
+        cursor = next_cursor(page, 7)
+        if cursor is None:
+            break
+    assert len(seen) == 50 == len({e.id for e in seen})
+    assert [(e.ts, e.id) for e in seen] == sorted(((e.ts, e.id) for e in seen), reverse=True)
+    assert plogger.query(limit=5, offset=12)[0].id == seen[12].id
+    assert plogger.get(seen[3].id) == seen[3]
+
+    window = plogger.query(limit=100, since_ts=T0 + DAY, until_ts=T0 + 2 * DAY - 1)
+    assert {e.request_id for e in window} == {f"r{i}" for i in range(10, 20)}
+    assert [e.id for e in plogger.iter_events(cursor=next_cursor(seen[:10], 10))] == [e.id for e in seen[10:]]
+
+
+def test_retention_drops_whole_partitions(plogger, tmp_path):
+    assert plogger.drop_partitions_before(T0 + 2 * DAY) == ["2026-01-02", "2026-01-01"]
+    assert plogger.count() == 30
+    assert not (tmp_path / "audit.2026-01-01.sqlite3").exists()
+    out = tmp_path / "export.jsonl"
+    assert plogger.export_jsonl(str(out), event_type="score") == 15
+    assert json.loads(out.read_text(encoding="utf-8").splitlines()[0])["request_id"] == "r49"
+
+
+def test_retried_batches_do_not_rewrite_committed_partitions(tmp_path, monkeypatch):
+    audit = PartitionedAuditLogger(str(tmp_path / "audit.sqlite3"), None, async_writes=True, max_delay_ms=200)
+    calls: list[str] = []
+    write_encoded = AuditLogger._write_encoded
+
+    def flaky(self, events, payloads):
+        calls.append(self.db_path)
+        if len(calls) == 2:
+            raise sqlite3.OperationalError("disk I/O error")
+        return write_encoded(self, events, payloads)
+
+    monkeypatch.setattr(AuditLogger, "_write_encoded", flaky)
+    # One batch spanning two partitions; the second partition fails once.
+    audit.write_many([_event(1, T0), _event(3, T0 + DAY)])
+    assert audit.flush() == 0
+    assert len(calls) == 3 and calls[1] == calls[2]
+    assert audit.count() == 2 and audit.lost_events == 0
+    audit.close()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+
+from typer.testing import CliRunner
+
+from mie_credit_platform.bench.cases import BENCHMARKS
+from mie_credit_platform.bench.harness import (
+    REPORT_FORMAT,
+    Benchmark,
+    Prepared,
+    SkipBenchmark,
+    SuiteOptions,
+    compare,
+    run_benchmarks,
+    select,
+)
+from mie_credit_platform.cli import app
+
+
+def _fake(name: str, setup) -> Benchmark:
+    return Benchmark(name, name.split(".")[0], "", (10,), setup)
+
+
+def _skip(ctx, size):
+    raise SkipBenchmark("not here")
+
+
+def _boom(ctx, size):
+    raise RuntimeError("broken")
+
+
+def test_report_records_timings_skips_and_errors(tmp_path):
+    calls = []
+    benches = [
+        _fake("demo.ok", lambda ctx, size: Prepared(run=lambda: calls.append(size), ops=size)),
+        _fake("demo.skip", _skip),
+        _fake("demo.boom", _boom),
+    ]
+    report = run_benchmarks(benches, SuiteOptions(repeat=3, sizes=(4,), workdir=str(tmp_path)))
+
+    assert report["format"] == REPORT_FORMAT
+    ok, skipped, failed = report["results"]
+    assert ok["key"] == "demo.ok[4]" and ok["ops"] == 4 and len(ok["times_s"]) == 3
+    assert ok["min_s"] <= ok["median_s"] <= ok["p95_s"]
+    assert calls == [4] * 4  # warmup + 3 timed runs
+    assert skipped["skipped"] == "not here"
+    assert failed["error"] == "RuntimeError: broken"
+    json.dumps(report)
+
+
+def test_compare_flags_regressions_against_baseline():
+    def report(**medians):
+        return {
+            "format": REPORT_FORMAT,
+            "results": [{"key": k, "median_s": v} for k, v in medians.items()],
+        }
+
+    baseline = report(a=1.0, b=1.0, c=1.0, gone=1.0)
+    current = report(a=1.5, b=0.5, c=1.05, new=1.0)
+    cmp = compare(current, baseline, tolerance=0.1)
+    status = {r["key"]: r["status"] for r in cmp["results"]}
+    assert status == {"a": "regression", "b": "improvement", "c": "ok", "new": "new"}
+    assert (cmp["regressions"], cmp["improvements"], cmp["missing"]) == (1, 1, ["gone"])
+
+
+def test_select_matches_groups_and_names():
+    assert {b.group for b in select(BENCHMARKS, ["audit"])} == {"audit"}
+    assert [b.name for b in select(BENCHMARKS, ["scoring.score_applicant"])] == ["scoring.score_applicant"]
+    assert select(BENCHMARKS, None) == list(BENCHMARKS)
+
+
+def test_bench_cli_writes_report_and_compares(tmp_path):
+    out = tmp_path / "bench.json"
+    args = ["bench", "--only", "fairness.selection_rates", "--sizes", "100", "--repeat", "2"]
+    result = CliRunner().invoke(app, [*args, "--out", str(out), "--workdir", str(tmp_path / "w")])
+    assert result.exit_code == 0, result.output
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert [r["key"] for r in report["results"]] == ["fairness.selection_rates[100]"]
+    assert report["results"][0]["ops_per_s"] > 0
+
+    result = CliRunner().invoke(app, [*args, "--baseline", str(out), "--out", str(tmp_path / "next.json")])
+    assert result.exit_code == 0, result.output
+    comparison = json.loads((tmp_path / "next.json").read_text(encoding="utf-8"))["comparison"]
+    assert comparison["results"][0]["key"] == "fairness.selection_rates[100]"
+    assert comparison["baseline"] == str(out)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Light commands must not pull in the scientific stack. The time budget is generous
+# (a cold sklearn import alone exceeds it) and can be tuned for slow CI runners.
+FORBIDDEN = {"pandas", "sklearn", "scipy", "joblib"}
+BUDGET_US = int(os.environ.get("MIE_CLI_IMPORT_BUDGET_US", "750000"))
+
+
+def _run_with_importtime(args: list[str], env: dict[str, str]) -> tuple[str, set[str], int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "mie_credit_platform.cli", *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **env},
+        check=True,
+    )
+    # "import time: <self us> | <cumulative us> | <module name indented by depth>"
+    modules: set[str] = set()
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):
+            total_us += int(cum)
+    return proc.stdout, modules, total_us
+
+
+@pytest.mark.parametrize("command", ["list-models", "audit-events"])
+def test_light_commands_stay_within_import_budget(command, mie_registry, tmp_path):
+    env = {
+        "MIE_MODEL_REGISTRY_DIR": str(mie_registry),
+        "MIE_AUDIT_DB_PATH": str(tmp_path / "audit.sqlite3"),
+        "MIE_AUDIT_JSONL_PATH": str(tmp_path / "audit.jsonl"),
+    }
+    stdout, imported, total_us = _run_with_importtime([command], env)
+    assert json.loads(stdout) is not None
+
+    heavy = sorted(m for m in imported if m.split(".")[0] in FORBIDDEN)
+    assert heavy == [], f"{command} imported {heavy[:5]}"
+    assert total_us <= BUDGET_US, f"{command} spent {total_us}us importing modules (budget {BUDGET_US}us)"
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from mie_credit_platform.modeling.fairness import (
+    compute_fairness_metrics,
+    demographic_parity_difference,
+    equal_opportunity_difference,
+    factorize_groups,
+    selection_rates_by_group,
+    tpr_by_group,
+)
+
+GROUPS = ["b", "a", "b", "c", "a", "b"]
+Y_TRUE = [1, 0, 1, 0, 1, 0]
+Y_PRED = [1, 1, 0, 0, 1, 1]
+
+
+def _reference(groups, y_true, y_pred, positive_label=1):
+    sel, tpr = {}, {}
+    for g in sorted(set(groups)):
+        rows = [(yt, yp) for gg, yt, yp in zip(groups, y_true, y_pred, strict=True) if gg == g]
+        sel[g] = sum(yp == positive_label for _, yp in rows) / len(rows)
+        pos = [yp for yt, yp in rows if yt == positive_label]
+        if pos:
+            tpr[g] = sum(yp == positive_label for yp in pos) / len(pos)
+    return sel, tpr
+
+
+def test_factorize_groups_sorted_codes():
+    labels, codes = factorize_groups(["b", "a", "b"])
+    assert labels == ["a", "b"] and codes.tolist() == [1, 0, 1]
+    labels, codes = factorize_groups([])
+    assert labels == [] and codes.size == 0
+
+
+def test_rows_without_a_group_are_left_out():
+    labels, codes = factorize_groups(["b", None, "a", np.nan])
+    assert labels == ["a", "b"] and codes.tolist() == [1, -1, 0, -1]
+
+    groups = [*GROUPS, None, float("nan")]
+    m = compute_fairness_metrics(groups, [*Y_TRUE, 1, 0], [*Y_PRED, 1, 1], y_score=[*Y_PRED, 0.9, 0.8])
+    expected = compute_fairness_metrics(GROUPS, Y_TRUE, Y_PRED)
+    assert m.groups == ["a", "b", "c"] and m.counts.n.tolist() == expected.counts.n.tolist()
+    assert m.selection_rate == expected.selection_rate and m.tpr == expected.tpr
+    assert m.calibration_in_the_large == expected.calibration_in_the_large
+
+
+@pytest.mark.parametrize("positive_label", [0, 1])
+def test_wrappers_match_reference(positive_label):
+    rng = np.random.default_rng(3)
+    groups = [f"g{i}" for i in rng.integers(0, 5, 2_000).tolist()]
+    y_true = rng.integers(0, 2, 2_000).tolist()
+    y_pred = rng.integers(0, 2, 2_000).tolist()
+    sel, tpr = _reference(groups, y_true, y_pred, positive_label)
+
+    got_sel = selection_rates_by_group(groups, y_pred, positive_label=positive_label)
+    got_tpr = tpr_by_group(groups, y_true, y_pred, positive_label=positive_label)
+    assert list(got_sel) == list(sel) and got_sel == pytest.approx(sel)
+    assert list(got_tpr) == list(tpr) and got_tpr == pytest.approx(tpr)
+
+
+def test_engine_rates_and_differences():
+    m = compute_fairness_metrics(GROUPS, Y_TRUE, Y_PRED)
+    assert m.groups == ["a", "b", "c"]
+    assert m.selection_rate == pytest.approx({"a": 1.0, "b": 2 / 3, "c": 0.0})
+    # Only defined rates are reported: "c" has no actual or predicted positives.
+    assert m.tpr == pytest.approx({"a": 1.0, "b": 0.5})
+    assert m.fpr == pytest.approx({"a": 1.0, "b": 1.0, "c": 0.0})
+    assert m.precision == pytest.approx({"a": 0.5, "b": 0.5})
+    assert m.calibration_in_the_large == pytest.approx({"a": 0.5, "b": 0.0, "c": 0.0})
+    assert m.demographic_parity_difference == pytest.approx(demographic_parity_difference(m.selection_rate)) == 1.0
+    assert m.equal_opportunity_difference == pytest.approx(equal_opportunity_difference(m.tpr)) == 0.5
+
+    scored = compute_fairness_metrics(np.array(GROUPS, dtype=object), Y_TRUE, Y_PRED, y_score=[0.5] * 6)
+    assert scored.calibration_in_the_large == pytest.approx({"a": 0.0, "b": -1 / 6, "c": 0.5})
+
+
+def test_engine_rejects_misaligned_inputs():
+    with pytest.raises(ValueError):
+        compute_fairness_metrics(GROUPS, Y_TRUE[:-1], Y_PRED)
+    with pytest.raises(ValueError):
+        selection_rates_by_group(GROUPS, Y_PRED[:2])
+
+
+def test_fairness_endpoint_reports_engine_metrics(mie_client):
+    rows = [{"protected_group": g, "y_true": t, "y_pred": p} for g, t, p in zip(GROUPS, Y_TRUE, Y_PRED, strict=True)]
+    r = mie_client.post("/v1/audit/fairness", json={"rows": rows})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["groups"] == ["a", "b", "c"]
+    assert body["demographic_parity_difference"] == pytest.approx(1.0)
+    assert body["tpr_by_group"] == pytest.approx({"a": 1.0, "b": 0.5})
+    assert body["precision_by_group"] == pytest.approx({"a": 0.5, "b": 0.5})
+    assert set(body["fpr_by_group"]) == {"a", "b", "c"}
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from test_mie_scoring import APPLICANT
+
+from mie_credit_platform.audit import (
+    AuditEvent,
+    AuditLogger,
+    StoredAuditEvent,
+    build_redactor_from_settings,
+)
+from mie_credit_platform.audit_partitioned import PartitionedAuditLogger
+from mie_credit_platform.fairness_ledger import FairnessLedger, FairnessLedgerSaver, outcome_event
+from mie_credit_platform.modeling.fairness import (
+    FairnessAccumulator,
+    compute_fairness_metrics,
+    group_counts,
+)
+from mie_credit_platform.settings import Settings
+
+DAY = 86400.0
+
+
+def _score_event(i: int, ts: float, group: str, decision: str, score: float = 0.7) -> StoredAuditEvent:
+    return StoredAuditEvent(
+        ts=ts,
+        request_id=f"r{i}",
+        event_type="score",
+        model_version="v1",
+        applicant_id=f"a{i}",
+        payload={"score": score, "decision": decision, "audit_context": {"sex": group, "age_band": None}},
+        id=i,
+    )
+
+
+def test_accumulator_matches_batch_engine_and_round_trips():
+    rng = np.random.default_rng(5)
+    groups = [f"g{i}" for i in rng.integers(0, 4, 500).tolist()]
+    y_pred = rng.integers(0, 2, 500).tolist()
+    y_true = rng.integers(0, 2, 500).tolist()
+
+    acc = FairnessAccumulator()
+    for g, yp, yt in zip(groups, y_pred, y_true, strict=True):
+        acc.add_decision(g, yp == 1)
+        acc.add_outcome(g, yp == 1, yt == 1)
+    expected = compute_fairness_metrics(groups, y_true, y_pred)
+    got = acc.metrics()
+    assert got.selection_rate == pytest.approx(expected.selection_rate)
+    assert got.tpr == pytest.approx(expected.tpr) and got.fpr == pytest.approx(expected.fpr)
+    assert got.precision == pytest.approx(expected.precision)
+
+    bulk = FairnessAccumulator()
+    bulk.add_counts(group_counts(groups, y_pred, y_true))
+    assert bulk == acc
+    assert FairnessAccumulator.from_dict(acc.to_dict()) == acc
+
+    half = FairnessAccumulator()
+    half.add_counts(group_counts(groups[:200], y_pred[:200], y_true[:200]))
+    rest = acc - half
+    assert rest + half == acc
+    with pytest.raises(ValueError):
+        half - acc
+
+
+def test_ledger_windows_by_decision_day_and_merges(tmp_path):
+    d0 = 20_000 * DAY
+    worker_a, worker_b = FairnessLedger(), FairnessLedger()
+    score_events = [
+        _score_event(1, d0 + 10, "f", "APPROVE"),
+        _score_event(2, d0 + 20, "m", "REVIEW"),
+        _score_event(3, d0 + DAY + 5, "f", "REVIEW"),
+    ]
+    worker_a.observe(score_events[:2])
+    worker_b.observe(score_events[2:])
+    # Outcomes arrive days later but count against the day of the decision.
+    worker_b.observe([outcome_event(score_events[0], 1, ts=d0 + 9 * DAY)])
+
+    worker_a.save(str(tmp_path / "a.json"))
+    worker_b.save(str(tmp_path / "b.json"))
+    ledger = FairnessLedger.load(str(tmp_path / "a.json"), str(tmp_path / "b.json"))
+
+    day0 = ledger.window("sex", since_ts=d0, until_ts=d0 + 100).metrics()
+    assert day0.selection_rate == {"f": 1.0, "m": 0.0}
+    assert day0.tpr == {"f": 1.0} and day0.counts.labeled.tolist() == [1, 0]
+    both = ledger.window("sex", model_version="v1").metrics()
+    assert both.selection_rate == {"f": 0.5, "m": 0.0} and both.demographic_parity_difference == 0.5
+    assert both.calibration_in_the_large == pytest.approx({"f": 0.7 - 1.0})
+    assert len(ledger.window("age_band")) == 0 and len(ledger.window("sex", model_version="v2")) == 0
+    assert ledger.days() == [20_000, 20_001]
+
+
+def test_listener_sees_redacted_events_and_failures_are_contained(tmp_path):
+    audit = AuditLogger(str(tmp_path / "a.sqlite3"), None, redactor=build_redactor_from_settings(Settings()))
+    seen: list[AuditEvent] = []
+    audit.add_listener(lambda events: 1 / 0)
+    audit.add_listener(seen.extend)
+    audit.write(AuditEvent(ts=1.0, request_id="r", event_type="score", model_version=None, applicant_id="x", payload={}))
+    assert len(seen) == 1 and seen[0].applicant_id != "x"
+    assert audit.count() == 1
+    audit.close()
+
+
+def test_outcomes_feed_live_fairness_and_persist(mie_registry, tmp_path, monkeypatch):
+    monkeypatch.setenv("MIE_MODEL_REGISTRY_DIR", str(mie_registry))
+    monkeypatch.setenv("MIE_MODEL_VERSION", "v0.1.0")
+    monkeypatch.setenv("MIE_ENVIRONMENT", "dev")
+    monkeypatch.setenv("MIE_AUDIT_DB_PATH", str(tmp_path / "audit.sqlite3"))
+    monkeypatch.setenv("MIE_AUDIT_JSONL_PATH", str(tmp_path / "audit.jsonl"))
+    monkeypatch.setenv("MIE_AUDIT_LOG_AUDIT_CONTEXT", "true")
+    monkeypatch.setenv("MIE_FAIRNESS_LEDGER_PATH", str(tmp_path / "ledger.json"))
+
+    from mie_credit_platform.api.main import create_app
+
+    with TestClient(create_app()) as client:
+        items = [
+            {"applicant_id": f"a{i}", "features": APPLICANT, "audit_context": {"sex": "fm"[i % 2]}} for i in range(4)
+        ]
+        r = client.post("/v1/score:batch", json={"items": items}, headers={"X-Request-Id": "batch-1"})
+        assert r.status_code == 200
+        decisions = [item["decision"] for item in r.json()["results"]]
+
+        outcomes = [{"request_id": "batch-1", "applicant_id": f"a{i}", "outcome": i % 2} for i in range(4)]
+        outcomes.append({"request_id": "batch-1", "applicant_id": "nobody", "outcome": 1})
+        r = client.post("/v1/outcomes", json={"outcomes": outcomes})
+        assert r.status_code == 200 and r.json() == {"n_recorded": 4, "unmatched": [4]}
+        # The same decision cannot be labeled twice.
+        assert client.post("/v1/outcomes", json={"outcomes": outcomes[:1]}).json()["unmatched"] == [0]
+
+        live = client.get("/v1/audit/fairness/live", params={"attribute": "sex", "days": 1})
+        assert live.status_code == 200
+        body = live.json()
+        assert body["groups"] == ["f", "m"]
+        assert body["n_decisions_by_group"] == {"f": 2, "m": 2} and body["n_labeled_by_group"] == {"f": 2, "m": 2}
+        approved = {g: sum(d == "APPROVE" for d in decisions[k::2]) / 2 for k, g in enumerate("fm")}
+        assert body["selection_rate_by_group"] == pytest.approx(approved)
+        assert client.get("/v1/audit/fairness/live", params={"attribute": "zip"}).status_code == 400
+
+    with TestClient(create_app()) as client:
+        body = client.get("/v1/audit/fairness/live", params={"attribute": "sex"}).json()
+        assert body["n_decisions_by_group"] == {"f": 2, "m": 2}
+
+    # Without a saved state the ledger is rebuilt from the audit store.
+    (tmp_path / "ledger.json").unlink()
+    with TestClient(create_app()) as client:
+        body = client.get("/v1/audit/fairness/live", params={"attribute": "sex"}).json()
+        assert body["n_decisions_by_group"] == {"f": 2, "m": 2} and body["n_labeled_by_group"] == {"f": 2, "m": 2}
+
+
+@pytest.mark.parametrize("backend", ["plain", "partitioned"])
+def test_labeled_lookup_covers_every_outcome_of_a_request(backend, tmp_path):
+    if backend == "plain":
+        audit = AuditLogger(str(tmp_path / "a.sqlite3"), None)
+    else:
+        audit = PartitionedAuditLogger(str(tmp_path / "a.sqlite3"), None, granularity="day")
+    d0 = 20_000 * DAY
+    # More outcomes under one request id than a bounded scan of them would see.
+    audit.write_many(
+        AuditEvent(ts=d0 + i, request_id="bulk", event_type="score", model_version="v1", applicant_id=f"a{i}", payload={})
+        for i in range(1_200)
+    )
+    stored = list(audit.iter_events(event_type="score"))
+    audit.write_many(outcome_event(e, 1, ts=d0 + 3 * DAY) for e in stored[1:])
+
+    ids = [e.id for e in stored]
+    assert audit.labeled_score_event_ids(ids, since_ts=d0) == set(ids[1:])
+    assert audit.labeled_score_event_ids(ids[:1]) == set() and audit.labeled_score_event_ids([]) == set()
+    audit.close()
+
+
+def test_duplicate_outcomes_are_rejected_with_async_writes(mie_registry, tmp_path, monkeypatch):
+    monkeypatch.setenv("MIE_MODEL_REGISTRY_DIR", str(mie_registry))
+    monkeypatch.setenv("MIE_MODEL_VERSION", "v0.1.0")
+    monkeypatch.setenv("MIE_ENVIRONMENT", "dev")
+    monkeypatch.setenv("MIE_AUDIT_DB_PATH", str(tmp_path / "audit.sqlite3"))
+    monkeypatch.setenv("MIE_AUDIT_JSONL_PATH", str(tmp_path / "audit.jsonl"))
+    monkeypatch.setenv("MIE_AUDIT_LOG_AUDIT_CONTEXT", "true")
+    monkeypatch.setenv("MIE_AUDIT_ASYNC_WRITES", "true")
+    monkeypatch.setenv("MIE_AUDIT_BATCH_MAX_DELAY_MS", "500")
+    monkeypatch.setenv("MIE_FAIRNESS_LEDGER_ENABLED", "true")
+
+    from mie_credit_platform.api.main import create_app
+
+    with TestClient(create_app()) as client:
+        items = [{"applicant_id": f"a{i}", "features": APPLICANT, "audit_context": {"sex": "f"}} for i in range(2)]
+        assert client.post("/v1/score:batch", json={"items": items}, headers={"X-Request-Id": "b"}).status_code == 200
+        outcomes = [{"request_id": "b", "applicant_id": f"a{i}", "outcome": 1} for i in range(2)]
+        # Posted back to back, before the writer's batch delay has passed.
+        assert client.post("/v1/outcomes", json={"outcomes": outcomes}).json()["n_recorded"] == 2
+        assert client.post("/v1/outcomes", json={"outcomes": outcomes}).json()["unmatched"] == [0, 1]
+        client.app.state.audit.flush()
+        body = client.get("/v1/audit/fairness/live", params={"attribute": "sex"}).json()
+        assert body["n_decisions_by_group"] == {"f": 2} and body["n_labeled_by_group"] == {"f": 2}
+
+
+def test_ledger_catches_up_from_the_audit_store(tmp_path):
+    audit = AuditLogger(str(tmp_path / "a.sqlite3"), None)
+    d0 = 20_000 * DAY
+    score_events = [
+        _score_event(i, d0 + (i // 4) * 2 * DAY + i * 3600.0, "fm"[i % 2], "APPROVE" if i % 3 else "REVIEW")
+        for i in range(8)
+    ]
+    audit.write_many(score_events[:4])
+    stored = list(audit.iter_events(event_type="score"))
+    audit.write_many(outcome_event(e, 1, ts=d0 + DAY) for e in stored[:2])
+    saved = FairnessLedger()
+    assert saved.catch_up(audit) == 6 and saved.watermark_ts == d0 + DAY
+    saved.save(str(tmp_path / "ledger.json"))
+
+    # Written after the last save, e.g. before a crash.
+    audit.write_many(score_events[4:])
+    stored = list(audit.iter_events(event_type="score"))
+    audit.write_many(outcome_event(e, 0, ts=d0 + 3 * DAY) for e in stored[:2])
+
+    rebuilt = FairnessLedger()
+    assert rebuilt.catch_up(audit, batch_size=3) == 12
+    resumed = FairnessLedger.load(str(tmp_path / "ledger.json"))
+    assert resumed.catch_up(audit) == 6 and resumed.catch_up(audit) == 0
+    assert resumed.to_dict() == rebuilt.to_dict()
+    counts = resumed.window("sex").counts()
+    assert counts.n.tolist() == [4, 4] and counts.labeled.tolist() == [2, 2]
+    audit.close()
+
+
+@pytest.mark.parametrize("partitioned", [False, True])
+def test_catch_up_keeps_events_at_or_behind_the_watermark(tmp_path, partitioned):
+    if partitioned:
+        audit = PartitionedAuditLogger(str(tmp_path / "audit"), None, granularity="day")
+    else:
+        audit = AuditLogger(str(tmp_path / "a.sqlite3"), None)
+    d0 = 20_000 * DAY + 100
+    live = FairnessLedger()
+    audit.add_listener(live.observe)
+    audit.write_many([_score_event(1, d0, "f", "APPROVE"), _score_event(2, d0 + 5, "m", "APPROVE")])
+    saved = FairnessLedger.from_dict(live.to_dict())
+    # Same time as the watermark, and committed late with an older time (e.g. by the async writer).
+    audit.write_many([_score_event(3, d0 + 5, "f", "REVIEW"), _score_event(4, d0 + 1, "m", "REVIEW")])
+
+    assert saved.catch_up(audit) == 2 and saved.catch_up(audit) == 0
+    assert saved.window("sex").counts().n.tolist() == [2, 2]
+    assert saved.window("sex").counts().n.tolist() == live.window("sex").counts().n.tolist()
+    audit.close()
+
+
+def test_live_fairness_is_off_unless_configured(mie_registry, tmp_path, monkeypatch):
+    monkeypatch.setenv("MIE_MODEL_REGISTRY_DIR", str(mie_registry))
+    monkeypatch.setenv("MIE_MODEL_VERSION", "v0.1.0")
+    monkeypatch.setenv("MIE_ENVIRONMENT", "dev")
+    monkeypatch.setenv("MIE_AUDIT_DB_PATH", str(tmp_path / "audit.sqlite3"))
+    monkeypatch.setenv("MIE_AUDIT_JSONL_PATH", str(tmp_path / "audit.jsonl"))
+
+    from mie_credit_platform.api.main import create_app
+
+    with TestClient(create_app()) as client:
+        assert client.app.state.fairness_ledger is None and client.app.state.audit._listeners == []
+        assert client.get("/v1/audit/fairness/live", params={"attribute": "sex"}).status_code == 404
+
+
+def test_ledger_saver_writes_periodically(tmp_path):
+    ledger = FairnessLedger()
+    ledger.observe([_score_event(1, 20_000 * DAY, "f", "APPROVE")])
+    path = tmp_path / "ledger.json"
+    saver = FairnessLedgerSaver(ledger, str(path), interval_s=0.01)
+    saver.start()
+    deadline = time.monotonic() + 5.0
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    saver.stop()
+    assert FairnessLedger.load(str(path)).to_dict() == ledger.to_dict()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from mie_credit_platform.audit import AuditEvent, AuditLogger
+from mie_credit_platform.audit_partitioned import PartitionedAuditLogger
+from mie_credit_platform.cli import app
+from mie_credit_platform.fairness_ledger import outcome_event
+from mie_credit_platform.modeling.fairness import compute_fairness_metrics
+
+T0 = 20_000 * 86400.0
+
+
+def _populate(audit, n: int = 600, seed: int = 11):
+    """
+    Write `n` score events over ~4 days and label every other one; returns the rows as written.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    events = []
+    for i in range(n):
+        group = ["a", "b", "c"][int(rng.integers(0, 3))]
+        approved = bool(rng.random() < 0.5)
+        ts = T0 + i * 600.0
+        rows.append((ts, group, approved, float(rng.random()), int(rng.random() < 0.6)))
+        events.append(
+            AuditEvent(
+                ts=ts,
+                request_id=f"r{i}",
+                event_type="score",
+                model_version="v1" if i % 4 else "v2",
+                applicant_id=f"a{i}",
+                payload={
+                    "score": rows[-1][3],
+                    "decision": "APPROVE" if approved else "REVIEW",
+                    "audit_context": {"sex": group},
+                },
+            )
+        )
+    audit.write_many(events)
+    stored = {e.request_id: e for e in audit.iter_events(event_type="score")}
+    audit.write_many(
+        outcome_event(stored[f"r{i}"], rows[i][4], ts=rows[i][0] + 40 * 86400.0) for i in range(0, n, 2)
+    )
+    return rows
+
+
+@pytest.mark.parametrize("backend", ["plain", "partitioned"])
+def test_sql_counts_match_the_in_memory_engine(backend, tmp_path):
+    if backend == "plain":
+        audit = AuditLogger(str(tmp_path / "a.sqlite3"), None)
+    else:
+        audit = PartitionedAuditLogger(str(tmp_path / "a.sqlite3"), None, granularity="day")
+    rows = _populate(audit)
+    since, until = T0 + 86400.0, T0 + 3 * 86400.0
+
+    fm = audit.fairness_counts("sex", since_ts=since, until_ts=until, chunk_s=5000.0).metrics()
+    window = [(i, r) for i, r in enumerate(rows) if since <= r[0] <= until]
+    groups = [r[1] for _, r in window]
+    expected = compute_fairness_metrics(groups, [0] * len(groups), [int(r[2]) for _, r in window])
+    assert fm.selection_rate == pytest.approx(expected.selection_rate)
+    assert fm.counts.n.tolist() == expected.counts.n.tolist()
+
+    labeled = [(i, r) for i, r in window if i % 2 == 0]
+    expected = compute_fairness_metrics(
+        [r[1] for _, r in labeled],
+        [r[4] for _, r in labeled],
+        [int(r[2]) for _, r in labeled],
+        y_score=[r[3] for _, r in labeled],
+    )
+    assert fm.tpr == pytest.approx(expected.tpr) and fm.fpr == pytest.approx(expected.fpr)
+    assert fm.precision == pytest.approx(expected.precision)
+    assert fm.calibration_in_the_large == pytest.approx(expected.calibration_in_the_large)
+
+    by_version = audit.fairness_counts("sex", model_version="v2")
+    assert int(by_version.counts().n.sum()) == sum(1 for i in range(len(rows)) if i % 4 == 0)
+    assert len(audit.fairness_counts("age_band")) == 0
+    with pytest.raises(ValueError):
+        audit.fairness_counts("sex') --")
+    audit.close()
+
+
+def test_report_endpoint_and_cli_read_the_audit_store(mie_client, tmp_path):
+    audit = mie_client.app.state.audit
+    _populate(audit, n=40)
+
+    r = mie_client.get("/v1/audit/fairness/report", params={"attribute": "sex", "model_version": "v1"})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["groups"] == ["a", "b", "c"] and sum(body["n_decisions_by_group"].values()) == 30
+    assert sum(body["n_labeled_by_group"].values()) == 10  # even i with i % 4 == 2
+    assert mie_client.get("/v1/audit/fairness/report", params={"attribute": "bad name"}).status_code == 400
+    assert audit.count(event_type="fairness_report") == 1
+
+    result = CliRunner().invoke(
+        app,
+        ["fairness-report", "--attribute", "sex", "--model-version", "v1", "--audit-db-path", audit.db_path],
+    )
+    assert result.exit_code == 0, result.output
+    cli = json.loads(result.output)
+    assert cli["selection_rate_by_group"] == pytest.approx(body["selection_rate_by_group"])
+    assert cli["tpr_by_group"] == pytest.approx(body["tpr_by_group"])
+
+
+def test_outcomes_of_pruned_decisions_are_not_counted(tmp_path):
+    audit = PartitionedAuditLogger(str(tmp_path / "a.sqlite3"), None, granularity="day")
+
+    def score(i: int, ts: float, decision: str) -> AuditEvent:
+        payload = {"score": 0.9, "decision": decision, "audit_context": {"sex": "f"}}
+        return AuditEvent(
+            ts=ts, request_id=f"r{i}", event_type="score", model_version="v1", applicant_id=None, payload=payload
+        )
+
+    audit.write_many([score(0, T0 + 10.0, "APPROVE"), score(1, T0 + 86400.0 + 10.0, "REVIEW")])
+    old, new = sorted(audit.iter_events(event_type="score"), key=lambda e: e.ts)
+    audit.write_many([outcome_event(old, 1, ts=T0 + 2 * 86400.0), outcome_event(new, 0, ts=T0 + 2 * 86400.0)])
+    assert audit.fairness_counts("sex").counts().labeled.tolist() == [2]
+
+    audit.drop_partitions_before(T0 + 86400.0)
+    c = audit.fairness_counts("sex").counts()
+    # Only the remaining REVIEW decision and its own label are left.
+    assert (c.n.tolist(), c.pred_pos.tolist(), c.labeled.tolist(), c.tp.tolist()) == ([1], [0], [1], [0])
+    audit.close()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from mie_credit_platform.audit import AuditLogger
+from mie_credit_platform.file_scoring import detect_format, score_file
+from mie_credit_platform.modeling.scoring import score_applicants_batch
+from mie_credit_platform.modeling.synthetic_data import SyntheticDataConfig, make_synthetic_alt_data
+
+
+@pytest.fixture()
+def applicants(mie_pkg):
+    df = make_synthetic_alt_data(SyntheticDataConfig(n=1203, seed=5))[mie_pkg.feature_names].copy()
+    df.insert(0, "applicant_id", [f"app-{i}" for i in range(len(df))])
+    df.loc[7, "rent_on_time_ratio_12m"] = None
+    return df
+
+
+@pytest.mark.parametrize(("src", "dst", "workers"), [("in.csv", "out.jsonl", 0), ("in.jsonl", "out.csv.gz", 2)])
+def test_score_file_matches_batch_scoring_in_input_order(
+    mie_registry, mie_pkg, applicants, tmp_path, src, dst, workers
+):
+    in_path, out_path = tmp_path / src, tmp_path / dst
+    if src.endswith(".csv"):
+        applicants.to_csv(in_path, index=False)
+    else:
+        applicants.to_json(in_path, orient="records", lines=True)
+    audit = AuditLogger(str(tmp_path / "audit.sqlite3"))
+
+    summary = score_file(
+        str(in_path),
+        str(out_path),
+        registry_dir=str(mie_registry),
+        version="v0.1.0",
+        require_approval=False,
+        threshold=0.6,
+        chunk_size=250,
+        workers=workers,
+        audit=audit,
+    )
+    assert (summary["rows"], summary["scored"], summary["failed"], summary["chunks"]) == (1203, 1202, 1, 5)
+
+    if dst.endswith(".jsonl"):
+        out = pd.read_json(out_path, lines=True, dtype=False)
+        codes = out["reason_codes"].tolist()
+    else:
+        out = pd.read_csv(out_path, keep_default_na=False)
+        codes = [c.split(";") if c else [] for c in out["reason_codes"]]
+    assert out["applicant_id"].tolist() == applicants["applicant_id"].tolist()
+    assert out.loc[7, "error"] == "missing_or_invalid_features" and codes[7] == []
+
+    rows = applicants.drop(index=7)[mie_pkg.feature_names].to_dict(orient="records")
+    expected = score_applicants_batch(mie_pkg, rows, 0.6)
+    scored = out.drop(index=7)
+    for (res, _), score, decision, rc in zip(
+        expected, scored["score"].astype(float), scored["decision"], codes[:7] + codes[8:], strict=True
+    ):
+        assert abs(res.score - score) <= 1e-9 and res.decision == decision and res.reason_codes == rc
+
+    assert audit.count(request_id=summary["request_id"], event_type="score") == 1202
+    audit.close()
+
+
+def test_detect_format():
+    assert detect_format("x.ndjson.gz") == "jsonl" and detect_format("x.pq") == "parquet"
+    with pytest.raises(ValueError):
+        detect_format("x.txt")
+    assert detect_format("x.txt", "csv") == "csv"
+
+
+@pytest.mark.parametrize("src", ["in.csv", "in.jsonl"])
+def test_ids_are_kept_as_text_whatever_the_chunk(mie_registry, mie_pkg, applicants, tmp_path, src):
+    rows = applicants.head(6).copy()
+    ids: list[object] = ["00123", None, "00123", "0042", "", "7"]
+    if src.endswith(".jsonl"):
+        ids[5] = 7  # a numeric JSON id next to a null one must not become "7.0"
+    rows["applicant_id"] = ids
+    in_path, out_path = tmp_path / src, tmp_path / "out.jsonl"
+    if src.endswith(".csv"):
+        rows.to_csv(in_path, index=False)
+    else:
+        rows.to_json(in_path, orient="records", lines=True)
+
+    audit = AuditLogger(str(tmp_path / "audit.sqlite3"))
+    summary = score_file(
+        str(in_path),
+        str(out_path),
+        registry_dir=str(mie_registry),
+        version="v0.1.0",
+        require_approval=False,
+        threshold=0.6,
+        chunk_size=2,
+        audit=audit,
+    )
+    out = pd.read_json(out_path, lines=True, dtype=False)
+    # Blank ids fall back to the row number; the rest keep their exact text in every chunk.
+    assert out["applicant_id"].tolist() == ["00123", "1", "00123", "0042", "4", "7"]
+    events = list(audit.iter_events(request_id=summary["request_id"], event_type="score"))
+    assert sorted(e.applicant_id for e in events) == sorted(out["applicant_id"])
+    audit.close()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from test_mie_scoring import APPLICANT
+
+from mie_credit_platform.audit import AuditLogger
+from mie_credit_platform.metrics import MetricsRegistry, StageTimer
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        series, value = line.rsplit(" ", 1)
+        metric, _, rest = series.partition("{")
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', rest))
+        if metric == name and all(found.get(k) == v for k, v in labels.items()):
+            return float(value)
+    raise AssertionError(f"no sample {name}{labels}")
+
+
+def test_registry_renders_counters_and_cumulative_buckets():
+    reg = MetricsRegistry()
+    c = reg.counter("jobs_total", "Jobs.", ("kind",))
+    c.inc(kind='a"b')
+    c.inc(2, kind='a"b')
+    h = reg.histogram("latency_seconds", "Latency.", ("op",), buckets=(0.1, 1.0))
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(v, op="x")
+
+    text = reg.render()
+    assert "# TYPE jobs_total counter" in text and "# TYPE latency_seconds histogram" in text
+    assert 'jobs_total{kind="a\\"b"} 3' in text
+    assert _sample(text, "latency_seconds_bucket", op="x", le="0.1") == 2
+    assert _sample(text, "latency_seconds_bucket", op="x", le="1") == 3
+    assert _sample(text, "latency_seconds_bucket", op="x", le="+Inf") == 4
+    assert _sample(text, "latency_seconds_count", op="x") == 4
+    assert h.snapshot(op="x") == (4, pytest.approx(3.65))
+
+    assert reg.counter("jobs_total", "Jobs.", ("kind",)) is c
+    with pytest.raises(ValueError):
+        reg.histogram("jobs_total", "Jobs.", ("kind",))
+    with pytest.raises(ValueError):
+        c.inc(other="x")
+
+
+def test_stage_timer_records_only_when_observed():
+    reg = MetricsRegistry()
+    h = reg.histogram("stage_seconds", "Stages.", ("stage",))
+    timer = StageTimer()
+    timer.mark("a")
+    timer.mark("b")
+    assert [s for s, _ in timer.stages] == ["a", "b"] and all(t >= 0 for _, t in timer.stages)
+    assert h.snapshot(stage="a") == (0, 0.0)
+    timer.observe(h)
+    assert h.snapshot(stage="a")[0] == 1 and h.snapshot(stage="b")[0] == 1
+
+
+def test_metrics_endpoint_exposes_stages_and_decisions(mie_client):
+    for i in range(3):
+        r = mie_client.post("/v1/score", json={"applicant_id": f"a{i}", "features": APPLICANT})
+        assert r.status_code == 200
+    decision = r.json()["decision"]
+    assert mie_client.post("/v1/explain", json={"applicant_id": "a0", "features": APPLICANT}).status_code == 200
+    rows = [{"protected_group": g, "y_true": 1, "y_pred": i % 2} for i, g in enumerate("abab")]
+    assert mie_client.post("/v1/audit/fairness", json={"rows": rows}).status_code == 200
+    assert mie_client.get("/v1/audit/events").status_code == 200
+    for version in ("v0.1.0", "no-such-version", "another-one"):
+        assert mie_client.get("/v1/audit/events", params={"model_version": version}).status_code == 200
+    assert mie_client.post("/v1/score", json={"applicant_id": "bad"}).status_code == 422
+
+    resp = mie_client.get("/metrics")
+    assert resp.status_code == 200 and resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = resp.text
+
+    assert _sample(text, "mie_decisions_total", endpoint="score", model_version="v0.1.0", decision=decision) == 3
+    stage = "mie_request_stage_duration_seconds_count"
+    for s in ("validate", "model_lookup", "predict", "explain", "audit", "serialize"):
+        assert _sample(text, stage, endpoint="score", stage=s, model_version="v0.1.0") == 3
+    assert _sample(text, stage, endpoint="explain", stage="explain", model_version="v0.1.0") == 1
+    assert _sample(text, stage, endpoint="fairness", stage="compute") == 1
+    assert _sample(text, stage, endpoint="audit_events", stage="query", model_version="") == 1
+    assert _sample(text, stage, endpoint="audit_events", stage="query", model_version="v0.1.0") == 1
+    # Versions the registry does not know share one label.
+    assert _sample(text, stage, endpoint="audit_events", stage="query", model_version="other") == 2
+    assert "no-such-version" not in text
+
+    assert _sample(text, "mie_http_requests_total", method="POST", route="/v1/score", status="200") == 3
+    assert _sample(text, "mie_http_requests_total", method="POST", route="/v1/score", status="422") == 1
+    assert _sample(text, "mie_http_request_duration_seconds_count", method="POST", route="/v1/score") == 4
+
+
+def test_lost_audit_events_are_counted(mie_registry, tmp_path, monkeypatch):
+    monkeypatch.setenv("MIE_MODEL_REGISTRY_DIR", str(mie_registry))
+    monkeypatch.setenv("MIE_MODEL_VERSION", "v0.1.0")
+    monkeypatch.setenv("MIE_ENVIRONMENT", "dev")
+    monkeypatch.setenv("MIE_AUDIT_DB_PATH", str(tmp_path / "audit.sqlite3"))
+    monkeypatch.setenv("MIE_AUDIT_JSONL_PATH", str(tmp_path / "audit.jsonl"))
+    monkeypatch.setenv("MIE_AUDIT_ASYNC_WRITES", "true")
+
+    from mie_credit_platform.api.main import create_app
+
+    def failing(self, events, payloads):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    with TestClient(create_app()) as client:
+        monkeypatch.setattr(AuditLogger, "_write_encoded", failing)
+        assert client.post("/v1/score", json={"applicant_id": "a0", "features": APPLICANT}).status_code == 200
+        lost = client.app.state.audit.flush()
+        assert lost > 0 and client.app.state.audit.lost_events == lost
+        assert _sample(client.get("/metrics").text, "mie_audit_lost_events_total") == lost
+
+
+def test_unmatched_paths_share_one_route_label(mie_client):
+    for path in ("/nope/1", "/nope/2"):
+        assert mie_client.get(path).status_code == 404
+    text = mie_client.get("/metrics").text
+    assert _sample(text, "mie_http_requests_total", method="GET", route="unmatched", status="404") == 2
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from test_mie_scoring import APPLICANT as FEATURES
+
+from mie_credit_platform.governance.model_cache import ModelCache, estimate_package_bytes
+from mie_credit_platform.modeling.model_io import load_model_package, set_approved
+
+APPLICANT = {"applicant_id": "a-1", "features": FEATURES}
+
+
+def test_lru_eviction_byte_budget_and_revalidation(mie_multi_registry):
+    registry = str(mie_multi_registry)
+    cache = ModelCache(registry, require_approval=False, max_entries=1)
+    assert cache.get("v0.1.0") is cache.get("v0.1.0")
+    cache.get("v0.2.0")
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.versions) == (1, 2, 1, ["v0.2.0"])
+    with pytest.raises(FileNotFoundError):
+        cache.get("v9")
+    assert cache.stats().load_errors == 1
+
+    size = estimate_package_bytes(load_model_package(registry, "v0.1.0"))
+    budget = ModelCache(registry, require_approval=True, max_entries=10, max_bytes=size + size // 2)
+    set_approved(registry, "v0.1.0", True)
+    set_approved(registry, "v0.2.0", True)
+    budget.get("v0.1.0")
+    budget.get("v0.2.0")
+    assert budget.stats().versions == ["v0.2.0"] and budget.stats().evictions == 1
+
+    set_approved(registry, "v0.2.0", False)
+    assert budget.revalidate() == ["v0.2.0"]
+    with pytest.raises(PermissionError):
+        budget.get("v0.2.0")
+
+
+def test_api_scores_requested_version_and_audits_it(mie_multi_registry, tmp_path, monkeypatch):
+    monkeypatch.setenv("MIE_MODEL_REGISTRY_DIR", str(mie_multi_registry))
+    monkeypatch.setenv("MIE_MODEL_VERSION", "v0.1.0")
+    monkeypatch.setenv("MIE_ENVIRONMENT", "dev")
+    monkeypatch.setenv("MIE_MODEL_RELOAD_POLL_S", "0")
+    monkeypatch.setenv("MIE_AUDIT_DB_PATH", str(tmp_path / "audit.sqlite3"))
+    monkeypatch.setenv("MIE_AUDIT_JSONL_PATH", str(tmp_path / "audit.jsonl"))
+    from mie_credit_platform.api.main import create_app
+
+    with TestClient(create_app()) as client:
+        assert client.post("/v1/score", json=APPLICANT).json()["model_version"] == "v0.1.0"
+        assert client.post("/v1/score", json={**APPLICANT, "model_version": "v0.2.0"}).json()["model_version"] == "v0.2.0"
+        assert client.post("/v1/explain", json={**APPLICANT, "model_version": "v0.2.0"}).json()["model_version"] == "v0.2.0"
+        assert client.post("/v1/score", json={**APPLICANT, "model_version": "v9"}).status_code == 404
+        assert client.post("/v1/score", json={**APPLICANT, "model_version": "../x"}).status_code == 422
+
+        batch = client.post(
+            "/v1/score:batch",
+            json={"items": [APPLICANT, {**APPLICANT, "model_version": "v0.2.0"}, {**APPLICANT, "model_version": "v9"}]},
+        ).json()
+        assert [r["model_version"] for r in batch["results"]] == ["v0.1.0", "v0.2.0", "v9"]
+        assert batch["n_scored"] == 2 and batch["results"][2]["errors"][0]["type"] == "model_unavailable"
+
+        events = client.get("/v1/audit/events", params={"limit": 100}).json()["events"]
+        assert sorted(e["model_version"] for e in events) == ["v0.1.0", "v0.1.0", "v0.2.0", "v0.2.0", "v0.2.0"]
+        stats = client.get("/v1/admin/model/cache").json()
+        assert (stats["hits"], stats["misses"], stats["load_errors"]) == (2, 3, 2)
+        assert stats["versions"] == ["v0.2.0"]
+
+        # Without an active model only the items relying on it fail.
+        client.app.state.model_pkg = None
+        r = client.post("/v1/score:batch", json={"items": [{**APPLICANT, "model_version": "v0.2.0"}, APPLICANT]})
+        assert r.status_code == 200 and r.json()["model_version"] is None
+        assert r.json()["results"][0]["model_version"] == "v0.2.0"
+        assert r.json()["results"][1]["errors"][0]["msg"] == "Model not loaded"
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from mie_credit_platform.governance import manifest as manifest_mod
+from mie_credit_platform.governance.manifest import MANIFEST_FILE, RegistryManifest
+from mie_credit_platform.governance.registry import (
+    approve_model,
+    assert_model_ready,
+    is_approved,
+    list_models,
+)
+
+
+@pytest.fixture()
+def reads(monkeypatch):
+    counted: list[str] = []
+    real = manifest_mod._read_metadata
+
+    def counting(path):
+        counted.append(path.parent.name)
+        return real(path)
+
+    monkeypatch.setattr(manifest_mod, "_read_metadata", counting)
+    return counted
+
+
+def test_manifest_refreshes_incrementally_and_persists(mie_multi_registry, reads, monkeypatch):
+    registry = str(mie_multi_registry)
+    m = RegistryManifest(registry, max_age_s=0)
+    assert [e.version for e in m.entries()] == ["v0.1.0", "v0.2.0"]
+    assert sorted(reads) == ["v0.1.0", "v0.2.0"]
+    # Saving the manifest inside the registry does not force the next refresh to re-list versions.
+    assert (mie_multi_registry / MANIFEST_FILE).exists()
+    scans: list[object] = []
+    scandir = manifest_mod.os.scandir
+    monkeypatch.setattr(manifest_mod.os, "scandir", lambda p: scans.append(p) or scandir(p))
+    etag = m.etag
+
+    reads.clear()
+    assert m.refresh() is False and reads == [] and m.etag == etag and scans == []
+
+    md_path = mie_multi_registry / "v0.2.0" / "metadata.json"
+    md_path.write_text(json.dumps({"version": "v0.2.0", "note": "retrained"}), encoding="utf-8")
+    assert m.refresh() is True and reads == ["v0.2.0"] and m.etag != etag
+    assert m.entry("v0.2.0").metadata["note"] == "retrained"
+
+    (mie_multi_registry / "v0.1.0" / "model.joblib").unlink()
+    assert m.entry("v0.1.0").missing_artifacts == ("model.joblib",)
+
+    # A fresh process reuses the persisted manifest without re-reading metadata.
+    assert (mie_multi_registry / MANIFEST_FILE).exists()
+    reads.clear()
+    fresh = RegistryManifest(registry)
+    assert [e.metadata for e in fresh.entries()] == [e.metadata for e in m.entries()] and reads == []
+    assert fresh.etag == m.etag
+
+
+def test_registry_helpers_read_through_manifest(mie_multi_registry):
+    registry = str(mie_multi_registry)
+    assert [m.version for m in list_models(registry)] == ["v0.1.0", "v0.2.0"]
+    assert is_approved(registry, "v0.1.0") is False
+    approve_model(registry, "v0.1.0")
+    assert is_approved(registry, "v0.1.0") is True
+
+    (mie_multi_registry / "v0.2.0" / "feature_list.json").unlink()
+    with pytest.raises(FileNotFoundError, match="feature_list.json"):
+        assert_model_ready(registry, "v0.2.0")
+    with pytest.raises(FileNotFoundError, match="not found"):
+        assert_model_ready(registry, "v9")
+
+
+def test_models_endpoint_serves_etag(mie_client):
+    first = mie_client.get("/v1/models")
+    etag = first.headers["etag"]
+    assert first.json()["active_model_version"] == "v0.1.0"
+    again = mie_client.get("/v1/models", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.headers["etag"] == etag
+    assert mie_client.get("/v1/models", headers={"If-None-Match": '"stale"'}).status_code == 200
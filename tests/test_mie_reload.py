@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from mie_credit_platform.governance.registry import set_active_version
+from mie_credit_platform.governance.reloader import ModelReloader
+from mie_credit_platform.modeling.model_io import set_approved
+from mie_credit_platform.modeling.scoring import score_applicant
+
+
+def test_api_hot_swaps_active_version(mie_multi_registry, tmp_path, monkeypatch):
+    registry = mie_multi_registry
+    monkeypatch.setenv("MIE_MODEL_REGISTRY_DIR", str(registry))
+    monkeypatch.setenv("MIE_MODEL_VERSION", "v0.1.0")
+    monkeypatch.setenv("MIE_ENVIRONMENT", "dev")
+    monkeypatch.setenv("MIE_MODEL_RELOAD_POLL_S", "0")
+    monkeypatch.setenv("MIE_AUDIT_DB_PATH", str(tmp_path / "audit.sqlite3"))
+    monkeypatch.setenv("MIE_AUDIT_JSONL_PATH", str(tmp_path / "audit.jsonl"))
+    from mie_credit_platform.api.main import create_app
+
+    with TestClient(create_app()) as client:
+        old_pkg = client.app.state.model_pkg
+        assert old_pkg.version == "v0.1.0"
+        assert client.post("/v1/admin/model/reload").json()["reloaded"] is False
+
+        set_active_version(str(registry), "v0.2.0")
+        status = client.post("/v1/admin/model/reload").json()
+        assert status["reloaded"] is True and status["loaded_version"] == "v0.2.0"
+        assert client.get("/v1/models").json()["active_model_version"] == "v0.2.0"
+        assert client.app.state.model_pkg.version == "v0.2.0"
+        # A request holding the previous package keeps a fully usable model.
+        assert 0.0 <= score_applicant(old_pkg, {}, 0.6)[0].score <= 1.0
+
+        status = client.get("/v1/admin/model/reload").json()
+        assert status["reload_count"] == 2 and status["last_error"] is None
+
+
+def test_failed_load_keeps_current_and_revocation_unloads(mie_multi_registry):
+    registry = mie_multi_registry
+    served = []
+    reloader = ModelReloader(
+        str(registry), "v0.1.0", require_approval=True, on_swap=served.append, poll_interval_s=0
+    )
+    assert reloader.check() is False and reloader.package is None
+    set_approved(str(registry), "v0.1.0", True)
+    assert reloader.check() is True and served[-1].version == "v0.1.0"
+
+    (registry / "v0.2.0" / "model.linear.npz").write_bytes(b"not a model")
+    set_approved(str(registry), "v0.2.0", True)
+    set_active_version(str(registry), "v0.2.0")
+    assert reloader.check() is False
+    assert reloader.package.version == "v0.1.0" and reloader.status().last_error
+
+    set_active_version(str(registry), "v0.1.0")
+    set_approved(str(registry), "v0.1.0", False)
+    assert reloader.check() is False
+    assert reloader.package is None and served[-1] is None
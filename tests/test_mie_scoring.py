@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import copy
+import json
+import shutil
+import subprocess
+import sys
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from mie_credit_platform.modeling import model_io
+from mie_credit_platform.modeling.kernel import (
+    CompactLinearModel,
+    compile_linear_kernel,
+    verify_linear_kernel,
+)
+from mie_credit_platform.modeling.model_io import (
+    ModelPackage,
+    load_model_package,
+    save_model_package,
+)
+from mie_credit_platform.modeling.scoring import score_applicant, score_applicants_batch
+from mie_credit_platform.modeling.synthetic_data import SyntheticDataConfig, make_synthetic_alt_data
+
+APPLICANT = {
+    "rent_on_time_ratio_12m": 0.95,
+    "utilities_on_time_ratio_12m": 0.9,
+    "cashflow_volatility_90d": 0.4,
+    "income_stability_6m": 0.8,
+    "avg_monthly_net_inflow_6m": 3200.0,
+    "avg_daily_balance_90d": 900.0,
+    "overdraft_count_12m": 1,
+    "months_at_address": 24,
+}
+
+
+def _variants(n: int) -> list[dict[str, float]]:
+    return [
+        {**APPLICANT, "avg_daily_balance_90d": 100.0 * i, "overdraft_count_12m": i % 4} for i in range(n)
+    ]
+
+
+def test_batch_matches_single_row_scoring(mie_pkg):
+    rows = _variants(25)
+    batch = score_applicants_batch(mie_pkg, rows, 0.6)
+    assert len(batch) == len(rows)
+    for features, (res, explanation) in zip(rows, batch, strict=True):
+        single, single_expl = score_applicant(mie_pkg, features, 0.6)
+        assert res.score == pytest.approx(single.score, abs=1e-12)
+        assert res.decision == single.decision
+        assert res.reason_codes == single.reason_codes
+        assert explanation["score_from_explanation"] == pytest.approx(
+            single_expl["score_from_explanation"], abs=1e-12
+        )
+    assert score_applicants_batch(mie_pkg, [], 0.6) == []
+
+
+def test_score_batch_endpoint_reports_row_errors(mie_client):
+    items = [
+        {"applicant_id": "a1", "features": APPLICANT},
+        {"applicant_id": "a2", "features": {**APPLICANT, "rent_on_time_ratio_12m": 7}},
+        "not-an-object",
+        {"applicant_id": "a4", "features": APPLICANT},
+    ]
+    r = mie_client.post("/v1/score:batch", json={"items": items}, headers={"X-Request-Id": "batch-1"})
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["n_scored"] == 2
+    assert body["n_failed"] == 2
+    assert [item["index"] for item in body["results"]] == [0, 1, 2, 3]
+    assert body["results"][1]["applicant_id"] == "a2"
+    assert body["results"][1]["errors"][0]["loc"] == ["features", "rent_on_time_ratio_12m"]
+    assert body["results"][2]["errors"]
+    assert body["results"][3]["decision"] in {"APPROVE", "REVIEW"}
+
+    events = mie_client.get("/v1/audit/events", params={"request_id": "batch-1"}).json()
+    assert events["total"] == 2
+
+
+def test_linear_kernel_matches_sklearn_pipeline(mie_pkg):
+    assert mie_pkg.kernel is not None
+    df = make_synthetic_alt_data(SyntheticDataConfig(n=500, seed=11))
+    x = df[mie_pkg.feature_names].to_numpy(dtype=float)
+    assert verify_linear_kernel(mie_pkg.kernel, mie_pkg.model, x) <= 1e-9
+
+    # Contributions keep the original coef * standardized-value definition.
+    scaler = mie_pkg.model.named_steps["scaler"]
+    coef = mie_pkg.model.named_steps["clf"].coef_[0]
+    out = mie_pkg.kernel.evaluate(x)
+    np.testing.assert_allclose(out.contributions, coef * (x - scaler.mean_) / scaler.scale_, atol=1e-9)
+    assert out.scores.shape == (len(x),)
+
+    # Packages without a compiled kernel fall back to predict_proba with identical results.
+    plain = ModelPackage(
+        version=mie_pkg.version, model=mie_pkg.model, feature_names=mie_pkg.feature_names, metadata={}
+    )
+    res_kernel, expl_kernel = score_applicant(mie_pkg, APPLICANT, 0.6)
+    res_plain, expl_plain = score_applicant(plain, APPLICANT, 0.6)
+    assert res_kernel.score == pytest.approx(res_plain.score, abs=1e-12)
+    assert res_kernel.reason_codes == res_plain.reason_codes == expl_plain["reason_codes"]
+    assert expl_kernel["score_from_explanation"] == pytest.approx(res_plain.score, abs=1e-12)
+
+
+def test_linear_kernel_skips_non_linear_models():
+    class Opaque:
+        def predict_proba(self, x):
+            return np.tile([0.5, 0.5], (len(x), 1))
+
+    assert compile_linear_kernel(Opaque(), ["a", "b"]) is None
+    pkg = ModelPackage(version="x", model=Opaque(), feature_names=["a", "b"], metadata={})
+    res, explanation = score_applicant(pkg, {"a": 1.0, "b": 2.0}, 0.6)
+    assert res.score == 0.5 and res.reason_codes == [] and explanation == {}
+
+
+def test_compact_artifact_matches_pipeline_without_sklearn(mie_registry, mie_pkg):
+    compact = load_model_package(str(mie_registry), "v0.1.0")
+    assert isinstance(compact.model, CompactLinearModel)
+    rows = [{**APPLICANT, "overdraft_count_12m": i % 5, "months_at_address": 3 * i} for i in range(50)]
+    for (a, ea), (b, eb) in zip(
+        score_applicants_batch(compact, rows, 0.6), score_applicants_batch(mie_pkg, rows, 0.6), strict=True
+    ):
+        assert a.decision == b.decision and a.reason_codes == b.reason_codes
+        assert abs(a.score - b.score) <= 1e-12 and ea["contributions"] == eb["contributions"]
+
+    code = (
+        "import sys; from mie_credit_platform.modeling.model_io import load_model_package; "
+        f"pkg = load_model_package({str(mie_registry)!r}, 'v0.1.0'); "
+        "assert pkg.kernel is not None; print(sorted(m for m in sys.modules if m.split('.')[0] in {'sklearn', 'joblib'}))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_compact_artifact_never_outlives_its_model(mie_registry, mie_pkg, tmp_path, monkeypatch):
+    d = tmp_path / "v0.1.0"
+    shutil.copytree(mie_registry / "v0.1.0", d)
+    old_artifact = (d / "model.linear.npz").read_bytes()
+    retrained = copy.deepcopy(mie_pkg.model)
+    retrained[-1].coef_ = retrained[-1].coef_ * 2
+
+    # Re-saving the version without a compact form removes the old one.
+    save_model_package(replace(mie_pkg, model=retrained), str(tmp_path), compact=False)
+    assert not (d / "model.linear.npz").exists()
+    # An artifact built from another model.joblib is ignored in favour of the pickle.
+    (d / "model.linear.npz").write_bytes(old_artifact)
+    pkg = load_model_package(str(tmp_path), "v0.1.0")
+    assert not isinstance(pkg.model, CompactLinearModel)
+    assert pkg.model[-1].coef_.tolist() == retrained[-1].coef_.tolist()
+
+    save_model_package(replace(mie_pkg, model=retrained), str(tmp_path))
+    # Loading only stats model.joblib; its digest is computed when the artifact is built.
+    monkeypatch.setattr(model_io, "file_sha256", lambda path: pytest.fail("model.joblib was hashed on load"))
+    pkg = load_model_package(str(tmp_path), "v0.1.0")
+    assert isinstance(pkg.model, CompactLinearModel)
+    assert score_applicant(pkg, APPLICANT, 0.6)[0].score != score_applicant(mie_pkg, APPLICANT, 0.6)[0].score
+
+
+def test_compact_artifact_rejects_feature_mismatch(mie_registry, tmp_path):
+    d = tmp_path / "v0.1.0"
+    shutil.copytree(mie_registry / "v0.1.0", d)
+    (d / "feature_list.json").write_text(json.dumps(["a", "b"]), encoding="utf-8")
+    with pytest.raises(ValueError, match="do not match"):
+        load_model_package(str(tmp_path), "v0.1.0")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+from mie_credit_platform import serialization
+from mie_credit_platform.audit import AuditEvent, AuditLogger, encode_jsonl_line
+from mie_credit_platform.telemetry import JsonFormatter
+
+BACKENDS = [
+    "json",
+    pytest.param(
+        "orjson",
+        marks=pytest.mark.skipif(serialization.ORJSON_BACKEND is None, reason="orjson not installed"),
+    ),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = serialization.get_backend().name
+    yield serialization.set_backend(request.param)
+    serialization.set_backend(previous)
+
+
+EVENT = AuditEvent(
+    ts=1_700_000_000.25,
+    request_id="req-1",
+    event_type="score",
+    model_version=None,
+    applicant_id="ápplicant",
+    payload={"score": np.float64(0.5), "codes": ["A", "B"], 3: "int key", "obj": "object"},
+)
+
+
+def test_backends_agree_on_supported_types(backend):
+    obj = {"a": 1, "b": [1.5, None, True], "c": np.arange(3), "d": np.int64(7), 4: "x", "e": EVENT, "f": set}
+    decoded = serialization.loads(serialization.dumps(obj))
+    assert decoded["a"] == 1 and decoded["b"] == [1.5, None, True]
+    assert decoded["c"] == [0, 1, 2] and decoded["d"] == 7 and decoded["4"] == "x"
+    assert decoded["e"]["payload"]["score"] == 0.5 and decoded["f"] == "<class 'set'>"
+    assert serialization.dumps_str({"k": "ü"}) == '{"k":"ü"}'
+
+
+def test_jsonl_line_matches_asdict_layout(backend):
+    payload_json = serialization.dumps_str(EVENT.payload)
+    line = encode_jsonl_line(EVENT, payload_json)
+    expected = json.loads(json.dumps(asdict(EVENT), default=str))
+    assert json.loads(line) == expected
+    assert list(json.loads(line)) == list(expected)
+
+
+def test_audit_round_trip_and_mirror(backend, tmp_path):
+    audit = AuditLogger(str(tmp_path / "a.sqlite3"), str(tmp_path / "a.jsonl"), jsonl_max_bytes=None)
+    audit.write_many([EVENT, AuditEvent(**{**asdict(EVENT), "request_id": "req-2", "payload": {}})])
+    stored = audit.query(limit=10)
+    assert [e.request_id for e in stored] == ["req-2", "req-1"]
+    assert stored[1].payload == {"score": 0.5, "codes": ["A", "B"], "3": "int key", "obj": "object"}
+
+    lines = (tmp_path / "a.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["payload"] for line in lines] == [stored[1].payload, {}]
+
+    n = audit.export_jsonl(str(tmp_path / "out.jsonl"))
+    exported = [json.loads(line) for line in (tmp_path / "out.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert n == 2 and exported[1] == asdict(stored[1])
+    audit.close()
+
+
+def test_json_formatter_uses_serializer(backend):
+    record = logging.LogRecord("mie", logging.INFO, __file__, 1, "hello", None, None)
+    record.score = np.float32(0.25)
+    out = json.loads(JsonFormatter().format(record))
+    assert out["msg"] == "hello" and out["score"] == 0.25
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        serialization.resolve_backend("ujson")
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+from fastapi.testclient import TestClient
+from test_mie_scoring import APPLICANT as FEATURES
+
+from mie_credit_platform.shadow import SHADOW_EVENT_TYPE, ShadowStats
+
+
+def test_shadow_stats_flips_and_histogram():
+    stats = ShadowStats()
+    stats.add(["APPROVE", "APPROVE", "REVIEW"], ["APPROVE", "REVIEW", "APPROVE"], np.array([0.0, -0.12, 0.3]))
+    stats.add(["REVIEW"], ["REVIEW"], np.array([1.0]))
+    summary = stats.summary()
+    assert summary["n_compared"] == 4 and summary["agreement_rate"] == 0.5
+    assert summary["flips"] == {"APPROVE->REVIEW": 1, "REVIEW->APPROVE": 1}
+    hist = summary["score_delta"]["histogram"]
+    assert sum(hist["counts"]) == 4 and hist["counts"][-1] == 1 and hist["counts"][hist["edges"].index(-0.15)] == 1
+    assert summary["score_delta"]["max_abs"] == 1.0
+
+
+def test_shadow_scores_off_request_path_and_audits(mie_multi_registry, tmp_path, monkeypatch):
+    monkeypatch.setenv("MIE_MODEL_REGISTRY_DIR", str(mie_multi_registry))
+    monkeypatch.setenv("MIE_MODEL_VERSION", "v0.1.0")
+    monkeypatch.setenv("MIE_ENVIRONMENT", "dev")
+    monkeypatch.setenv("MIE_MODEL_RELOAD_POLL_S", "0")
+    monkeypatch.setenv("MIE_SHADOW_MODEL_VERSION", "v0.2.0")
+    monkeypatch.setenv("MIE_AUDIT_DB_PATH", str(tmp_path / "audit.sqlite3"))
+    monkeypatch.setenv("MIE_AUDIT_JSONL_PATH", str(tmp_path / "audit.jsonl"))
+    from mie_credit_platform.api.main import create_app
+
+    with TestClient(create_app()) as client:
+        for i in range(3):
+            assert client.post("/v1/score", json={"applicant_id": f"a{i}", "features": FEATURES}).status_code == 200
+        items = [{"applicant_id": f"b{i}", "features": FEATURES} for i in range(4)]
+        assert client.post("/v1/score:batch", json={"items": items}).status_code == 200
+        client.app.state.shadow.flush()
+
+        summary = client.get("/v1/shadow/summary").json()
+        assert summary["challenger_version"] == "v0.2.0"
+        assert summary["n_compared"] == 7 and summary["agreement_rate"] == 1.0 and summary["flips"] == {}
+
+        events = client.get("/v1/audit/events", params={"event_type": SHADOW_EVENT_TYPE, "limit": 100}).json()
+        assert len(events["events"]) == 7
+        payload = events["events"][0]["payload"]
+        assert events["events"][0]["model_version"] == "v0.2.0" and payload["champion_version"] == "v0.1.0"
+        assert payload["score_delta"] == 0.0 and payload["decision_flip"] is False
+
+
+def test_shadow_summary_404_when_disabled(mie_client):
+    assert mie_client.get("/v1/shadow/summary").status_code == 404